@@ -17,8 +17,9 @@ from controller.notification_controller import NotificationController, notificat
 from controller.time_entry_controller import TimeEntryController, time_entry_blueprint
 from controller.timesheet_controller import TimesheetController, timesheet_blueprint
 from controller.user_controller import UserController, user_blueprint
-from db import initialize_db
-from service.notification_service import NotificationService
+from db import get_pool_stats, initialize_db
+from model.repository.user_identity_map import UserIdentityMap
+from service.service_container import ServiceContainer
 from apscheduler.schedulers.background import BackgroundScheduler
 import logging
 from service.setup_service import SetupService
@@ -29,6 +30,7 @@ CORS(app)  # enable CORS for all routes and origins
 db = initialize_db()
 
 
+service_container = ServiceContainer.get_instance()
 setup_service = SetupService()
 setup_service.run_setup()
 
@@ -40,7 +42,7 @@ jwt = JWTManager(app)
 init_auth_routes(app)
 
 # Registering the user routes
-user_view = UserController.as_view('user')
+user_view = UserController.as_view('user', service_container)
 user_blueprint.add_url_rule('/createUser', view_func=user_view, endpoint='create_user')
 user_blueprint.add_url_rule('/login', view_func=user_view, methods=['POST'], endpoint='login')
 user_blueprint.add_url_rule('/logout', view_func=user_view, methods=['POST'], endpoint='logout')
@@ -63,7 +65,7 @@ user_blueprint.add_url_rule('/getSupervisor', view_func=user_view, methods=['GET
 user_blueprint.add_url_rule('/getSupervisors', view_func=user_view, methods=['GET'], endpoint='get_supervisors')
 app.register_blueprint(user_blueprint, url_prefix='/user')
 
-notification_view = NotificationController.as_view('notification')
+notification_view = NotificationController.as_view('notification', service_container)
 notification_blueprint.add_url_rule('/delete', view_func=notification_view, methods=['DELETE'],
                                     endpoint='delete_notification')
 notification_blueprint.add_url_rule('/readAll', view_func=notification_view, methods=['GET'],
@@ -72,18 +74,21 @@ notification_blueprint.add_url_rule('/doesUnreadMessageExist', view_func=notific
                                     endpoint='does_unread_messages_exist')
 app.register_blueprint(notification_blueprint, url_prefix='/notification')
 
-time_entry_view = TimeEntryController.as_view('time_entry')
+time_entry_view = TimeEntryController.as_view('time_entry', service_container)
 time_entry_blueprint.add_url_rule('/createWorkEntry', view_func=time_entry_view, methods=['POST'])
 time_entry_blueprint.add_url_rule('/createVacationEntry', view_func=time_entry_view, methods=['POST'])
 time_entry_blueprint.add_url_rule('/updateTimeEntry', view_func=time_entry_view, methods=['POST'])
 time_entry_blueprint.add_url_rule('/deleteTimeEntry', view_func=time_entry_view, methods=['POST'])
+time_entry_blueprint.add_url_rule('/importTimeEntries', view_func=time_entry_view, methods=['POST'])
 time_entry_blueprint.add_url_rule('/getEntriesByTimesheetId', view_func=time_entry_view, methods=['GET'])
 
 app.register_blueprint(time_entry_blueprint, url_prefix='/timeEntry')
 
-timesheet_view = TimesheetController.as_view('timesheet')
+timesheet_view = TimesheetController.as_view('timesheet', service_container)
 timesheet_blueprint.add_url_rule('/sign', view_func=timesheet_view, methods=['PATCH'], endpoint='sign_timesheet')
 timesheet_blueprint.add_url_rule('/approve', view_func=timesheet_view, methods=['PATCH'], endpoint='approve_timesheet')
+timesheet_blueprint.add_url_rule('/approveBatch', view_func=timesheet_view, methods=['PATCH'],
+                                 endpoint='approve_timesheets')
 timesheet_blueprint.add_url_rule('/requestChange', view_func=timesheet_view, methods=['PATCH'],
                                  endpoint='request_change')
 timesheet_blueprint.add_url_rule('/get', view_func=timesheet_view, methods=['GET'], endpoint='get_timesheets')
@@ -103,16 +108,45 @@ timesheet_blueprint.add_url_rule('/getByMonthYear', view_func=timesheet_view, me
 
 app.register_blueprint(timesheet_blueprint, url_prefix='/timesheet')
 
-document_view = DocumentController.as_view('document')
+document_view = DocumentController.as_view('document', service_container)
 document_blueprint.add_url_rule('/generateDocument', view_func=document_view, methods=['GET'])
 document_blueprint.add_url_rule('/generateMultipleDocuments', view_func=document_view, methods=['GET'])
+document_blueprint.add_url_rule('/prerenderStatus', view_func=document_view, methods=['GET'])
+document_blueprint.add_url_rule('/exportJobs', view_func=document_view, methods=['POST'])
+document_blueprint.add_url_rule('/exportJobStatus', view_func=document_view, methods=['GET'])
+document_blueprint.add_url_rule('/exportJobDownload', view_func=document_view, methods=['GET'])
+document_blueprint.add_url_rule('/tabularExport', view_func=document_view, methods=['GET'])
 app.register_blueprint(document_blueprint, url_prefix='/document')
 
 scheduler = BackgroundScheduler()
-notification_service = NotificationService()
-scheduler.add_job(func=notification_service.send_scheduled_reminders, trigger="interval", days=1)
+scheduler.add_job(func=service_container.notification_service.send_scheduled_reminders, trigger="interval", days=1)
+# Verify the incrementally maintained timesheet totals against a full recomputation
+scheduler.add_job(func=service_container.timesheet_service.reconcile_total_and_vacation_time, trigger="interval",
+                  days=1)
+# Remove finished export jobs and their zip files once they expired
+scheduler.add_job(func=service_container.export_job_service.expire_export_jobs, trigger="interval", minutes=10)
 scheduler.start()
 
+@app.teardown_request
+def log_saved_user_reads(exception=None):
+    """
+    Logs the number of user reads answered from the request-scoped identity map in debug mode.
+    """
+    saved_reads = UserIdentityMap.get_saved_reads()
+    if app.debug and saved_reads > 0:
+        app.logger.debug(f"{request.path}: {saved_reads} user reads saved by the identity map "
+                         f"({UserIdentityMap.total_saved_reads} in total)")
+
+
+@app.teardown_request
+def log_pool_stats(exception=None):
+    """
+    Logs the usage of the database connection pool of the worker process in debug mode.
+    """
+    if app.debug:
+        app.logger.debug(f"{request.path}: connection pool {get_pool_stats()}")
+
+
 @app.route('/')
 def home():
     return "Clockwise 1.0, Developed by Dominik, Phil, Johann, Alina and José"
@@ -10,11 +10,6 @@ from datetime import datetime, timezone, timedelta
 import bcrypt
 from flask_jwt_extended import create_access_token, get_jwt, get_jwt_identity
 
-from db import initialize_db
-from model.repository.user_repository import UserRepository
-
-db = initialize_db()
-user_repo = UserRepository.get_instance()
 
 def init_auth_routes(app):
     """
@@ -37,7 +32,10 @@ def init_auth_routes(app):
             now = datetime.now(timezone.utc)
             target_timestamp = datetime.timestamp(now + timedelta(minutes=30))
             if target_timestamp > exp_timestamp:
-                access_token = create_access_token(identity=get_jwt_identity())
+                # Keep the role and access version claims used by check_access
+                claims = get_jwt()
+                additional_claims = {key: claims[key] for key in ("role", "accessVersion") if key in claims}
+                access_token = create_access_token(identity=get_jwt_identity(), additional_claims=additional_claims)
                 data = response.get_json()
                 if type(data) is dict:
                     data["accessToken"] = access_token
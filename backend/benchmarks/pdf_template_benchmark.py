@@ -0,0 +1,69 @@
+"""
+Measures the time to render a single timesheet document.
+
+Before the template engine was introduced every document re-read and re-parsed the fillable template with
+fillpdf, wrote the filled form and parsed it again to place the signatures. Now the template is parsed once per
+process and every document is filled and stamped on an in-memory copy.
+Run from the backend directory with: python -m benchmarks.pdf_template_benchmark
+"""
+import timeit
+from datetime import datetime
+from io import BytesIO
+
+import fitz
+from fillpdf import fillpdfs
+from PIL import Image
+
+from model.document_data import DocumentData
+from model.user.contract_information import ContractInfo
+from model.user.personal_information import PersonalInfo
+from service.document.pdf_generator_strategy import PDFGeneratorStrategy
+
+DOCUMENTS = 20
+
+
+def create_render_job(pdf_generator_strategy):
+    """
+    Creates the render job of a document without time entries.
+    """
+    signature = BytesIO()
+    Image.new('RGB', (300, 30), 'white').save(signature, 'PNG')
+    signature.seek(0)
+    supervisor_signature = BytesIO(signature.getvalue())
+    document_data = DocumentData(5, 2024, PersonalInfo("Test", "Hiwi", "test@gmail.com", "1234567890", "Institute"),
+                                 ContractInfo(15, 40, 0), "00:00", signature, supervisor_signature, "00:00", [],
+                                 "00:00", datetime(2024, 5, 28))
+    return pdf_generator_strategy.create_render_job(document_data)
+
+
+def render_with_fillpdf(pdf_generator_strategy, render_job):
+    """
+    Renders the document by parsing the template with fillpdf, as it was done for every document before.
+    """
+    unsigned_pdf = BytesIO()
+    fillpdfs.write_fillable_pdf(pdf_generator_strategy.TEMPLATE_PATH, unsigned_pdf, render_job["formData"])
+    document = fitz.open(stream=unsigned_pdf.getvalue(), filetype="pdf")
+    pdf_generator_strategy._place_signature(document, render_job["signature"], True)
+    pdf_generator_strategy._place_signature(document, render_job["supervisorSignature"], False)
+    rendered_document = document.tobytes(no_new_id=True)
+    document.close()
+    return rendered_document
+
+
+def main():
+    fitz.TOOLS.mupdf_display_errors(False)
+    pdf_generator_strategy = PDFGeneratorStrategy()
+    render_job = create_render_job(pdf_generator_strategy)
+    pdf_generator_strategy.render(render_job)  # Load the template into the engine
+    before = timeit.timeit(lambda: render_with_fillpdf(pdf_generator_strategy, render_job), number=DOCUMENTS)
+    after = timeit.timeit(lambda: pdf_generator_strategy.render(render_job), number=DOCUMENTS)
+    before_ms = before / DOCUMENTS * 1e3
+    after_ms = after / DOCUMENTS * 1e3
+    print(f"{'renderer':<24}{'per document (ms)':>20}")
+    print(f"{'fillpdf (before)':<24}{before_ms:>20.1f}")
+    print(f"{'template engine':<24}{after_ms:>20.1f}")
+    print(f"{'speedup':<24}{before_ms / after_ms:>19.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Measures the per-request overhead of constructing the controllers.
+
+Before the service container was introduced every request built its controller together with a fresh
+service object graph. Now the controllers receive the services of the application-scoped container.
+Run from the backend directory with: python -m benchmarks.service_container_benchmark
+"""
+import timeit
+
+from controller.document_controller import DocumentController
+from controller.notification_controller import NotificationController
+from controller.time_entry_controller import TimeEntryController
+from controller.timesheet_controller import TimesheetController
+from controller.user_controller import UserController
+from service.service_container import ServiceContainer
+
+CONTROLLERS = [UserController, NotificationController, TimeEntryController, TimesheetController, DocumentController]
+REQUESTS = 200
+
+
+def construct_with_fresh_services(controller_class):
+    """
+    Builds the controller with a new service graph, as it was done on every request before.
+    """
+    return controller_class(ServiceContainer())
+
+
+def construct_with_shared_services(controller_class):
+    """
+    Builds the controller from the application-scoped container.
+    """
+    return controller_class(ServiceContainer.get_instance())
+
+
+def main():
+    print(f"{'controller':<24}{'fresh graph (us)':>20}{'container (us)':>20}{'speedup':>10}")
+    for controller_class in CONTROLLERS:
+        construct_with_shared_services(controller_class)  # Warm up the shared container
+        fresh = timeit.timeit(lambda: construct_with_fresh_services(controller_class), number=REQUESTS)
+        shared = timeit.timeit(lambda: construct_with_shared_services(controller_class), number=REQUESTS)
+        fresh_us = fresh / REQUESTS * 1e6
+        shared_us = shared / REQUESTS * 1e6
+        print(f"{controller_class.__name__:<24}{fresh_us:>20.1f}{shared_us:>20.1f}{fresh_us / shared_us:>9.0f}x")
+
+
+if __name__ == '__main__':
+    main()
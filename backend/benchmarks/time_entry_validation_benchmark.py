@@ -0,0 +1,54 @@
+"""
+Measures the validation of many time entries, e.g. when a month is revalidated or entries are imported.
+
+validate_entry runs every strategy once per entry, validate_entries packs the entries into arrays once and
+evaluates the rules of the strategies for all entries with vectorized operations.
+Run from the backend directory with: python -m benchmarks.time_entry_validation_benchmark
+"""
+import datetime
+import random
+import timeit
+
+from model.time_entry_validator.break_length_strategy import BreakLengthStrategy
+from model.time_entry_validator.holiday_strategy import HolidayStrategy
+from model.time_entry_validator.time_entry_validator import TimeEntryValidator
+from model.time_entry_validator.weekend_strategy import WeekendStrategy
+from model.time_entry_validator.working_time_strategy import WorkingTimeStrategy
+from model.work_entry import WorkEntry
+
+BATCH_SIZES = [20, 100, 1000, 10000]
+REPETITIONS = 5
+
+
+def create_entries(count: int):
+    """
+    Creates work entries on random days and times of two years.
+    """
+    random_generator = random.Random(0)
+    entries = []
+    for _ in range(count):
+        start_time = datetime.datetime(2023, 1, 1) + datetime.timedelta(days=random_generator.randrange(730),
+                                                                         minutes=random_generator.randrange(5 * 60,
+                                                                                                            12 * 60))
+        end_time = start_time + datetime.timedelta(minutes=random_generator.randrange(60, 10 * 60))
+        entries.append(WorkEntry("timesheetId", start_time, end_time, random_generator.choice([0, 30, 45]),
+                                 "activity", "project"))
+    return entries
+
+
+def main():
+    validator = TimeEntryValidator()
+    for strategy in [WorkingTimeStrategy(), BreakLengthStrategy(), HolidayStrategy(), WeekendStrategy()]:
+        validator.add_validation_rule(strategy)
+    print(f"{'entries':>8}{'per entry (ms)':>18}{'batch (ms)':>14}{'speedup':>10}")
+    for batch_size in BATCH_SIZES:
+        entries = create_entries(batch_size)
+        validator.validate_entries(entries)  # Warm up the holiday calendar
+        scalar = timeit.timeit(lambda: [validator.validate_entry(entry) for entry in entries],
+                               number=REPETITIONS) / REPETITIONS
+        vectorized = timeit.timeit(lambda: validator.validate_entries(entries), number=REPETITIONS) / REPETITIONS
+        print(f"{batch_size:>8}{scalar * 1e3:>18.2f}{vectorized * 1e3:>14.2f}{scalar / vectorized:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,10 @@
-import os
-import tempfile
 from datetime import datetime
 
-from flask import request, jsonify, Blueprint, send_file, after_this_request, Response
+from flask import request, jsonify, Blueprint, send_file, Response
 from flask.views import MethodView
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
-from service.document.document_service import DocumentService
-from service.user_service import UserService
+from service.service_container import ServiceContainer
 
 document_blueprint = Blueprint('document', __name__)
 
@@ -18,13 +15,17 @@ class DocumentController(MethodView):
 
     """
 
-    def __init__(self):
+    def __init__(self, service_container: ServiceContainer = None):
         """
         Initializes the DocumentController instance
 
+        :param service_container: The container providing the shared services. Defaults to the application container.
         """
-        self.document_service = DocumentService()
-        self.user_service = UserService()
+        service_container = service_container or ServiceContainer.get_instance()
+        self.document_service = service_container.document_service
+        self.export_job_service = service_container.export_job_service
+        self.table_export_service = service_container.table_export_service
+        self.user_service = service_container.user_service
 
 
     def get(self):
@@ -34,7 +35,21 @@ class DocumentController(MethodView):
         """
         endpoint_mapping = {
             '/generateDocument': self.generate_document,
-            '/generateMultipleDocuments': self.generate_multiple_documents
+            '/generateMultipleDocuments': self.generate_multiple_documents,
+            '/prerenderStatus': self.get_prerender_status,
+            '/exportJobStatus': self.get_export_job,
+            '/exportJobDownload': self.download_export_job,
+            '/tabularExport': self.export_table
+        }
+        return self._dispatch_request(endpoint_mapping)
+
+    def post(self):
+        """
+        Handles POST requests for creating export jobs
+
+        """
+        endpoint_mapping = {
+            '/exportJobs': self.create_export_job
         }
         return self._dispatch_request(endpoint_mapping)
 
@@ -60,22 +75,11 @@ class DocumentController(MethodView):
         result = self.document_service.generate_document(month, year, username, get_jwt_identity())
         if result.status_code != 200:
             return jsonify(result.message), result.status_code
-        file_path = result.data
-        if not file_path: # pragma: no cover
+        document = result.data
+        if not document: # pragma: no cover
             return jsonify('Failed to generate document'), 500
-        if os.path.isfile(file_path): # pragma: no cover
-            with open(file_path, 'rb') as file:
-                file_content = file.read()
-            # Step 2 & 3: Create a response object and set headers for download
-            response = Response(file_content)
-            response.headers['Content-Type'] = 'application/pdf'
-            response.headers['Content-Disposition'] = f'attachment; filename={os.path.basename(file_path)}'
-            # Step 4: Delete the file
-            os.remove(file_path)
-
-            # Step 5: Return the response object
-            return response
-        return jsonify('Failed to generate document'), 500
+        return send_file(document, mimetype='application/pdf', as_attachment=True, download_name=document.name)
+
     @jwt_required()
     def generate_multiple_documents(self):
         """
@@ -112,7 +116,120 @@ class DocumentController(MethodView):
 
         if result.status_code != 200:
             return jsonify(result.message), result.status_code
-        return send_file(result.data, as_attachment=True, download_name='documents.zip')
+        # The zip file is sent entry by entry while the remaining documents are rendered
+        return Response(result.data, mimetype='application/zip',
+                        headers={'Content-Disposition': 'attachment; filename=documents.zip'})
+
+    @jwt_required()
+    def get_prerender_status(self):
+        """
+        Retrieves the status of the background rendering of an approved timesheet's document
+
+        """
+        timesheet_id = request.args.get('timesheetId')
+        if not timesheet_id:
+            return jsonify('No timesheet ID provided'), 400
+        result = self.document_service.get_prerender_status(timesheet_id, get_jwt_identity())
+        if not result.is_successful:
+            return jsonify(result.message), result.status_code
+        return jsonify(result.data), result.status_code
+
+    @jwt_required()
+    def create_export_job(self):
+        """
+        Creates a background job exporting the documents of several users for a month, of several timesheets,
+        or of a user in a date range
+
+        """
+        if not request.is_json:
+            return jsonify('Request data must be in JSON format'), 400
+        request_data = request.get_json()
+        if not isinstance(request_data, dict):
+            return jsonify('Request data must be a JSON object'), 400
+        usernames = request_data.get('usernames') or []
+        for username in usernames:
+            if self.user_service.is_archived(username):
+                return jsonify('A user is archived'), 400
+        start_date_str = request_data.get('startDate')
+        end_date_str = request_data.get('endDate')
+        try:
+            month = int(request_data['month']) if request_data.get('month') is not None else None
+            year = int(request_data['year']) if request_data.get('year') is not None else None
+            start_date = datetime.strptime(start_date_str, '%d-%m-%y') if start_date_str else None
+            end_date = datetime.strptime(end_date_str, '%d-%m-%y') if end_date_str else None
+        except ValueError:
+            return jsonify('Invalid month, year or date format'), 400
+        result = self.export_job_service.create_export_job(get_jwt_identity(),
+                                                           usernames=usernames,
+                                                           month=month,
+                                                           year=year,
+                                                           timesheet_ids=request_data.get('timesheetIds'),
+                                                           start_date=start_date,
+                                                           end_date=end_date,
+                                                           username=request_data.get('username'))
+        if not result.is_successful:
+            return jsonify(result.message), result.status_code
+        return jsonify(result.data), result.status_code
+
+    @jwt_required()
+    def get_export_job(self):
+        """
+        Retrieves the progress of an export job
+
+        """
+        job_id = request.args.get('jobId')
+        if not job_id:
+            return jsonify('No job ID provided'), 400
+        result = self.export_job_service.get_export_job(job_id, get_jwt_identity())
+        if not result.is_successful:
+            return jsonify(result.message), result.status_code
+        return jsonify(result.data), result.status_code
+
+    @jwt_required()
+    def download_export_job(self):
+        """
+        Downloads the zip file of a finished export job
+
+        """
+        job_id = request.args.get('jobId')
+        if not job_id:
+            return jsonify('No job ID provided'), 400
+        result = self.export_job_service.get_export_file(job_id, get_jwt_identity())
+        if not result.is_successful:
+            return jsonify(result.message), result.status_code
+        return send_file(result.data, mimetype='application/zip', as_attachment=True,
+                         download_name='documents.zip')
+
+    @jwt_required()
+    def export_table(self):
+        """
+        Streams the timesheets of a date range as CSV or XLSX table, with one row per timesheet or per time entry
+
+        """
+        request_data = request.args
+        start_date_str = request_data.get('startDate')
+        end_date_str = request_data.get('endDate')
+        if not start_date_str or not end_date_str:
+            return jsonify('Missing required fields'), 400
+        usernames = request_data.getlist('usernames')
+        for username in usernames:
+            if self.user_service.is_archived(username):
+                return jsonify('A user is archived'), 400
+        try:
+            start_date = datetime.strptime(start_date_str, '%d-%m-%y')
+            end_date = datetime.strptime(end_date_str, '%d-%m-%y')
+        except ValueError:
+            return jsonify('Invalid date format'), 400
+        file_format = request_data.get('format', 'csv')
+        result = self.table_export_service.export_table(get_jwt_identity(), start_date, end_date, usernames,
+                                                        request_data.get('rows', 'timesheets'), file_format)
+        if not result.is_successful:
+            return jsonify(result.message), result.status_code
+        mimetype = 'text/csv' if file_format == 'csv' else \
+            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        # The table is sent while the rows are read from the database
+        return Response(result.data, mimetype=mimetype,
+                        headers={'Content-Disposition': f'attachment; filename=timesheets.{file_format}'})
 
     def _dispatch_request(self, endpoint_mapping):
         """
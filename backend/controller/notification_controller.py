@@ -2,15 +2,16 @@ from flask import request, jsonify, Blueprint
 from flask.views import MethodView
 from flask_jwt_extended import jwt_required
 
-from service.notification_service import NotificationService
+from service.service_container import ServiceContainer
 
 notification_blueprint = Blueprint('notification', __name__)
 
 
 class NotificationController(MethodView):
 
-    def __init__(self):
-        self.notification_service = NotificationService()
+    def __init__(self, service_container: ServiceContainer = None):
+        service_container = service_container or ServiceContainer.get_instance()
+        self.notification_service = service_container.notification_service
 
     def delete(self):
         endpoint_mapping = {
@@ -4,9 +4,8 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from model.user.role import UserRole
 from service.auth_service import check_access
-from service.time_entry_service import TimeEntryService
-from service.timesheet_service import TimesheetService
-from service.user_service import UserService
+from service.service_container import ServiceContainer
+from utils.time_entry_reader import TimeEntryReader
 
 time_entry_blueprint = Blueprint('time_entry', __name__)
 
@@ -16,13 +15,16 @@ class TimeEntryController(MethodView):
     controller for handling requests related to time entries, providing methods for POST and GET requests.
     """
 
-    def __init__(self):
+    def __init__(self, service_container: ServiceContainer = None):
         """
-        Initialize the TimeEntryController with instances of TimeEntryService and TimesheetService.
+        Initialize the TimeEntryController with the shared TimeEntryService, TimesheetService and UserService.
+
+        :param service_container: The container providing the shared services. Defaults to the application container.
         """
-        self.time_entry_service = TimeEntryService()
-        self.timesheet_service = TimesheetService()
-        self.user_service = UserService()
+        service_container = service_container or ServiceContainer.get_instance()
+        self.time_entry_service = service_container.time_entry_service
+        self.timesheet_service = service_container.timesheet_service
+        self.user_service = service_container.user_service
 
     def post(self):
         """
@@ -35,7 +37,8 @@ class TimeEntryController(MethodView):
             '/createWorkEntry': self.create_work_entry,
             '/createVacationEntry': self.create_vacation_entry,
             '/updateTimeEntry': self.update_time_entry,
-            '/deleteTimeEntry': self.delete_time_entry
+            '/deleteTimeEntry': self.delete_time_entry,
+            '/importTimeEntries': self.import_time_entries
         }
         return self._dispatch_request(endpoint_mapping)
 
@@ -131,6 +134,30 @@ class TimeEntryController(MethodView):
         result = self.time_entry_service.delete_time_entry(time_entry_id)
         return jsonify(result.message), result.status_code
 
+    @jwt_required()
+    @check_access(roles=[UserRole.HIWI])
+    def import_time_entries(self):
+        """
+        Imports several time entries at once, e.g. a month that was tracked in another tool. The entries are sent
+        as JSON list or as CSV file with a column per time entry field.
+
+        :return: JSON response containing the status message and the result of every row.
+        """
+        if self.user_service.is_archived(get_jwt_identity()):
+            return jsonify('User is archived'), 400
+        if request.is_json:
+            entries_data = request.get_json()
+            if not isinstance(entries_data, list):
+                return jsonify('Time entries must be sent as a list'), 400
+        elif request.mimetype == 'text/csv':
+            entries_data = TimeEntryReader.read_csv(request.stream)
+        else:
+            return jsonify('Request data must be in JSON or CSV format'), 400
+        result = self.time_entry_service.import_time_entries(entries_data, get_jwt_identity())
+        if not result.is_successful:
+            return jsonify(result.message), result.status_code
+        return jsonify({'message': result.message, 'results': result.data}), result.status_code
+
     @jwt_required()
     def get_entries_by_timesheet_id(self):
         """
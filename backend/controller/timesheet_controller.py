@@ -5,9 +5,7 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 from model.file.FileType import FileType
 from model.user.role import UserRole
 from service.auth_service import check_access
-from service.file_service import FileService
-from service.timesheet_service import TimesheetService
-from service.user_service import UserService
+from service.service_container import ServiceContainer
 
 timesheet_blueprint = Blueprint('timesheet', __name__)
 
@@ -18,13 +16,16 @@ class TimesheetController(MethodView):
     and deletion of timesheet entries.
     """
 
-    def __init__(self):
+    def __init__(self, service_container: ServiceContainer = None):
         """
-        Initializes TimesheetController with an instance of TimesheetService.
+        Initializes TimesheetController with the shared TimesheetService, FileService and UserService.
+
+        :param service_container: The container providing the shared services. Defaults to the application container.
         """
-        self.timesheet_service = TimesheetService()
-        self.file_service = FileService()
-        self.user_service = UserService()
+        service_container = service_container or ServiceContainer.get_instance()
+        self.timesheet_service = service_container.timesheet_service
+        self.file_service = service_container.file_service
+        self.user_service = service_container.user_service
 
     def get(self):
         """
@@ -59,6 +60,7 @@ class TimesheetController(MethodView):
         endpoint_mapping = {
             '/sign': self.sign_timesheet,
             '/approve': self.approve_timesheet,
+            '/approveBatch': self.approve_timesheets,
             '/requestChange': self.request_change
         }
         return self._dispatch_request(endpoint_mapping)
@@ -131,6 +133,29 @@ class TimesheetController(MethodView):
         result = self.timesheet_service.approve_timesheet(timesheet_id)
         return jsonify(result.message), result.status_code
 
+    @jwt_required()
+    @check_access(roles=[UserRole.SUPERVISOR])
+    def approve_timesheets(self):
+        """
+        Allows a supervisor to approve several timesheets at once.
+
+        :return: JSON response containing the status message and the result of every timesheet ID.
+        """
+        if self.user_service.is_archived(get_jwt_identity()):
+            return jsonify('User is archived'), 400
+        if not request.is_json:
+            return jsonify('Request data must be in JSON format'), 400
+        request_data = request.get_json()
+        timesheet_ids = request_data.get('timesheetIds')
+        if not isinstance(timesheet_ids, list) or len(timesheet_ids) == 0:
+            return jsonify('No timesheet IDs provided'), 400
+        if not self.file_service.does_file_exist(get_jwt_identity(), FileType.SIGNATURE):
+            return jsonify('No signature has been uploaded.'), 400
+        result = self.timesheet_service.approve_timesheets(timesheet_ids)
+        if not result.is_successful:
+            return jsonify(result.message), result.status_code
+        return jsonify({'message': result.message, 'results': result.data}), result.status_code
+
     @jwt_required()
     @check_access(roles=[UserRole.SUPERVISOR])
     def request_change(self):
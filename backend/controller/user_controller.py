@@ -4,9 +4,8 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from model.file.FileType import FileType
 from model.user.role import UserRole
-from service.auth_service import AuthenticationService, check_access
-from service.file_service import FileService
-from service.user_service import UserService
+from service.auth_service import check_access
+from service.service_container import ServiceContainer
 
 user_blueprint = Blueprint('user', __name__)
 
@@ -17,13 +16,16 @@ class UserController(MethodView):
     managing login sessions, and handling user files.
     """
 
-    def __init__(self):
+    def __init__(self, service_container: ServiceContainer = None):
         """
-        Initializes UserController with UserService, AuthenticationService, and FileService instances.
+        Initializes UserController with the shared UserService, AuthenticationService, and FileService instances.
+
+        :param service_container: The container providing the shared services. Defaults to the application container.
         """
-        self.user_service = UserService()
-        self.auth_service = AuthenticationService()
-        self.file_service = FileService()
+        service_container = service_container or ServiceContainer.get_instance()
+        self.user_service = service_container.user_service
+        self.auth_service = service_container.auth_service
+        self.file_service = service_container.file_service
 
     def post(self):
         """
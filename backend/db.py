@@ -1,4 +1,3 @@
-
 """
 Author: Dominik Pollok, Phil Gengenbach, Alina Petri, José Ayala, Johann Kohl
 Date: 2024-09-06
@@ -6,26 +5,198 @@ Description: Clockwise - Intuitive Time Tracking Web-App for Research Assistants
 """
 
 import os
-
+import threading
 
 from pymongo import MongoClient
+from pymongo.monitoring import ConnectionPoolListener
+
+DB_NAME = 'timetracking_db_production'
+DB_PORT = 27017
 
 db = None
 client = None
 
+_client_pid = None
+_client_lock = threading.Lock()
 
-def initialize_db():
+
+class PoolStatisticsListener(ConnectionPoolListener):
     """
-    Initializes the database connection
+    Collects connection pool events of the shared MongoClient so that the pool usage of a worker
+    process can be inspected at runtime.
+    """
+
+    def __init__(self):
+        """
+        Initializes all counters with zero.
+        """
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Resets all counters, e.g. after the client of a forked worker has been recreated.
+        """
+        with self._lock:
+            self.pools_created = 0
+            self.pools_cleared = 0
+            self.connections_created = 0
+            self.connections_closed = 0
+            self.checked_out = 0
+            self.checkout_failures = 0
+
+    def _increment(self, counter: str, value: int = 1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + value)
+
+    def pool_created(self, event):
+        self._increment('pools_created')
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._increment('pools_cleared')
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._increment('connections_created')
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._increment('connections_closed')
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        self._increment('checkout_failures')
+
+    def connection_checked_out(self, event):
+        self._increment('checked_out')
+
+    def connection_checked_in(self, event):
+        self._increment('checked_out', -1)
+
+    def to_dict(self) -> dict:
+        """
+        Converts the current counters to a dictionary.
+
+        :return: A dictionary containing the pool statistics.
+        """
+        with self._lock:
+            return {
+                "poolsCreated": self.pools_created,
+                "poolsCleared": self.pools_cleared,
+                "connectionsCreated": self.connections_created,
+                "connectionsClosed": self.connections_closed,
+                "openConnections": self.connections_created - self.connections_closed,
+                "checkedOutConnections": self.checked_out,
+                "checkoutFailures": self.checkout_failures
+            }
+
+
+_pool_listener = PoolStatisticsListener()
+
+
+def _get_int_env(name: str, default):
+    """
+    Reads an integer setting from the environment.
+
+    :param name: The name of the environment variable.
+    :param default: The value to use if the variable is not set or empty.
+    :return: The parsed integer or the default value.
+    """
+    value = os.getenv(name)
+    if value is None or value.strip() == '':
+        return default
+    return int(value)
+
+
+def get_client_options() -> dict:
+    """
+    Builds the connection pool options of the shared MongoClient from the environment.
+
+    :return: A dictionary of keyword arguments for the MongoClient.
+    """
+    return {
+        "maxPoolSize": _get_int_env('DB_MAX_POOL_SIZE', 50),  # Upper bound of connections per worker process
+        "minPoolSize": _get_int_env('DB_MIN_POOL_SIZE', 0),
+        "maxIdleTimeMS": _get_int_env('DB_MAX_IDLE_TIME_MS', 60000),  # Close connections idle for more than 60s
+        "serverSelectionTimeoutMS": _get_int_env('DB_SERVER_SELECTION_TIMEOUT_MS', 5000)
+    }
+
+
+def get_client() -> MongoClient:
+    """
+    Returns the MongoClient shared by the whole process. The client is created lazily on first use
+    and recreated in a forked child (e.g. a gunicorn worker started with --preload), so a worker never
+    reuses the connection pool of its parent process.
+
+    :return: The process-wide MongoClient.
     """
-    global db
     global client
+    global _client_pid
+
+    pid = os.getpid()
+    if client is not None and _client_pid == pid:
+        return client
+    with _client_lock:
+        if client is None or _client_pid != pid:
+            db_host = os.getenv('DB_HOST', 'localhost') # Get the DB_HOST environment variable or use 'localhost' as default
+            db_username = os.getenv('DB_USERNAME', 'admin') # Get the DB_USERNAME environment variable or use 'admin' as default
+            db_password = os.getenv('DB_PASSWORD', 'TimeTracking123!') # Get the DB_PASSWORD environment variable or use 'TimeTracking123!' as default
+            _pool_listener.reset()
+            client = MongoClient(db_host, DB_PORT, username=db_username, password=db_password, connect=False,
+                                 event_listeners=[_pool_listener], **get_client_options())
+            _client_pid = pid
+    return client
 
-    db_host = os.getenv('DB_HOST', 'localhost') # Get the DB_HOST environment variable or use 'localhost' as default
-    db_username = os.getenv('DB_USERNAME', 'admin') # Get the DB_USERNAME environment variable or use 'admin' as default
-    db_password = os.getenv('DB_PASSWORD', 'TimeTracking123!') # Get the DB_PASSWORD environment variable or use 'TimeTracking123!' as default
-    client = MongoClient(db_host, 27017, username=db_username, password=db_password) # Connect to the MongoDB server
-    db = client.timetracking_db_production
 
+def initialize_db():
+    """
+    Returns the application database. All callers share the connection pool of the process-wide client,
+    so calling this function repeatedly does not open new connections. Callers such as the repositories call it
+    on every access instead of keeping the returned database, so that a forked worker process never uses the
+    connection pool of its parent.
+    """
+    global db
+
+    shared_client = get_client()
+    if db is None or db.client is not shared_client:
+        db = shared_client[DB_NAME]
     return db
 
+
+def get_pool_stats() -> dict:
+    """
+    Returns statistics about the connection pool of the current process.
+
+    :return: A dictionary containing the pool configuration and the collected pool events.
+    """
+    stats = {"pid": os.getpid(), "clientInitialized": client is not None and _client_pid == os.getpid()}
+    stats.update(get_client_options())
+    stats.update(_pool_listener.to_dict())
+    return stats
+
+
+def _reset_after_fork():
+    """
+    Drops the references to the parent's client in a forked child. The child creates its own client on first use.
+    """
+    global db
+    global client
+    global _client_pid
+    global _client_lock
+    db = None
+    client = None
+    _client_pid = None
+    _client_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
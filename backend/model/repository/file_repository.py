@@ -1,4 +1,4 @@
-from gridfs import GridFS, GridFSBucket
+from gridfs import GridFS, GridFSBucket, NoFile
 
 from db import initialize_db
 from model.file.FileType import FileType
@@ -29,13 +29,39 @@ class FileRepository:
 
     def __init__(self):
         """
-        Initializes the FileRepository, setting up GridFS to interact with the MongoDB database.
-        This setup involves establishing a connection to the database and preparing GridFS
-        and GridFSBucket instances for file operations.
+        Initializes the FileRepository. The GridFS and GridFSBucket instances for file operations
+        are created lazily for the database of the shared client.
         """
-        self.db = initialize_db()
-        self.grid_fs = GridFS(self.db)
-        self.grid_fs_bucket = GridFSBucket(self.db)
+        self._grid_db = None
+        self._grid_fs = None
+        self._grid_fs_bucket = None
+
+    @property
+    def db(self):
+        """
+        The application database.
+        """
+        return initialize_db()
+
+    def _ensure_grid_fs(self):
+        """
+        (Re)creates the GridFS instances whenever the shared database handle has changed, e.g. after a fork.
+        """
+        db = self.db
+        if self._grid_db is not db:
+            self._grid_fs = GridFS(db)
+            self._grid_fs_bucket = GridFSBucket(db)
+            self._grid_db = db
+
+    @property
+    def grid_fs(self) -> GridFS:
+        self._ensure_grid_fs()
+        return self._grid_fs
+
+    @property
+    def grid_fs_bucket(self) -> GridFSBucket:
+        self._ensure_grid_fs()
+        return self._grid_fs_bucket
 
     def upload_image(self, file, username: str, file_type: FileType) -> RequestResult:
         """
@@ -111,6 +137,19 @@ class FileRepository:
         except PyMongoError as e: # pragma: no cover
             return None
 
+    def get_image_by_id(self, gridfs_id):
+        """
+        Retrieves an image file from GridFS by its GridFS ID, without looking up its metadata.
+
+        :param gridfs_id: The GridFS ID of the image.
+
+        :return: A file-like object containing the image data if found, otherwise None.
+        """
+        try:
+            return self.grid_fs_bucket.open_download_stream(gridfs_id)
+        except (PyMongoError, NoFile) as e: # pragma: no cover
+            return None
+
     def delete_image(self, gridfs_id: str) -> RequestResult:
         """
         Deletes an image and its associated metadata from GridFS and MongoDB based on the
@@ -160,4 +199,19 @@ class FileRepository:
             metadata = self.db.file_metadata.find_one({"username": username, "fileType": file_type.value})
             return metadata
         except PyMongoError as e: # pragma: no cover
-            return None
\ No newline at end of file
+            return None
+
+    def get_images_metadata(self, usernames, file_type: FileType) -> list:
+        """
+        Retrieves the metadata of the images of several users with a single query.
+
+        :param usernames: The usernames associated with the images.
+        :param file_type: The type of the images.
+
+        :return: A list of the metadata of the images that were found.
+        """
+        try:
+            return list(self.db.file_metadata.find({"username": {"$in": list(set(usernames))},
+                                                    "fileType": file_type.value}))
+        except PyMongoError as e: # pragma: no cover
+            return []
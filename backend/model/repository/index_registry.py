@@ -0,0 +1,48 @@
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import PyMongoError
+
+# Declarative list of all indexes the repositories rely on, grouped by collection.
+# Every query issued by a repository must be answerable by one of these indexes.
+INDEX_REGISTRY = {
+    "users": [
+        IndexModel([("username", ASCENDING)], name="username_unique", unique=True),
+        IndexModel([("role", ASCENDING)], name="role"),
+    ],
+    "timesheets": [
+        # A Hiwi has exactly one timesheet per month
+        IndexModel([("username", ASCENDING), ("year", ASCENDING), ("month", ASCENDING)],
+                   name="username_year_month_unique", unique=True),
+        IndexModel([("username", ASCENDING), ("status", ASCENDING)], name="username_status"),
+        IndexModel([("status", ASCENDING)], name="status"),
+    ],
+    "timeEntries": [
+        IndexModel([("timesheetId", ASCENDING), ("startTime", ASCENDING)], name="timesheetId_startTime"),
+    ],
+    "notifications": [
+        IndexModel([("receiver", ASCENDING), ("read", ASCENDING)], name="receiver_read"),
+    ],
+    "file_metadata": [
+        # A user has at most one file per file type
+        IndexModel([("username", ASCENDING), ("fileType", ASCENDING)], name="username_fileType_unique",
+                   unique=True),
+        IndexModel([("gridfsId", ASCENDING)], name="gridfsId"),
+    ],
+}
+
+
+def ensure_indexes(db) -> dict:
+    """
+    Creates all indexes of the registry. Creating an index that already exists with the same
+    specification is a no-op, so this function can safely be called on every startup.
+
+    :param db: The database in which the indexes are created.
+    :return: A dictionary mapping the names of indexes that could not be created to the error message.
+    """
+    failures = {}
+    for collection_name, indexes in INDEX_REGISTRY.items():
+        for index in indexes:
+            try:
+                db[collection_name].create_indexes([index])
+            except PyMongoError as e:
+                failures[f"{collection_name}.{index.document['name']}"] = str(e)
+    return failures
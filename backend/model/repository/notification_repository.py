@@ -9,8 +9,12 @@ from model.request_result import RequestResult
 class NotificationRepository:
     __instance = None
 
-    def __init__(self):
-        self.db = initialize_db()
+    @property
+    def db(self):
+        """
+        The application database.
+        """
+        return initialize_db()
 
     @staticmethod
     def get_instance():
@@ -40,6 +44,27 @@ class NotificationRepository:
         except PyMongoError as e: # pragma: no cover
             return RequestResult(False, str(e), 500)
 
+    def create_notifications(self, notifications: list):
+        """
+        Creates several notifications in the MongoDB database with a single write.
+
+        :param notifications: The notifications to create.
+
+        :return: A RequestResult containing the IDs of the newly created notifications.
+        """
+        if not notifications:
+            return RequestResult(True, "No notifications to create", 200, data={"ids": []})
+        try:
+            result = self.db.notifications.insert_many([notification.to_dict() for notification in notifications])
+            if result.acknowledged:
+                for notification, inserted_id in zip(notifications, result.inserted_ids):
+                    notification.set_message_id(str(inserted_id))
+                return RequestResult(True, "Notifications created successfully", 201,
+                                     data={"ids": [str(inserted_id) for inserted_id in result.inserted_ids]})
+            return RequestResult(False, "Notification creation failed", 500)
+        except PyMongoError as e: # pragma: no cover
+            return RequestResult(False, str(e), 500)
+
     def get_notification_by_id(self, notification_id: str):
         """
         Retrieves a notification from the MongoDB database using its ID.
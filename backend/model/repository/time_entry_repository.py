@@ -31,11 +31,17 @@ class TimeEntryRepository:
 
     def __init__(self):
         """
-        Initializes the TimeEntryRepository by setting up a connection to the MongoDB database.
+        Initializes the TimeEntryRepository with the TimesheetRepository it uses for timesheet lookups.
         """
-        self.db = initialize_db()
         self.timesheet_repository = TimesheetRepository.get_instance()
 
+    @property
+    def db(self):
+        """
+        The application database.
+        """
+        return initialize_db()
+
     def get_time_entry_by_id(self, time_entry_id):
         """
         Retrieves a TimeEntry object from the MongoDB database using its ID.
@@ -92,6 +98,36 @@ class TimeEntryRepository:
         except PyMongoError as e:  # pragma: no cover
             return []
 
+    def get_time_entries_by_timesheet_ids(self, timesheet_ids: list):
+        """
+        Retrieves all time entries of several timesheets with a single query.
+
+        :param timesheet_ids: The timesheet IDs to query for time entries.
+
+        :return: A list of the time entries linked to any of the specified timesheets.
+        """
+        if not timesheet_ids:
+            return []
+        try:
+            cursor = self.db.timeEntries.find({"timesheetId": {"$in": [str(timesheet_id)
+                                                                       for timesheet_id in timesheet_ids]}})
+            return list(cursor)
+        except PyMongoError as e:  # pragma: no cover
+            return []
+
+    def find_time_entries_by_timesheet_ids(self, timesheet_ids: list):
+        """
+        Opens a cursor over the time entries of several timesheets, ordered by their start time.
+        The entries are read from the database while the cursor is iterated, so they are never all held in memory.
+
+        :param timesheet_ids: The timesheet IDs to query for time entries.
+
+        :return: A cursor over the time entries.
+        """
+        return self.db.timeEntries.find({"timesheetId": {"$in": [str(timesheet_id)
+                                                                 for timesheet_id in timesheet_ids]}}
+                                        ).sort("startTime", 1)
+
     def update_time_entry(self, time_entry: TimeEntry) -> RequestResult:
         """
         Updates an existing TimeEntry object in the MongoDB database.
@@ -143,6 +179,31 @@ class TimeEntryRepository:
             return RequestResult(False, f"Time entry creation failed: {str(e)}", 500)
         return RequestResult(False, "Time entry creation failed", 500)
 
+    def create_time_entries(self, time_entries: list):
+        """
+        Creates several TimeEntry objects in the MongoDB database with a single write. Unlike create_time_entry,
+        the timesheets of the entries are not read again, the caller has to ensure they exist.
+
+        :param time_entries: The TimeEntry objects to create.
+        :return: A RequestResult containing the IDs of the created entries, in the order of the given entries.
+        """
+        if not time_entries:
+            return RequestResult(True, "No time entries to create", 200, data=[])
+        time_entries_data = []
+        for time_entry in time_entries:
+            time_entry_dict = time_entry.to_dict()
+            if '_id' in time_entry_dict:
+                del time_entry_dict['_id']
+            time_entries_data.append(time_entry_dict)
+        try:
+            result = self.db.timeEntries.insert_many(time_entries_data)
+            if result.acknowledged:
+                return RequestResult(True, f'{len(result.inserted_ids)} time entries created successfully', 201,
+                                     data=list(result.inserted_ids))
+        except PyMongoError as e:  # pragma: no cover
+            return RequestResult(False, f"Time entry creation failed: {str(e)}", 500)
+        return RequestResult(False, "Time entry creation failed", 500)  # pragma: no cover
+
     def delete_time_entry(self, entry_id: str):
         """
         Deletes a TimeEntry object from the MongoDB database using its ID.
@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime
 
 from bson import ObjectId
 
@@ -6,7 +6,8 @@ from db import initialize_db
 from model.request_result import RequestResult
 from model.timesheet import Timesheet
 from model.timesheet_status import TimesheetStatus
-from pymongo.errors import PyMongoError
+from pymongo import ASCENDING, DESCENDING, ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError, PyMongoError
 
 
 class TimesheetRepository:
@@ -28,11 +29,12 @@ class TimesheetRepository:
             TimesheetRepository._instance = TimesheetRepository()
         return TimesheetRepository._instance
 
-    def __init__(self):
+    @property
+    def db(self):
         """
-        Initializes the TimesheetRepository by connecting to the MongoDB database.
+        The application database.
         """
-        self.db = initialize_db()
+        return initialize_db()
 
     def get_timesheet_by_id(self, timesheet_id):
         """
@@ -50,6 +52,38 @@ class TimesheetRepository:
         except PyMongoError as e:  # pragma: no cover
             return None
 
+    def get_timesheets_by_ids(self, timesheet_ids: list):
+        """
+        Retrieves several timesheets with a single query.
+
+        :param timesheet_ids: The IDs of the timesheets to retrieve.
+        :return: A list of the timesheets that were found.
+        """
+        if not timesheet_ids:
+            return []
+        try:
+            timesheets = self.db.timesheets.find({"_id": {"$in": [ObjectId(timesheet_id)
+                                                                  for timesheet_id in timesheet_ids]}})
+            return list(timesheets)
+        except PyMongoError as e:  # pragma: no cover
+            return None
+
+    def get_timesheets_by_months(self, keys: list):
+        """
+        Retrieves the timesheets of several users and months with a single query.
+
+        :param keys: The (username, month, year) tuples of the timesheets to retrieve.
+        :return: A list of the timesheets that were found.
+        """
+        if not keys:
+            return []
+        try:
+            timesheets = self.db.timesheets.find({"$or": [{"username": username, "month": month, "year": year}
+                                                          for username, month, year in set(keys)]})
+            return list(timesheets)
+        except PyMongoError as e:  # pragma: no cover
+            return []
+
     def get_timesheet(self, username: str, month: int, year: int):
         """
         Retrieves a Timesheet from the database based on the username, month, and year.
@@ -97,26 +131,52 @@ class TimesheetRepository:
         """
         if username is None or start_date is None or end_date is None:
             return None
-        start_month = start_date.month
-        start_year = start_date.year
-        end_month = end_date.month
-        end_year = end_date.year
         try:
             timesheet_data = self.db.timesheets.find({"username": username,
-                                                      "$or": [
-                                                          {"year": {"$gt": start_year, "$lt": end_year}},
-                                                          {"$and": [{"year": start_year}, {"year": {"$lt": end_year}}],
-                                                           "month": {"$gte": start_month}},
-                                                          {"$and": [{"year": end_year}, {"year": {"$gt": start_year}}],
-                                                           "month": {"$lte": end_month}},
-                                                          {"$and": [{"year": end_year}, {"year": start_year},
-                                                                    {"month": {"$gte": start_month}},
-                                                                    {"month": {"$lte": end_month}}]}
-                                                      ]})
+                                                      "$or": self._get_time_period_filter(start_date, end_date)})
             return list(timesheet_data)
         except PyMongoError as e:  # pragma: no cover
             return None
 
+    def find_timesheets_by_time_period(self, usernames: list, start_date: date, end_date: date, projection=None):
+        """
+        Opens a cursor over the timesheets of several users in a time period, ordered by username, year and month.
+        The timesheets are read from the database while the cursor is iterated, so they are never all held in memory.
+
+        :param usernames: The usernames for whom to retrieve timesheets.
+        :param start_date: The start date of the time period. Includes timesheets with the month and year of the start_date.
+        :param end_date: The end date of the time period. Includes timesheets with the month and year of the end_date.
+        :param projection: The fields of the timesheets to retrieve. Defaults to all fields.
+        :return: A cursor over the timesheets.
+        """
+        return self.db.timesheets.find({"username": {"$in": list(usernames)},
+                                        "$or": self._get_time_period_filter(start_date, end_date)},
+                                       projection).sort([("username", 1), ("year", 1), ("month", 1)])
+
+    @staticmethod
+    def _get_time_period_filter(start_date: date, end_date: date) -> list:
+        """
+        Builds the conditions matching the timesheets from the month of the start date to the month of the end date.
+
+        :param start_date: The start date of the time period.
+        :param end_date: The end date of the time period.
+        :return: The conditions, of which a timesheet in the time period matches at least one.
+        """
+        start_month = start_date.month
+        start_year = start_date.year
+        end_month = end_date.month
+        end_year = end_date.year
+        return [
+            {"year": {"$gt": start_year, "$lt": end_year}},
+            {"$and": [{"year": start_year}, {"year": {"$lt": end_year}}],
+             "month": {"$gte": start_month}},
+            {"$and": [{"year": end_year}, {"year": {"$gt": start_year}}],
+             "month": {"$lte": end_month}},
+            {"$and": [{"year": end_year}, {"year": start_year},
+                      {"month": {"$gte": start_month}},
+                      {"month": {"$lte": end_month}}]}
+        ]
+
     def get_timesheets(self):
         """
         Retrieves all Timesheet objects from the database
@@ -193,6 +253,85 @@ class TimesheetRepository:
         except PyMongoError as e:  # pragma: no cover
             return None
 
+    def get_previous_timesheet(self, username: str, month: int, year: int):
+        """
+        Retrieves the latest timesheet of a user before the given month. The lookup is served by the
+        (username, year, month) index and reads a single document, however many timesheets the user has.
+
+        :param username: Username of the Hiwi
+        :param month: The month whose predecessor is retrieved
+        :param year: The year of the month
+        :return: The timesheet data if found; otherwise, None.
+        """
+        if username is None or month is None or year is None:
+            return None
+        try:
+            return self.db.timesheets.find_one({"username": username,
+                                                "$or": [{"year": {"$lt": year}},
+                                                        {"year": year, "month": {"$lt": month}}]},
+                                               sort=[("year", DESCENDING), ("month", DESCENDING)])
+        except PyMongoError as e:  # pragma: no cover
+            return None
+
+    def get_timesheets_since(self, username: str, month: int, year: int):
+        """
+        Retrieves the timesheets of a user from the given month onwards, ordered by year and month.
+
+        :param username: Username of the Hiwi
+        :param month: The first month to include
+        :param year: The year of the first month
+        :return: A list of timesheets ordered chronologically
+        """
+        if username is None or month is None or year is None:
+            return None
+        try:
+            timesheets = self.db.timesheets.find({"username": username,
+                                                  "$or": [{"year": {"$gt": year}},
+                                                          {"year": year, "month": {"$gte": month}}]}
+                                                 ).sort([("year", ASCENDING), ("month", ASCENDING)])
+            return list(timesheets)
+        except PyMongoError as e:  # pragma: no cover
+            return None
+
+    def get_overtime(self, username: str, month: int, year: int):
+        """
+        Retrieves only the overtime balance stored in the timesheet of a user for the given month.
+
+        :param username: Username of the Hiwi
+        :param month: Month of the timesheet
+        :param year: Year of the timesheet
+        :return: The overtime balance in minutes, or None if there is no timesheet for the month
+        """
+        if username is None or month is None or year is None:
+            return None
+        try:
+            timesheet_data = self.db.timesheets.find_one({"username": username, "month": month, "year": year},
+                                                         {"_id": 0, "overtime": 1})
+            if timesheet_data is None:
+                return None
+            return timesheet_data.get("overtime", 0)
+        except PyMongoError as e:  # pragma: no cover
+            return None
+
+    def set_overtime_values(self, overtime_by_timesheet_id: dict) -> RequestResult:
+        """
+        Stores the overtime balances of several timesheets with a single bulk write.
+
+        :param overtime_by_timesheet_id: A dictionary mapping timesheet IDs to their new overtime balance.
+        :return: A RequestResult indicating the success or failure of the update operation.
+        """
+        if not overtime_by_timesheet_id:
+            return RequestResult(True, "No overtime to update", 200)
+        try:
+            result = self.db.timesheets.bulk_write(
+                [UpdateOne({"_id": ObjectId(timesheet_id)}, {"$set": {"overtime": overtime}})
+                 for timesheet_id, overtime in overtime_by_timesheet_id.items()], ordered=False)
+            if result.acknowledged:
+                return RequestResult(True, "Overtime updated successfully", 200)
+        except PyMongoError as e:  # pragma: no cover
+            return RequestResult(False, f"Overtime update failed: {str(e)}", 500)
+        return RequestResult(False, "Overtime update failed", 500)
+
     def update_timesheet_by_dict(self, timesheet_data: dict) -> RequestResult:
         """
         Updates a specific Timesheet in the database.
@@ -235,6 +374,64 @@ class TimesheetRepository:
             return RequestResult(False, f"Timesheet update failed: {str(e)}", 500)
         return RequestResult(False, "Timesheet update failed", 500)
 
+    def increment_totals(self, timesheet_id, total_time_delta=0, vacation_minutes_delta=0) -> RequestResult:
+        """
+        Applies the change of a time entry to the total time and vacation minutes of a timesheet
+        with a single atomic update.
+
+        :param timesheet_id: The ID of the timesheet to update.
+        :param total_time_delta: The number of minutes to add to the total time, negative to remove minutes.
+        :param vacation_minutes_delta: The number of minutes to add to the vacation minutes, negative to remove minutes.
+        :return: A RequestResult indicating the success or failure of the update operation.
+        """
+        if timesheet_id is None:
+            return RequestResult(False, "Please provide a timesheet ID to update the timesheet.", 400)
+        try:
+            result = self.db.timesheets.update_one({"_id": ObjectId(timesheet_id)},
+                                                   {"$inc": {"totalTime": total_time_delta,
+                                                             "vacationMinutes": vacation_minutes_delta}})
+            if result.matched_count == 0:
+                return RequestResult(False, "Timesheet not found", 404)
+            if result.acknowledged:
+                return RequestResult(True, "Timesheet updated successfully", 200)
+        except PyMongoError as e:  # pragma: no cover
+            return RequestResult(False, f"Timesheet update failed: {str(e)}", 500)
+        return RequestResult(False, "Timesheet update failed", 500)
+
+    def set_totals(self, timesheet_id, total_time, vacation_minutes, expected_total_time=None,
+                   expected_vacation_minutes=None, check_expected: bool = False) -> RequestResult:
+        """
+        Overwrites the total time and vacation minutes of a timesheet, e.g. after they have been recomputed.
+
+        :param timesheet_id: The ID of the timesheet to update.
+        :param total_time: The total time of the timesheet in minutes.
+        :param vacation_minutes: The vacation minutes of the timesheet.
+        :param expected_total_time: The total time the timesheet is expected to still have, see check_expected.
+        :param expected_vacation_minutes: The vacation minutes the timesheet is expected to still have.
+        :param check_expected: If True, the totals are only overwritten if they still have the expected values,
+                               so a concurrent change of the totals is not lost.
+        :return: A RequestResult indicating the success or failure of the update operation. If the expected values
+                 are checked and the totals have changed in the meantime, the status code is 409.
+        """
+        if timesheet_id is None:
+            return RequestResult(False, "Please provide a timesheet ID to update the timesheet.", 400)
+        query = {"_id": ObjectId(timesheet_id)}
+        if check_expected:
+            query["totalTime"] = expected_total_time
+            query["vacationMinutes"] = expected_vacation_minutes
+        try:
+            result = self.db.timesheets.update_one(query, {"$set": {"totalTime": total_time,
+                                                                    "vacationMinutes": vacation_minutes}})
+            if result.matched_count == 0 and check_expected:
+                return RequestResult(False, "Timesheet not found or its totals have changed", 409)
+            if result.matched_count == 0:
+                return RequestResult(False, "Timesheet not found", 404)
+            if result.acknowledged:
+                return RequestResult(True, "Timesheet updated successfully", 200)
+        except PyMongoError as e:  # pragma: no cover
+            return RequestResult(False, f"Timesheet update failed: {str(e)}", 500)
+        return RequestResult(False, "Timesheet update failed", 500)
+
     def set_timesheet_status(self, timesheet_id: str, status) -> RequestResult:
         """
         Updates the status of a timesheet in the database.
@@ -257,6 +454,52 @@ class TimesheetRepository:
             return RequestResult(False, f"Timesheet status update failed: {str(e)}", 500)
         return RequestResult(False, "Timesheet status update failed", 500)
 
+    def transition_status(self, timesheet_id, expected_statuses: list, status):
+        """
+        Changes the status of a timesheet only if its current status is one of the expected statuses.
+        The check and the update are a single atomic operation, so concurrent transitions of the same
+        timesheet cannot both succeed. The time of the last signature change is set as well.
+
+        :param timesheet_id: The ID of the timesheet to update.
+        :param expected_statuses: The statuses the timesheet must currently have.
+        :param status: The new status of the timesheet.
+        :return: The updated timesheet, or None if the timesheet does not exist or has another status.
+        """
+        if timesheet_id is None or status is None:
+            return None
+        try:
+            return self.db.timesheets.find_one_and_update(
+                {"_id": ObjectId(timesheet_id), "status": {"$in": [str(expected) for expected in expected_statuses]}},
+                {"$set": {"status": str(status), "lastSignatureChange": datetime.utcnow()}},
+                return_document=ReturnDocument.AFTER)
+        except PyMongoError as e:  # pragma: no cover
+            return None
+
+    def transition_statuses(self, timesheet_ids: list, expected_statuses: list, status) -> list:
+        """
+        Changes the status of several timesheets. Every timesheet is changed with its own conditional update, see
+        transition_status, so of concurrent requests making the same transition exactly one reports each timesheet
+        as changed.
+
+        :param timesheet_ids: The IDs of the timesheets to update.
+        :param expected_statuses: The statuses the timesheets must currently have.
+        :param status: The new status of the timesheets.
+        :return: The IDs of the timesheets whose status was changed by this call, or None if an update failed.
+        """
+        status_filter = {"$in": [str(expected) for expected in expected_statuses]}
+        changed_ids = []
+        try:
+            for timesheet_id in timesheet_ids:
+                timesheet_data = self.db.timesheets.find_one_and_update(
+                    {"_id": ObjectId(timesheet_id), "status": status_filter},
+                    {"$set": {"status": str(status), "lastSignatureChange": datetime.utcnow()}},
+                    projection={"_id": 1})
+                if timesheet_data is not None:
+                    changed_ids.append(timesheet_data["_id"])
+        except PyMongoError as e:  # pragma: no cover
+            return None
+        return changed_ids
+
     def create_timesheet_by_dict(self, timesheet_data: dict):
         """
          Creates a new Timesheet in the database.
@@ -276,6 +519,8 @@ class TimesheetRepository:
             if result.acknowledged:
                 return RequestResult(True, f'Timesheet created successfully with ID: {str(result.inserted_id)}', 201,
                                      data={"_id": result.inserted_id})
+        except DuplicateKeyError:  # pragma: no cover
+            return RequestResult(False, "Timesheet already exists", 409)
         except PyMongoError as e:  # pragma: no cover
             return RequestResult(False, f"Timesheet creation failed: {str(e)}", 500)
         return RequestResult(False, "Timesheet creation failed", 500)
@@ -297,6 +542,8 @@ class TimesheetRepository:
             if result.acknowledged:
                 return RequestResult(True, f'Timesheet created successfully with ID: {str(result.inserted_id)}', 201,
                                      data={"_id": result.inserted_id})
+        except DuplicateKeyError:  # pragma: no cover
+            return RequestResult(False, "Timesheet already exists", 409)
         except PyMongoError as e:  # pragma: no cover
             return RequestResult(False, f"Timesheet creation failed: {str(e)}", 500)
         return RequestResult(False, "Timesheet creation failed", 500)
@@ -0,0 +1,85 @@
+import copy
+
+from flask import current_app, g, has_request_context
+
+
+class UserIdentityMap:
+    """
+    Request-scoped identity map for user documents. The documents loaded during a request are kept in
+    Flask's ``g``, so that repeated lookups of the same user within one request are answered from memory.
+    Outside a request every lookup goes to the database.
+
+    In debug mode the number of database reads saved by the map is counted per request and in total.
+    """
+
+    _G_KEY = 'user_identity_map'
+    _G_SAVED_READS_KEY = 'user_identity_map_saved_reads'
+    total_saved_reads = 0
+
+    @staticmethod
+    def _get_map():
+        """
+        Returns the identity map of the current request.
+
+        :return: The dictionary mapping usernames to user documents, or None if there is no active request.
+        """
+        if not has_request_context():
+            return None
+        if UserIdentityMap._G_KEY not in g:
+            setattr(g, UserIdentityMap._G_KEY, {})
+        return getattr(g, UserIdentityMap._G_KEY)
+
+    @staticmethod
+    def get(username: str):
+        """
+        Returns a copy of the user document loaded earlier in this request.
+
+        :param username: The username of the user.
+        :return: A tuple (found, user_data). user_data may be None if the user was looked up but does not exist.
+        """
+        identity_map = UserIdentityMap._get_map()
+        if identity_map is None or username not in identity_map:
+            return False, None
+        if current_app.debug:
+            setattr(g, UserIdentityMap._G_SAVED_READS_KEY, UserIdentityMap.get_saved_reads() + 1)
+            UserIdentityMap.total_saved_reads += 1
+        # Callers may modify the returned document, so the cached one is never handed out
+        return True, copy.deepcopy(identity_map[username])
+
+    @staticmethod
+    def put(username: str, user_data):
+        """
+        Remembers the result of a user lookup for the rest of the request.
+
+        :param username: The username of the user.
+        :param user_data: The user document as read from the database, or None if the user does not exist.
+        """
+        identity_map = UserIdentityMap._get_map()
+        if identity_map is not None:
+            identity_map[username] = copy.deepcopy(user_data)
+
+    @staticmethod
+    def invalidate(username: str = None):
+        """
+        Removes a user from the identity map after it has been written.
+
+        :param username: The username of the written user. If None, the whole map is cleared.
+        """
+        identity_map = UserIdentityMap._get_map()
+        if identity_map is None:
+            return
+        if username is None:
+            identity_map.clear()
+        else:
+            identity_map.pop(username, None)
+
+    @staticmethod
+    def get_saved_reads() -> int:
+        """
+        Returns the number of database reads saved in the current request. Only counted in debug mode.
+
+        :return: The number of lookups answered from the identity map.
+        """
+        if not has_request_context():
+            return 0
+        return getattr(g, UserIdentityMap._G_SAVED_READS_KEY, 0)
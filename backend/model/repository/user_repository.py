@@ -1,10 +1,12 @@
 import datetime
 
 from db import initialize_db
+from model.repository.user_identity_map import UserIdentityMap
 from model.request_result import RequestResult
 from model.user.role import UserRole
 from model.user.user import User
-from pymongo.errors import PyMongoError
+from pymongo.errors import DuplicateKeyError, PyMongoError
+from utils.access_version_table import AccessVersionTable
 
 
 
@@ -27,12 +29,12 @@ class UserRepository:
             UserRepository._instance = UserRepository()
         return UserRepository._instance
 
-    def __init__(self):
+    @property
+    def db(self):
         """
-        Initializes the UserRepository class by establishing a connection to the database.
-        This connection is used for all data operations within this repository.
+        The application database.
         """
-        self.db = initialize_db()
+        return initialize_db()
 
     def create_user(self, user: User):
         """
@@ -46,9 +48,13 @@ class UserRepository:
         try:
             if self.find_by_username(user.username):
                 return RequestResult(False, "User already exists", 409)
+            UserIdentityMap.invalidate(user.username)
             result = self.db.users.insert_one(user.to_dict())
             if result.acknowledged:
+                AccessVersionTable.record_change(user.username, user.role)
                 return RequestResult(True, f'User created successfully with ID: {str(result.inserted_id)}', 201)
+        except DuplicateKeyError: # pragma: no cover
+            return RequestResult(False, "User already exists", 409)
         except PyMongoError as e: # pragma: no cover
             return RequestResult(False, f"User creation failed: {str(e)}", 500)
         return RequestResult(False, "User creation failed", 500)
@@ -61,6 +67,7 @@ class UserRepository:
         :param last_login: The last login time to set for the user.
         :return: RequestResult indicating the success or failure of the update operation.
         """
+        UserIdentityMap.invalidate(username)
         try:
             result = self.db.users.update_one({"username": username}, {"$set": {"lastLogin": last_login}})
             if result.matched_count == 0:
@@ -75,27 +82,85 @@ class UserRepository:
 
     def find_by_username(self, username):
         """
-        Retrieves a user's data from the database by their username.
+        Retrieves a user's data from the database by their username. Within a request, repeated lookups
+        of the same user are answered from the request-scoped identity map.
 
         :param username: The username of the user to find.
         :return: A dictionary with the user's data if found, otherwise None.
         """
         if username is None:
             return None
+        found, user_data = UserIdentityMap.get(username)
+        if found:
+            return user_data
         try:
             user_data = self.db.users.find_one({"username": username})
         except PyMongoError as e: # pragma: no cover
             return None
+        UserIdentityMap.put(username, user_data)
         return user_data
 
+    def find_by_usernames(self, usernames) -> dict:
+        """
+        Retrieves the data of several users with a single query.
+
+        :param usernames: The usernames of the users to find.
+        :return: A dictionary mapping the usernames to the data of the users that were found.
+        """
+        users_data = {}
+        missing_usernames = []
+        for username in set(usernames):
+            found, user_data = UserIdentityMap.get(username)
+            if found:
+                if user_data is not None:
+                    users_data[username] = user_data
+            else:
+                missing_usernames.append(username)
+        if not missing_usernames:
+            return users_data
+        try:
+            for user_data in self.db.users.find({"username": {"$in": missing_usernames}}):
+                UserIdentityMap.put(user_data["username"], user_data)
+                users_data[user_data["username"]] = user_data
+        except PyMongoError as e: # pragma: no cover
+            return users_data
+        return users_data
+
     def update_user(self, user: User) -> RequestResult:
         """
         Updates an existing user in the database based on the provided User object.
         :param user: The User object containing updated data for the user.
         :return: RequestResult indicating the success or failure of the update operation.
         """
+        UserIdentityMap.invalidate(user.username)
         try:
             result = self.db.users.update_one({"username": user.username}, {"$set": user.to_dict()})
+            if result.matched_count == 0:
+                return RequestResult(False, "User not found", 404)
+            if result.acknowledged:
+                AccessVersionTable.record_change(user.username, user.role)
+                return RequestResult(True, "User updated successfully", 200)
+        except PyMongoError as e: # pragma: no cover
+            return RequestResult(False, f"User update failed: {str(e)}", 500)
+        return RequestResult(False, "User update failed", 500)
+
+    def increment_contract_minutes(self, username: str, overtime_minutes=0, vacation_minutes=0) -> RequestResult:
+        """
+        Changes the overtime and vacation balance of a user with a single atomic update, so that concurrent
+        changes of the same user cannot overwrite each other. Archived users and users without contract
+        information are not changed.
+
+        :param username: The username of the user to update.
+        :param overtime_minutes: The number of minutes to add to the overtime balance, negative to remove minutes.
+        :param vacation_minutes: The number of minutes to add to the vacation balance, negative to remove minutes.
+        :return: RequestResult indicating the success or failure of the update operation.
+        """
+        UserIdentityMap.invalidate(username)
+        try:
+            result = self.db.users.update_one(
+                {"username": username, "isArchived": {"$ne": True}, "contractInfo": {"$exists": True}},
+                {"$inc": {"contractInfo.overtimeMinutes": overtime_minutes,
+                          "contractInfo.vacationMinutes": vacation_minutes}})
             if result.matched_count == 0:
                 return RequestResult(False, "User not found", 404)
             if result.acknowledged:
@@ -116,10 +181,12 @@ class UserRepository:
         try:
             if self.find_by_username(username) is None:
                 return RequestResult(False, "User not found", 404)
+            UserIdentityMap.invalidate(username)
             result = self.db.users.delete_one({"username": username})
             if result.deleted_count == 0:
                 return RequestResult(False, "User deletion failed", 500)
             if result.acknowledged:
+                AccessVersionTable.record_change(username)
                 return RequestResult(True, "User deleted successfully", 200)
         except PyMongoError as e: # pragma: no cover
             return RequestResult(False, f"User deletion failed: {str(e)}", 500)
@@ -1,8 +1,12 @@
+import numpy as np
+
 from controller.input_validator.validation_result import ValidationResult
 from controller.input_validator.validation_status import ValidationStatus
 from model.time_entry import TimeEntry
 from model.time_entry_type import TimeEntryType
+from model.time_entry_validator.time_entry_batch import TimeEntryBatch
 from model.time_entry_validator.time_entry_strategy import TimeEntryStrategy
+from model.time_entry_validator.time_entry_validation_context import TimeEntryValidationContext
 
 
 class BreakLengthStrategy(TimeEntryStrategy):
@@ -21,7 +25,7 @@ class BreakLengthStrategy(TimeEntryStrategy):
         (float('inf'), 45)  # More than 9 hours, 45 minutes break
     ]
 
-    def validate(self, entry: TimeEntry) -> ValidationResult:
+    def validate(self, entry: TimeEntry, context: TimeEntryValidationContext = None) -> ValidationResult:
         """
         Validates the break time specified in a TimeEntry object against legal requirements,
         based on the total duration of work performed. The method checks if the break time
@@ -29,6 +33,8 @@ class BreakLengthStrategy(TimeEntryStrategy):
 
         :param entry: The TimeEntry object containing details of the work duration and break time.
         :type entry: TimeEntry
+        :param context: The validation context. This rule depends on the entry only.
+        :type context: TimeEntryValidationContext
 
         :return: ValidationResult indicating whether the break time is sufficient as per legal standards.
         :rtype: ValidationResult
@@ -60,3 +66,42 @@ class BreakLengthStrategy(TimeEntryStrategy):
             )
 
         return ValidationResult(ValidationStatus.SUCCESS, "Break length is valid according to work law regulations.")
+
+    def validate_batch(self, batch: TimeEntryBatch, context: TimeEntryValidationContext = None) -> list:
+        """
+        Validates the break times of all TimeEntry objects of a batch with vectorized operations.
+        The required break lengths are determined exactly like in validate.
+
+        :param batch: The batch of TimeEntry objects to validate.
+        :type batch: TimeEntryBatch
+        :param context: The validation context. This rule depends on the entries only.
+        :type context: TimeEntryValidationContext
+
+        :return: A list containing the ValidationResult of every entry, in the order of the entries. Entries with
+                 the same outcome share a result.
+        :rtype: list[ValidationResult]
+        """
+        work_duration_hours = batch.durations / self.MIN_PER_HOUR
+        thresholds = np.array([hours_threshold for hours_threshold, _ in self.WORK_DURATION_THRESHOLDS])
+        break_lengths = np.array([break_length for _, break_length in self.WORK_DURATION_THRESHOLDS])
+        # The first threshold the duration does not exceed determines the break length
+        threshold_indices = np.searchsorted(thresholds, work_duration_hours, side='left')
+        required_break_lengths = np.where(threshold_indices < len(thresholds),
+                                          break_lengths[np.minimum(threshold_indices, len(thresholds) - 1)],
+                                          self.DEFAULT_MINIMUM_BREAK_LENGTH)
+        too_short = (batch.work_entries & (batch.break_times < required_break_lengths)).tolist()
+        not_applicable = ValidationResult(ValidationStatus.SUCCESS,
+                                          "Break length is not applicable for non-work entries.")
+        valid = ValidationResult(ValidationStatus.SUCCESS, "Break length is valid according to work law regulations.")
+        results = []
+        for index, (entry, is_work_entry) in enumerate(zip(batch.entries, batch.work_entries.tolist())):
+            if not is_work_entry:
+                results.append(not_applicable)
+            elif too_short[index]:
+                results.append(ValidationResult(
+                    ValidationStatus.FAILURE,
+                    f"Break length of {entry.break_time} minutes is less than the required "
+                    f"{required_break_lengths[index]} minutes for {work_duration_hours[index]:.2f} hours of work."))
+            else:
+                results.append(valid)
+        return results
@@ -1,32 +1,41 @@
-import holidays
+from datetime import date, timedelta
+
 from model.time_entry import TimeEntry
+from model.time_entry_validator.time_entry_batch import TimeEntryBatch
 from model.time_entry_validator.time_entry_strategy import TimeEntryStrategy
+from model.time_entry_validator.time_entry_validation_context import TimeEntryValidationContext
 from controller.input_validator.validation_result import ValidationResult
 from controller.input_validator.validation_status import ValidationStatus
+from service.holiday_calendar_service import HolidayCalendarService
 
 
 class HolidayStrategy(TimeEntryStrategy):
     """
     Strategy for validating TimeEntry objects to ensure they do not coincide with public holidays
-    in Baden-Württemberg, Germany. This strategy utilizes the `holidays` package to check for
+    in the region of the institute, configured by HOLIDAY_COUNTRY and HOLIDAY_SUBDIVISION (by default
+    Baden-Württemberg, Germany). This strategy utilizes the shared HolidayCalendarService to check for
     state-specific public holidays and assesses whether time entries fall on these dates.
     """
 
-    def __init__(self):
+    def __init__(self, holiday_calendar: HolidayCalendarService = None):
         """
-        Initializes the HolidayStrategy with a holiday calendar specific to Baden-Württemberg,
-        Germany, enabling it to check for public holidays in this region.
+        Initializes the HolidayStrategy with the holiday calendar of the region of the institute,
+        enabling it to check for public holidays in this region.
+
+        :param holiday_calendar: The holiday calendar to use. Defaults to the shared instance.
         """
-        self.holiday_calendar = holidays.DE(prov='BW')  # BW stands for Baden-Württemberg
+        self.holiday_calendar = holiday_calendar or HolidayCalendarService.get_instance()
 
-    def validate(self, entry: TimeEntry) -> ValidationResult:
+    def validate(self, entry: TimeEntry, context: TimeEntryValidationContext = None) -> ValidationResult:
         """
-        Validates a given TimeEntry against public holidays in Baden-Württemberg. If the date
+        Validates a given TimeEntry against the public holidays in the region of the institute. If the date
         of the time entry is a public holiday, the validation will fail.
 
         :param entry: The TimeEntry object whose date needs to be validated against the public
                       holiday calendar.
         :type entry: TimeEntry
+        :param context: The validation context. This rule depends on the entry only.
+        :type context: TimeEntryValidationContext
 
         :return: A ValidationResult object that indicates whether the entry date is a public
                  holiday. It returns failure if the date is a public holiday, along with a message
@@ -42,8 +51,34 @@ class HolidayStrategy(TimeEntryStrategy):
               the validation will return:
               ValidationResult(ValidationStatus.SUCCESS, "Entry date is not a public holiday.")
         """
-        if entry.start_time.date() in self.holiday_calendar:
-            holiday_name = self.holiday_calendar.get(entry.start_time.date())
+        holiday_name = self.holiday_calendar.get_holiday_name(entry.start_time.date())
+        if holiday_name is not None:
             return ValidationResult(ValidationStatus.FAILURE, f"Entry date is a public holiday: {holiday_name}.")
 
         return ValidationResult(ValidationStatus.SUCCESS, "Entry date is not a public holiday.")
+
+    def validate_batch(self, batch: TimeEntryBatch, context: TimeEntryValidationContext = None) -> list:
+        """
+        Validates all TimeEntry objects of a batch against the public holidays in the region of the institute. The
+        entries on a holiday are determined with a single vectorized membership test of the holiday calendar.
+
+        :param batch: The batch of TimeEntry objects to validate.
+        :type batch: TimeEntryBatch
+        :param context: The validation context. This rule depends on the entries only.
+        :type context: TimeEntryValidationContext
+
+        :return: A list containing the ValidationResult of every entry, in the order of the entries. Entries with
+                 the same outcome share a result.
+        :rtype: list[ValidationResult]
+        """
+        on_holiday = self.holiday_calendar.are_holidays(batch.start_days).tolist()
+        no_holiday = ValidationResult(ValidationStatus.SUCCESS, "Entry date is not a public holiday.")
+        results = []
+        for index, day in enumerate(batch.start_days.tolist()):
+            if on_holiday[index]:
+                holiday_name = self.holiday_calendar.get_holiday_name(date(1970, 1, 1) + timedelta(days=day))
+                results.append(ValidationResult(ValidationStatus.FAILURE,
+                                                f"Entry date is a public holiday: {holiday_name}."))
+            else:
+                results.append(no_holiday)
+        return results
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from model.time_entry_type import TimeEntryType
+
+
+class TimeEntryBatch:
+    """
+    A batch of TimeEntry objects whose times are packed into NumPy arrays, so validation strategies can evaluate
+    their rules for all entries at once instead of once per entry.
+
+    Points in time are stored as microseconds since the epoch and days as days since the epoch, both without time
+    zone, like the naive datetimes of the entries. Entries with time zone information or without numeric break time
+    cannot be packed; the batch is then not vectorized and its entries are validated one by one.
+
+    Attributes:
+        entries (list): The TimeEntry objects of the batch.
+        vectorized (bool): Whether the times of the entries were packed into arrays.
+        start_times (numpy.ndarray): The start times in microseconds since the epoch.
+        end_times (numpy.ndarray): The end times in microseconds since the epoch.
+        start_days (numpy.ndarray): The days of the start times in days since the epoch.
+        end_days (numpy.ndarray): The days of the end times in days since the epoch.
+        break_times (numpy.ndarray): The break times in minutes, 0 for entries without break.
+        work_entries (numpy.ndarray): Whether an entry is a work entry.
+        durations (numpy.ndarray): The durations in minutes, as returned by get_duration.
+    """
+
+    MICROSECONDS_PER_DAY = 24 * 60 * 60 * 10 ** 6
+
+    _EPOCH = datetime(1970, 1, 1)
+    _MICROSECOND = timedelta(microseconds=1)
+
+    def __init__(self, entries: list):
+        """
+        Packs the given entries into arrays.
+
+        :param entries: The TimeEntry objects to pack.
+        :type entries: list[TimeEntry]
+        """
+        self.entries = list(entries)
+        self.vectorized = False
+        entry_types = [entry.entry_type for entry in self.entries]
+        work_entries = [entry_type == TimeEntryType.WORK_ENTRY for entry_type in entry_types]
+        if not all(is_work_entry or entry_type == TimeEntryType.VACATION_ENTRY
+                   for is_work_entry, entry_type in zip(work_entries, entry_types)):
+            return
+        break_times = [getattr(entry, 'break_time', None) if is_work_entry else 0
+                       for entry, is_work_entry in zip(self.entries, work_entries)]
+        if not all(isinstance(break_time, (int, float)) for break_time in break_times):
+            return
+        try:
+            self.start_times = self._to_microseconds([entry.start_time for entry in self.entries])
+            self.end_times = self._to_microseconds([entry.end_time for entry in self.entries])
+        except TypeError:
+            # Datetimes with time zone cannot be subtracted from the naive epoch
+            return
+        self.vectorized = True
+        self.start_days = self.start_times // self.MICROSECONDS_PER_DAY
+        self.end_days = self.end_times // self.MICROSECONDS_PER_DAY
+        self.work_entries = np.array(work_entries, dtype=bool)
+        self.break_times = np.array(break_times, dtype=np.float64)
+        # Same arithmetic as get_duration: the break is subtracted in whole microseconds, then the duration
+        # in seconds is converted to minutes and rounded up
+        duration_microseconds = self.end_times - self.start_times - np.round(self.break_times * 60 * 10 ** 6).astype(
+            np.int64)
+        self.durations = np.ceil(duration_microseconds / 10 ** 6 / 60).astype(np.int64)
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def _to_microseconds(datetimes: list) -> np.ndarray:
+        """
+        Converts naive datetimes to microseconds since the epoch.
+
+        :raises TypeError: If a datetime has time zone information.
+        """
+        return np.fromiter(((value - TimeEntryBatch._EPOCH) // TimeEntryBatch._MICROSECOND for value in datetimes),
+                           dtype=np.int64, count=len(datetimes))
@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 from controller.input_validator.validation_result import ValidationResult
 from model.time_entry import TimeEntry
+from model.time_entry_validator.time_entry_batch import TimeEntryBatch
+from model.time_entry_validator.time_entry_validation_context import TimeEntryValidationContext
 
 
 class TimeEntryStrategy(ABC):
@@ -22,7 +24,7 @@ class TimeEntryStrategy(ABC):
         pass
 
     @abstractmethod
-    def validate(self, entry: TimeEntry) -> ValidationResult:
+    def validate(self, entry: TimeEntry, context: TimeEntryValidationContext = None) -> ValidationResult:
         """
         Abstract method to validate a TimeEntry object. Subclasses must implement this method
         to provide specific validation behavior based on different rules or conditions.
@@ -34,6 +36,9 @@ class TimeEntryStrategy(ABC):
         :param entry: The TimeEntry object to validate, which contains data such as start and end times,
                       break durations, and potentially other metadata pertinent to the validation logic.
         :type entry: TimeEntry
+        :param context: The data of the user loaded by the caller, e.g. the contract information. Strategies read
+                        everything beyond the entry from the context instead of querying it.
+        :type context: TimeEntryValidationContext
 
         :return: A ValidationResult object encapsulating the outcome of the validation process.
                  The result includes a status indicating success or failure and, optionally, a message
@@ -49,3 +54,19 @@ class TimeEntryStrategy(ABC):
             This method is abstract and must be overridden by subclasses; it should not be called directly.
         """
         pass
+
+    def validate_batch(self, batch: TimeEntryBatch, context: TimeEntryValidationContext = None) -> list:
+        """
+        Validates all TimeEntry objects of a batch. Strategies whose rule can be evaluated on the arrays of the
+        batch override this method; by default every entry is validated on its own.
+
+        :param batch: The batch of TimeEntry objects to validate.
+        :type batch: TimeEntryBatch
+        :param context: The data of the user loaded by the caller.
+        :type context: TimeEntryValidationContext
+
+        :return: A list containing the ValidationResult of every entry, in the order of the entries. Each result
+                 equals the result of validate for the entry.
+        :rtype: list[ValidationResult]
+        """
+        return [self.validate(entry, context) for entry in batch.entries]
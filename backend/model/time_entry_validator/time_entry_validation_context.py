@@ -0,0 +1,18 @@
+class TimeEntryValidationContext:
+    """
+    Holds the data of a user that validation strategies need besides the time entries themselves. The service
+    validating the entries loads this data once and passes it to the validator, so strategies neither query the
+    database nor create services.
+
+    Attributes:
+        contract_info (ContractInfo): A snapshot of the contract information of the user, or None if unknown.
+    """
+
+    def __init__(self, contract_info=None):
+        """
+        Initializes a new validation context.
+
+        :param contract_info: The contract information of the user.
+        :type contract_info: ContractInfo
+        """
+        self.contract_info = contract_info
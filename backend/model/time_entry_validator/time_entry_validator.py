@@ -1,4 +1,6 @@
 from model.time_entry import TimeEntry
+from model.time_entry_validator.time_entry_batch import TimeEntryBatch
+from model.time_entry_validator.time_entry_validation_context import TimeEntryValidationContext
 
 
 class TimeEntryValidator:
@@ -11,6 +13,9 @@ class TimeEntryValidator:
         validationRules (list): A list of validation rules that `TimeEntry` objects will be checked against.
     """
 
+    # Number of entries from which validating them as a batch is faster than validating them one by one
+    MIN_BATCH_SIZE = 64
+
     def __init__(self):
         """
         Constructs a TimeEntryValidator with an empty list, ready to accept validation strategies.
@@ -44,13 +49,16 @@ class TimeEntryValidator:
         """
         self.validationRules.remove(rule)
 
-    def validate_entry(self, timeEntry: TimeEntry):
+    def validate_entry(self, timeEntry: TimeEntry, context: TimeEntryValidationContext = None):
         """
         Validates a `TimeEntry` object against all active validation strategies. This method applies
         each rule to the `TimeEntry` object and collects the results.
 
         :param timeEntry: The `TimeEntry` object to validate, containing all necessary data for the validations.
         :type timeEntry: TimeEntry
+        :param context: The data of the user the strategies validate the entry against, e.g. the contract
+                        information. It is passed to every strategy unchanged.
+        :type context: TimeEntryValidationContext
 
         :return: A list of `ValidationResult` objects, each representing the outcome of a single validation strategy
         applied to the `TimeEntry` object. Each result includes information about whether the validation was
@@ -58,6 +66,33 @@ class TimeEntryValidator:
         """
         results = []
         for rule in self.validationRules:
-            result = rule.validate(timeEntry)
+            result = rule.validate(timeEntry, context)
             results.append(result)
         return results
+
+    def validate_entries(self, time_entries: list, context: TimeEntryValidationContext = None):
+        """
+        Validates several `TimeEntry` objects against all active validation strategies. The entries are packed
+        into a `TimeEntryBatch` once, so strategies supporting batches evaluate their rule for all entries with
+        vectorized operations. Batches smaller than MIN_BATCH_SIZE are validated entry by entry, as packing them
+        costs more than it saves.
+
+        :param time_entries: The `TimeEntry` objects to validate.
+        :type time_entries: list[TimeEntry]
+        :param context: The data of the user the strategies validate the entries against.
+        :type context: TimeEntryValidationContext
+
+        :return: A list containing, for every entry, the list of `ValidationResult` objects that validate_entry
+                 returns for it, in the order of the entries. :rtype: list[list[ValidationResult]]
+        """
+        time_entries = list(time_entries)
+        if len(time_entries) < self.MIN_BATCH_SIZE:
+            return [self.validate_entry(time_entry, context) for time_entry in time_entries]
+        batch = TimeEntryBatch(time_entries)
+        if not batch.vectorized:
+            return [self.validate_entry(time_entry, context) for time_entry in batch.entries]
+        results = [[] for _ in batch.entries]
+        for rule in self.validationRules:
+            for entry_results, result in zip(results, rule.validate_batch(batch, context)):
+                entry_results.append(result)
+        return results
@@ -1,10 +1,8 @@
-from flask_jwt_extended import get_jwt_identity, jwt_required
-
 from controller.input_validator.validation_result import ValidationResult
 from controller.input_validator.validation_status import ValidationStatus
 from model.time_entry import TimeEntry
 from model.time_entry_validator.time_entry_strategy import TimeEntryStrategy
-import service.user_service
+from model.time_entry_validator.time_entry_validation_context import TimeEntryValidationContext
 
 
 class VacationTimeStrategy(TimeEntryStrategy):
@@ -13,23 +11,21 @@ class VacationTimeStrategy(TimeEntryStrategy):
     to according to their contract.
     """
 
-    @jwt_required()
-    def validate(self, entry: TimeEntry) -> ValidationResult:
+    def validate(self, entry: TimeEntry, context: TimeEntryValidationContext = None) -> ValidationResult:
         """
-        Validates a single TimeEntry against allowed vacation time.
+        Validates a single TimeEntry against allowed vacation time. The remaining vacation time is read from the
+        contract snapshot of the validation context.
 
         :param entry: The TimeEntry object to validate.
         :type entry: TimeEntry
+        :param context: The validation context holding the contract information of the user.
+        :type context: TimeEntryValidationContext
 
         :return: A ValidationResult indicating whether the vacation entry does not exceed the allowed vacation time.
         :rtype: ValidationResult
         """
-
-        user = get_jwt_identity()
-        user_service = service.user_service.UserService()
-        contract_info = user_service.get_contract_info(user).data
-        if contract_info.vacation_minutes - entry.get_duration() < 0:
+        if context is None or context.contract_info is None:
+            return ValidationResult(ValidationStatus.FAILURE, "No contract information available for validation.")
+        if context.contract_info.vacation_minutes - entry.get_duration() < 0:
             return ValidationResult(ValidationStatus.FAILURE, "Vacation time exceeds the remaining vacation time.")
         return ValidationResult(ValidationStatus.SUCCESS, "Vacation time is valid.")
-
-
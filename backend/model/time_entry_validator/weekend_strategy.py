@@ -1,6 +1,8 @@
 from datetime import datetime
 from model.time_entry import TimeEntry
+from model.time_entry_validator.time_entry_batch import TimeEntryBatch
 from model.time_entry_validator.time_entry_strategy import TimeEntryStrategy
+from model.time_entry_validator.time_entry_validation_context import TimeEntryValidationContext
 from controller.input_validator.validation_result import ValidationResult
 from controller.input_validator.validation_status import ValidationStatus
 
@@ -12,13 +14,15 @@ class WeekendStrategy(TimeEntryStrategy):
     if it does.
     """
 
-    def validate(self, entry: TimeEntry) -> ValidationResult:
+    def validate(self, entry: TimeEntry, context: TimeEntryValidationContext = None) -> ValidationResult:
         """
         Validates a given TimeEntry to check if it occurs on a weekend (Saturday or Sunday).
         If the date of the time entry is a weekend, the validation will fail.
 
         :param entry: The TimeEntry object whose date needs to be validated against weekend days.
         :type entry: TimeEntry
+        :param context: The validation context. This rule depends on the entry only.
+        :type context: TimeEntryValidationContext
 
         :return: A ValidationResult object that indicates whether the entry date is on a weekend.
                  It returns failure if the date is on a Saturday or Sunday.
@@ -33,3 +37,26 @@ class WeekendStrategy(TimeEntryStrategy):
                                     "Working on weekends is not allowed by institute policy: Sunday.")
 
         return ValidationResult(ValidationStatus.SUCCESS, "Entry date is a weekday.")
+
+    def validate_batch(self, batch: TimeEntryBatch, context: TimeEntryValidationContext = None) -> list:
+        """
+        Validates all TimeEntry objects of a batch against weekend days with vectorized operations.
+
+        :param batch: The batch of TimeEntry objects to validate.
+        :type batch: TimeEntryBatch
+        :param context: The validation context. This rule depends on the entries only.
+        :type context: TimeEntryValidationContext
+
+        :return: A list containing the ValidationResult of every entry, in the order of the entries. Entries with
+                 the same outcome share a result.
+        :rtype: list[ValidationResult]
+        """
+        # The epoch was a Thursday, so this is the weekday as returned by datetime.weekday
+        days_of_week = (batch.start_days + 3) % 7
+        weekday = ValidationResult(ValidationStatus.SUCCESS, "Entry date is a weekday.")
+        saturday = ValidationResult(ValidationStatus.FAILURE,
+                                    "Working on weekends is not allowed by institute policy: Saturday.")
+        sunday = ValidationResult(ValidationStatus.FAILURE,
+                                  "Working on weekends is not allowed by institute policy: Sunday.")
+        results = [weekday, weekday, weekday, weekday, weekday, saturday, sunday]
+        return [results[day_of_week] for day_of_week in days_of_week.tolist()]
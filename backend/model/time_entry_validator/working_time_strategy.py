@@ -2,8 +2,13 @@ from controller.input_validator.validation_result import ValidationResult
 from controller.input_validator.validation_status import ValidationStatus
 from model.time_entry import TimeEntry
 from model.time_entry_validator.time_entry_strategy import TimeEntryStrategy
+from model.time_entry_validator.time_entry_validation_context import TimeEntryValidationContext
 import datetime
 
+import numpy as np
+
+from model.time_entry_validator.time_entry_batch import TimeEntryBatch
+
 
 class WorkingTimeStrategy(TimeEntryStrategy):
     """
@@ -22,12 +27,14 @@ class WorkingTimeStrategy(TimeEntryStrategy):
 
     OUT_OF_BUSINESS_HOURS_THRESHOLD = 120
 
-    def validate(self, entry: TimeEntry) -> ValidationResult:
+    def validate(self, entry: TimeEntry, context: TimeEntryValidationContext = None) -> ValidationResult:
         """
         Validates a single TimeEntry against defined business hours and maximum working hours constraints.
 
         :param entry: The TimeEntry object to validate. It should have attributes for start and end times.
         :type entry: TimeEntry
+        :param context: The validation context. This rule depends on the entry only.
+        :type context: TimeEntryValidationContext
 
         :return: A ValidationResult indicating whether the time entry meets the established business rules.
                  This includes validation against the start and end times for being within business hours,
@@ -83,3 +90,54 @@ class WorkingTimeStrategy(TimeEntryStrategy):
             return ValidationResult(ValidationStatus.FAILURE, "Working time exceeds the permitted 10 hours.")
 
         return ValidationResult(ValidationStatus.SUCCESS, "Time entry is valid.")
+
+    def validate_batch(self, batch: TimeEntryBatch, context: TimeEntryValidationContext = None) -> list:
+        """
+        Validates all TimeEntry objects of a batch against the business hours and maximum working hours with
+        vectorized operations. The rules are evaluated exactly like in validate.
+
+        :param batch: The batch of TimeEntry objects to validate.
+        :type batch: TimeEntryBatch
+        :param context: The validation context. This rule depends on the entries only.
+        :type context: TimeEntryValidationContext
+
+        :return: A list containing the ValidationResult of every entry, in the order of the entries. Entries with
+                 the same outcome share a result.
+        :rtype: list[ValidationResult]
+        """
+        business_start = (batch.start_days * TimeEntryBatch.MICROSECONDS_PER_DAY
+                          + self._to_microseconds(self.BUSINESS_START))
+        business_end = batch.end_days * TimeEntryBatch.MICROSECONDS_PER_DAY + self._to_microseconds(self.BUSINESS_END)
+
+        total_outside_business_hours = np.where(
+            batch.start_times < business_start, self._to_minutes(business_start - batch.start_times),
+            np.where(batch.start_times >= business_end, self._to_minutes(batch.start_times - business_end), 0))
+        total_outside_business_hours += np.where(
+            batch.end_times > business_end, self._to_minutes(batch.end_times - business_end),
+            np.where(batch.end_times <= business_start, self._to_minutes(business_start - batch.end_times), 0))
+
+        # Like in validate, the warning for more than 8 hours is returned before the 10 hour limit is checked
+        outcomes = np.select([total_outside_business_hours > self.OUT_OF_BUSINESS_HOURS_THRESHOLD,
+                              total_outside_business_hours > 0,
+                              batch.durations > (self.MAX_WORKING_HOURS * 60)], [0, 1, 2], 3)
+        results = [ValidationResult(ValidationStatus.FAILURE,
+                                    "Entry exceeds the allowed threshold for working outside business hours."),
+                   ValidationResult(ValidationStatus.WARNING,
+                                    "Entry is outside of standard business hours (8 AM to 6 PM)."),
+                   ValidationResult(ValidationStatus.WARNING, "Working time exceeds the maximum allowed 8 hours."),
+                   ValidationResult(ValidationStatus.SUCCESS, "Time entry is valid.")]
+        return [results[outcome] for outcome in outcomes.tolist()]
+
+    @staticmethod
+    def _to_microseconds(time: datetime.time) -> int:
+        """
+        Converts a time of day to microseconds since midnight.
+        """
+        return ((time.hour * 60 + time.minute) * 60 + time.second) * 10 ** 6 + time.microsecond
+
+    @staticmethod
+    def _to_minutes(microseconds: np.ndarray) -> np.ndarray:
+        """
+        Converts non-negative time differences to minutes like timedelta.seconds // 60, which ignores whole days.
+        """
+        return (microseconds // 10 ** 6) % (24 * 60 * 60) // 60
@@ -1,11 +1,10 @@
-from collections import defaultdict
-
 from controller.input_validator.validation_result import ValidationResult
 from controller.input_validator.validation_status import ValidationStatus
+from model.repository.timesheet_repository import TimesheetRepository
 from model.time_entry import TimeEntry
 from model.time_sheet_validator.timesheet_strategy import TimesheetStrategy
 from model.timesheet import Timesheet
-import service.timesheet_service
+from model.timesheet_status import TimesheetStatus
 
 
 class BeforeSignedTimesheetsStrategy(TimesheetStrategy):
@@ -13,9 +12,21 @@ class BeforeSignedTimesheetsStrategy(TimesheetStrategy):
     A strategy for validating that all Timesheets before the current one have been completed.
     """
 
+    def __init__(self, timesheet_repository: TimesheetRepository = None):
+        """
+        Initializes the strategy.
+
+        :param timesheet_repository: The repository the previous timesheet is read from. Defaults to the shared
+                                     TimesheetRepository.
+        """
+        super().__init__()
+        self.timesheet_repository = timesheet_repository or TimesheetRepository.get_instance()
+
     def validate(self, timesheet: Timesheet, time_entries: list[TimeEntry]) -> ValidationResult:
         """
-        Validates that all Timesheets before the current one have been completed.
+        Validates that all Timesheets before the current one have been completed. A timesheet can only be signed
+        once its predecessor is complete, so checking the latest previous Timesheet covers all earlier ones. It is
+        read with a single indexed lookup.
 
         :param timesheet: The Timesheet object associated with the time entries being validated.
         :type timesheet: :class:`model.timesheet.Timesheet`
@@ -28,19 +39,12 @@ class BeforeSignedTimesheetsStrategy(TimesheetStrategy):
         :rtype: :class:`controller.input_validator.validation_result.ValidationResult`
         """
 
-        timesheet_service = service.timesheet_service.TimesheetService()
-        timesheets = timesheet_service.get_timesheets_by_username(timesheet.username).data
-        previous_timesheet = None
-        for i, ts in enumerate(timesheets):
-            if ts.timesheet_id == timesheet.timesheet_id:
-                if i + 1 < len(timesheets):
-                    previous_timesheet = timesheets[i + 1]
-                break
+        previous_timesheet_data = self.timesheet_repository.get_previous_timesheet(timesheet.username,
+                                                                                   timesheet.month, timesheet.year)
 
-        if previous_timesheet is None:
+        if previous_timesheet_data is None:
             return ValidationResult(ValidationStatus.SUCCESS, "No previous Timesheets found.")
-        if previous_timesheet.status.value == "Complete":
+        if previous_timesheet_data['status'] == TimesheetStatus.COMPLETE.value:
             return ValidationResult(ValidationStatus.SUCCESS, "All previous Timesheets are completed.")
         else:
             return ValidationResult(ValidationStatus.FAILURE, "A previous Timesheet is not completed.")
-
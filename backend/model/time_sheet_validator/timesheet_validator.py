@@ -19,7 +19,7 @@ class TimesheetValidator:
         specific validation strategies.
         """
         self.validationRules = []
-        self.time_entry_repository = TimeEntryRepository()
+        self.time_entry_repository = TimeEntryRepository.get_instance()
         self.contract_info = None  # TODO: Add a ContractInfo object for working hours validation
 
     def add_validation_rule(self, rule: TimesheetStrategy):
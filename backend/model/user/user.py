@@ -1,11 +1,8 @@
 from datetime import datetime, timezone
 
-from db import initialize_db
 from model.user.personal_information import PersonalInfo
 from model.user.role import UserRole
 
-db = initialize_db()
-
 
 class User:
     def __init__(self, username: str, password_hash: str, personal_info: PersonalInfo, role: UserRole, 
@@ -3,13 +3,14 @@ from functools import wraps
 
 from flask import jsonify
 from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity, unset_jwt_cookies, create_access_token, \
-    jwt_required
+    jwt_required, get_jwt
 from flask_jwt_extended.exceptions import NoAuthorizationError
 
 from controller.factory.user_factory import UserFactory
 from model.repository.user_repository import UserRepository
 from model.request_result import RequestResult
 from model.user.role import UserRole
+from utils.access_version_table import AccessVersionTable
 from utils.security_utils import SecurityUtils
 
 
@@ -27,7 +28,8 @@ class AuthenticationService:
 
     def create_token(self, username: str, role: UserRole) -> str:
         """
-        Generates a JWT token for a given user with additional claims.
+        Generates a JWT token for a given user with additional claims. The role and the current access version
+        of the user are stored in the token, so that check_access can authorize requests without a database read.
 
         :param username: The username of the user.
         :type username: str
@@ -36,7 +38,7 @@ class AuthenticationService:
         :return: A JWT access token as a string.
         :rtype: str
         """
-        additional_claims = {"role": str(role)}
+        additional_claims = {"role": str(role), "accessVersion": AccessVersionTable.get_version(username)}
         return create_access_token(identity=username, additional_claims=additional_claims)
 
     def get_user_from_token(self):
@@ -129,6 +131,8 @@ class AuthenticationService:
 def check_access(roles: [UserRole] = []): #pragma: no cover
     """
     Decorator function to check if the user has the required role to access the endpoint.
+    The role is taken from the signed token claims. The database is only read if the AccessVersionTable
+    cannot decide, e.g. for tokens without a role claim.
 
     :param roles: A list of UserRole objects that are allowed to access the endpoint.
     :type roles: list[UserRole]
@@ -150,12 +154,18 @@ def check_access(roles: [UserRole] = []): #pragma: no cover
 
             # calling @jwt_required()
             verify_jwt_in_request()
-            # fetching current user from db
-            current_user_data = UserRepository.get_instance().find_by_username(get_jwt_identity())
+            username = get_jwt_identity()
+            claims = get_jwt()
+            known, current_user_role = AccessVersionTable.resolve_role(username, claims.get("role"),
+                                                                       claims.get("accessVersion"))
+            if not known:
+                # fetching current user from db
+                current_user_data = UserRepository.get_instance().find_by_username(username)
+                current_user_role = UserRole.get_role_by_value(current_user_data['role']) \
+                    if current_user_data is not None else None
             # checking user role
-            if current_user_data is None:
+            if current_user_role is None:
                 raise NoAuthorizationError("User not found.")
-            current_user_role = UserRole.get_role_by_value(current_user_data['role'])
             if current_user_role not in roles:
                 raise NoAuthorizationError("Role is not allowed.")
             return f(*args, **kwargs)
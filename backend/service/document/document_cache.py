@@ -0,0 +1,170 @@
+import os
+import tempfile
+import threading
+import uuid
+
+from utils.security_utils import SecurityUtils
+
+
+class DocumentCache:
+    """
+    Disk-backed cache of rendered PDF documents of completed timesheets.
+
+    An entry is keyed by the timesheet ID, a version of the rendered content and the GridFS IDs of both
+    signatures, so a document is never served after its timesheet, its Hiwi or one of the signatures changed.
+    Entries are evicted in least recently used order once the maximum number of entries is exceeded.
+    As the entries are files, they are shared by all worker processes of the host.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @staticmethod
+    def get_instance():
+        """
+        Provides the singleton instance of the DocumentCache.
+
+        :return: The singleton instance of the DocumentCache.
+        """
+        if DocumentCache._instance is None:
+            with DocumentCache._instance_lock:
+                if DocumentCache._instance is None:
+                    DocumentCache._instance = DocumentCache()
+        return DocumentCache._instance
+
+    def __init__(self, cache_dir: str = None, max_entries: int = None):
+        """
+        Initializes the cache.
+
+        :param cache_dir: The directory storing the documents. Defaults to the DOCUMENT_CACHE_DIR environment
+                          variable or a directory in the temporary directory of the system. The directory and the
+                          documents can only be accessed by the user running the application, as the documents
+                          contain personal data.
+        :raises PermissionError: If the directory exists but is owned by another user.
+        :param max_entries: The maximum number of cached documents. Defaults to the DOCUMENT_CACHE_MAX_ENTRIES
+                            environment variable or 500.
+        """
+        self.cache_dir = cache_dir or os.getenv('DOCUMENT_CACHE_DIR',
+                                                os.path.join(tempfile.gettempdir(), 'clockwise_document_cache'))
+        self.max_entries = max_entries or int(os.getenv('DOCUMENT_CACHE_MAX_ENTRIES', '500'))
+        self._lock = threading.Lock()
+        SecurityUtils.ensure_private_directory(self.cache_dir)
+
+    @staticmethod
+    def get_key(timesheet_id: str, content_version: str, signature_ids: list) -> str:
+        """
+        Builds the key of a rendered document.
+
+        :param timesheet_id: The ID of the timesheet.
+        :param content_version: The version of the content of the document.
+        :param signature_ids: The GridFS IDs of the signatures placed on the document.
+        :return: The key of the document.
+        """
+        return "_".join([str(timesheet_id), content_version] + [str(signature_id) for signature_id in signature_ids])
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pdf")
+
+    def contains(self, key: str) -> bool:
+        """
+        Checks whether a document is cached.
+
+        :param key: The key of the document.
+        :return: True if the document is cached, otherwise False.
+        """
+        return os.path.isfile(self._get_path(key))
+
+    def get(self, key: str):
+        """
+        Returns a cached document and marks it as recently used.
+
+        :param key: The key of the document.
+        :return: The rendered document, or None if it is not cached.
+        """
+        path = self._get_path(key)
+        try:
+            with open(path, 'rb') as file:
+                document = file.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return document
+
+    def put(self, key: str, document: bytes):
+        """
+        Caches a rendered document and evicts the least recently used documents if the cache is full.
+
+        :param key: The key of the document.
+        :param document: The rendered document.
+        """
+        path = self._get_path(key)
+        temporary_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with SecurityUtils.open_private_file(temporary_path) as file:
+            file.write(document)
+        # Readers in other threads or processes never see a partially written document
+        os.replace(temporary_path, path)
+        self._evict()
+
+    def invalidate_timesheet(self, timesheet_id: str):
+        """
+        Removes all cached documents of a timesheet, e.g. after its status changed.
+
+        :param timesheet_id: The ID of the timesheet.
+        """
+        self._remove_matching(lambda key: key.startswith(f"{timesheet_id}_"))
+
+    def invalidate_signature(self, signature_id: str):
+        """
+        Removes all cached documents carrying a signature, e.g. after it was replaced or deleted.
+
+        :param signature_id: The GridFS ID of the signature.
+        """
+        self._remove_matching(lambda key: str(signature_id) in key.split("_")[2:])
+
+    def clear(self):
+        """
+        Removes all cached documents.
+        """
+        self._remove_matching(lambda key: True)
+
+    def _get_entries(self) -> list:
+        """
+        Returns the names of all cached documents.
+        """
+        try:
+            return [name for name in os.listdir(self.cache_dir) if name.endswith('.pdf')]
+        except FileNotFoundError:
+            return []
+
+    def _remove_matching(self, predicate):
+        """
+        Removes the cached documents whose key matches the predicate.
+
+        :param predicate: A callable receiving the key of a document.
+        """
+        for name in self._get_entries():
+            if predicate(name[:-len('.pdf')]):
+                self._remove(name)
+
+    def _remove(self, name: str):
+        try:
+            os.remove(os.path.join(self.cache_dir, name))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        """
+        Removes the least recently used documents until the maximum number of entries is kept.
+        """
+        with self._lock:
+            entries = self._get_entries()
+            if len(entries) <= self.max_entries:
+                return
+            last_used = {}
+            for name in entries:
+                try:
+                    last_used[name] = os.path.getmtime(os.path.join(self.cache_dir, name))
+                except FileNotFoundError:
+                    continue
+            for name in sorted(last_used, key=last_used.get)[:len(last_used) - self.max_entries]:
+                self._remove(name)
@@ -0,0 +1,194 @@
+from io import BytesIO
+
+from model.document_data import DocumentData
+from model.file.FileType import FileType
+from model.request_result import RequestResult
+from model.timesheet_status import TimesheetStatus
+from model.user.role import UserRole
+from service.document.signature_cache import SignatureCache
+from service.file_service import FileService
+from service.time_entry_service import TimeEntryService
+from service.timesheet_service import TimesheetService
+from service.user_service import UserService
+
+
+class DocumentSource:
+    """
+    The users, the timesheet and the references of a single document, as loaded by the DocumentDataGatherer.
+    """
+
+    def __init__(self, user, supervisor, timesheet, previous_overtime, signature_id=None,
+                 supervisor_signature_id=None):
+        """
+        Initializes a new DocumentSource object with the given parameters.
+
+        :param user: The Hiwi of the timesheet.
+        :param supervisor: The supervisor of the Hiwi.
+        :param timesheet: The completed timesheet.
+        :param previous_overtime: The overtime balance of the previous month in minutes.
+        :param signature_id: The GridFS ID of the signature of the Hiwi, or None if it is missing.
+        :param supervisor_signature_id: The GridFS ID of the signature of the supervisor, or None if it is missing.
+        """
+        self.user = user
+        self.supervisor = supervisor
+        self.timesheet = timesheet
+        self.previous_overtime = previous_overtime
+        self.signature_id = signature_id
+        self.supervisor_signature_id = supervisor_signature_id
+
+
+class DocumentDataGatherer:
+    """
+    Gathers the data of many documents with a fixed number of queries. Profiles, timesheets, previous-month
+    timesheets, time entries and signature metadata are each loaded with one query for all documents, and every
+    signature image is read once, no matter how many documents of the export carry it. Signatures read before
+    are taken from the SignatureCache.
+    """
+
+    def __init__(self, user_service: UserService, timesheet_service: TimesheetService,
+                 time_entry_service: TimeEntryService, file_service: FileService,
+                 signature_cache: SignatureCache = None):
+        """
+        Initializes the DocumentDataGatherer with the services it reads from.
+
+        :param signature_cache: The cache of the normalized signatures. Defaults to the shared instance.
+        """
+        self.user_service = user_service
+        self.timesheet_service = timesheet_service
+        self.time_entry_service = time_entry_service
+        self.file_service = file_service
+        self.signature_cache = signature_cache or SignatureCache.get_instance()
+
+    def get_document_sources(self, targets: list) -> list:
+        """
+        Checks that the documents can be generated and loads the users, timesheets, previous overtime and
+        signature IDs they are based on.
+
+        :param targets: The documents as dictionaries with username, month and year.
+
+        :return: A list containing a RequestResult with the DocumentSource of each target, in the order of the targets.
+        """
+        users = self.user_service.get_profiles({target["username"] for target in targets})
+        supervisors = self.user_service.get_profiles({user.supervisor for user in users.values()
+                                                      if user.role == UserRole.HIWI})
+        timesheet_keys = []
+        for target in targets:
+            timesheet_keys.append((target["username"], target["month"], target["year"]))
+            timesheet_keys.append((target["username"],) + self._get_previous_month(target["month"], target["year"]))
+        timesheets = self.timesheet_service.get_timesheets_by_months(timesheet_keys)
+        signature_ids = self.file_service.get_image_ids(list(users) + list(supervisors), FileType.SIGNATURE)
+
+        results = []
+        for target in targets:
+            user = users.get(target["username"])
+            if user is None:
+                results.append(RequestResult(False, "User not found.", status_code=404))
+                continue
+            if user.role != UserRole.HIWI:
+                results.append(RequestResult(False, "User is not a HIWI.", status_code=400))
+                continue
+            timesheet = timesheets.get((target["username"], target["month"], target["year"]))
+            if timesheet is None:
+                results.append(RequestResult(False, "Failed to get timesheet data.", status_code=400))
+                continue
+            if timesheet.status != TimesheetStatus.COMPLETE:
+                results.append(RequestResult(False, "Timesheet is not complete.", status_code=400))
+                continue
+            supervisor = supervisors.get(user.supervisor)
+            if supervisor is None or supervisor.role != UserRole.SUPERVISOR:
+                results.append(RequestResult(False, "Supervisor is not a supervisor.", status_code=400))
+                continue
+            previous_timesheet = timesheets.get((target["username"],)
+                                                + self._get_previous_month(target["month"], target["year"]))
+            previous_overtime = previous_timesheet.overtime if previous_timesheet is not None else 0
+            results.append(RequestResult(True, "Document source found.", 200,
+                                         DocumentSource(user, supervisor, timesheet, previous_overtime,
+                                                        signature_ids.get(user.username),
+                                                        signature_ids.get(supervisor.username))))
+        return results
+
+    def gather_document_data(self, document_sources: list) -> list:
+        """
+        Gathers the time entries and signatures of the given documents and builds their document data.
+
+        :param document_sources: The DocumentSource objects of the documents.
+
+        :return: A list containing a RequestResult with the DocumentData of each source, in the order of the sources.
+        """
+        time_entries = self.time_entry_service.get_entries_of_timesheets(
+            [source.timesheet.timesheet_id for source in document_sources])
+        signatures = self._read_signatures({signature_id for source in document_sources
+                                            for signature_id in (source.signature_id, source.supervisor_signature_id)
+                                            if signature_id is not None})
+        results = []
+        for source in document_sources:
+            signature = signatures.get(source.signature_id)
+            supervisor_signature = signatures.get(source.supervisor_signature_id)
+            if signature is None:
+                results.append(RequestResult(False, "Failed to get Hiwi signature.", status_code=400))
+                continue
+            if supervisor_signature is None:
+                results.append(RequestResult(False, "Failed to get supervisor signature.", status_code=400))
+                continue
+            timesheet = source.timesheet
+            # Every document gets its own streams, as the renderer consumes them
+            document = DocumentData(timesheet.month, timesheet.year, source.user.personal_info,
+                                    source.user.contract_info, self._time_format(source.previous_overtime),
+                                    BytesIO(signature), BytesIO(supervisor_signature),
+                                    self._time_format(timesheet.overtime),
+                                    time_entries[str(timesheet.timesheet_id)], "00:00",
+                                    timesheet.last_signature_change)
+            results.append(RequestResult(True, "Document data gathered successfully.", 200, document))
+        return results
+
+    def _read_signatures(self, signature_ids: set) -> dict:
+        """
+        Reads each of the given signature images once, from the cache or from GridFS, and normalizes
+        the images read from GridFS.
+
+        :param signature_ids: The GridFS IDs of the signatures.
+
+        :return: A dictionary mapping the GridFS IDs to the normalized signatures that were found.
+        """
+        signatures = {}
+        for signature_id in signature_ids:
+            signature = self.signature_cache.get(signature_id)
+            if signature is None:
+                signature_stream = self.file_service.get_image_by_id(signature_id)
+                if signature_stream is None:
+                    continue
+                try:
+                    signature = SignatureCache.normalize(signature_stream.read())
+                except OSError:
+                    # An image that cannot be decoded is reported as a missing signature
+                    continue
+                self.signature_cache.put(signature_id, signature)
+            signatures[signature_id] = signature
+        return signatures
+
+    @staticmethod
+    def _get_previous_month(month: int, year: int):
+        """
+        Returns the month preceding the given month.
+
+        :param month: The month
+        :param year: The year of the month
+        :return: A tuple of the previous month and its year
+        """
+        if month > 1:
+            return month - 1, year
+        return 12, year - 1
+
+    @staticmethod
+    def _time_format(minutes: int):
+        """
+        Formats the given number of minutes to a time string.
+
+        :param minutes: The number of minutes to format.
+
+        :return: The formatted time string.
+        """
+        is_negative = minutes < 0
+        hours, minutes = divmod(abs(minutes), 60)
+        formatted_time = f"{'-' if is_negative else ''}{int(hours):02d}:{int(minutes):02d}"
+        return formatted_time
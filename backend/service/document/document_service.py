@@ -1,19 +1,23 @@
+import hashlib
 import os
-from datetime import datetime
-from glob import glob
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from io import BytesIO
-from zipfile import ZipFile
 
-from model.timesheet_status import TimesheetStatus
+from bson import ObjectId
+
+from service.document.document_cache import DocumentCache
+from service.document.document_data_gatherer import DocumentDataGatherer
 from service.document.pdf_generator_strategy import PDFGeneratorStrategy
-from model.document_data import DocumentData
-from model.file.FileType import FileType
 from model.request_result import RequestResult
 from model.user.role import UserRole
 from service.file_service import FileService
 from service.time_entry_service import TimeEntryService
 from service.timesheet_service import TimesheetService
 from service.user_service import UserService
+from utils.zip_stream import ZipStream
 
 
 class DocumentService:
@@ -21,17 +25,34 @@ class DocumentService:
     The DocumentService class is responsible for generating documents.
 
     """
-
-    def __init__(self):
+    # Number of pre-render jobs whose status is kept after they finished
+    MAX_PRERENDER_JOBS = 1000
+    # Number of documents of an export job whose data is gathered with one batch of queries
+    EXPORT_CHUNK_SIZE = 50
+
+    def __init__(self, user_service: UserService = None, time_entry_service: TimeEntryService = None,
+                 timesheet_service: TimesheetService = None, file_service: FileService = None,
+                 render_workers: int = None):
         """
-        Initializes the DocumentService instance.
+        Initializes the DocumentService instance. Services that are not given are created.
 
+        :param render_workers: The number of processes rendering the documents of a bulk export. With more than
+                               one, the documents are rendered by the shared rendering pool of that size. Defaults to
+                               the DOCUMENT_RENDER_WORKERS environment variable, or sequential rendering.
         """
         self.pdf_generator_strategy = PDFGeneratorStrategy()
-        self.user_service = UserService()
-        self.time_entry_service = TimeEntryService()
-        self.timesheet_service = TimesheetService()
-        self.file_service = FileService()
+        self.render_workers = max(render_workers or int(os.getenv('DOCUMENT_RENDER_WORKERS', '1')), 1)
+        self.document_cache = DocumentCache.get_instance()
+        self._prerender_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv('DOCUMENT_PRERENDER_WORKERS', '2')), thread_name_prefix='document-prerender')
+        self._prerender_jobs = OrderedDict()
+        self._prerender_jobs_lock = threading.Lock()
+        self.user_service = user_service or UserService()
+        self.time_entry_service = time_entry_service or TimeEntryService()
+        self.timesheet_service = timesheet_service or TimesheetService()
+        self.file_service = file_service or FileService()
+        self.document_data_gatherer = DocumentDataGatherer(self.user_service, self.timesheet_service,
+                                                           self.time_entry_service, self.file_service)
 
     def generate_multiple_documents(self, usernames: list[str], month: int, year: int, requesting_username: str):
         """
@@ -42,25 +63,22 @@ class DocumentService:
         :param month: The month for which to generate the documents.
         :param year: The year for which to generate the documents.
 
-        :return: The generated documents.
+        :return: A generator streaming the zip file of the generated documents.
         """
-        documents = []
         for username in usernames:
             if not self._check_if_authorized(requesting_username, username):
                 return RequestResult(False, "Unauthorized to generate document", status_code=403)
-            document_generation = self.gather_document_data(month, year, username)
-            if not document_generation.is_successful:
-                return document_generation
-            documents.append(document_generation.data)
-        output_dir = self.pdf_generator_strategy.generate_multiple_documents(documents).data
-        if not output_dir:
-            return RequestResult(False, "Failed to generate documents.", status_code=500)
-        stream = self._create_zip_from_directory(output_dir)
-        return RequestResult(True, "Documents generated successfully.", 200, stream)
+        targets = [{"username": username, "month": month, "year": year} for username in usernames]
+        document_sources = []
+        for document_source_result in self.document_data_gatherer.get_document_sources(targets):
+            if not document_source_result.is_successful:
+                return document_source_result
+            document_sources.append(document_source_result.data)
+        return self._generate_zip(document_sources)
 
     def generate_document(self, month: int, year: int, username: str, requesting_username: str):
         """
-        Generates a document for the given month and year.
+        Generates a document for the given month and year. A document rendered before is served from the cache.
 
         :param month: The month for which to generate the document.
         :param year: The year for which to generate the document.
@@ -70,51 +88,113 @@ class DocumentService:
         """
         if not self._check_if_authorized(requesting_username, username):
             return RequestResult(False, "Unauthorized to generate document", status_code=403)
-        document_generation_result = self.gather_document_data(month, year, username)
+        return self.generate_authorized_document(month, year, username)
+
+    def generate_authorized_document(self, month: int, year: int, username: str):
+        """
+        Generates a document for a requesting user whose authorization has already been checked,
+        e.g. when the export job was created.
+
+        :param month: The month for which to generate the document.
+        :param year: The year for which to generate the document.
+        :param username: The username of the user for which to generate the document.
+
+        :return: The generated document.
+        """
+        document_source_result = self._get_document_source(month, year, username)
+        if not document_source_result.is_successful:
+            return document_source_result
+        document_source = document_source_result.data
+        cache_key = self._get_cache_key(document_source)
+        cached_document = self.document_cache.get(cache_key) if cache_key is not None else None
+        if cached_document is not None:
+            return RequestResult(True, "Document generated successfully", 200,
+                                 self._to_named_stream(cached_document, document_source))
+        document_generation_result = self._gather_document_data(document_source)
         if not document_generation_result.is_successful:
             return document_generation_result
-        return self.pdf_generator_strategy.generate_document(document_generation_result.data)
+        result = self.pdf_generator_strategy.generate_document(document_generation_result.data)
+        if result.is_successful and cache_key is not None:
+            self.document_cache.put(cache_key, result.data.getvalue())
+        return result
 
-    def generate_multiple_documents_by_id(self, timesheet_ids: list[str], requesting_username: str):
+    def generate_authorized_documents(self, targets: list):
         """
-        Generates a zip file containing PDF documents for a specified list of timesheet IDs.
+        Generates the documents of a bulk export for a requesting user whose authorization has already been checked,
+        e.g. when the export job was created. The targets are processed in chunks of EXPORT_CHUNK_SIZE: the data of
+        a chunk is gathered with one batch of queries and its uncached documents are rendered by the rendering pool.
 
-        :param timesheet_ids: The timesheet IDs for which to generate the documents.
+        :param targets: The documents as dictionaries with username, month and year.
 
-        :return: The generated documents.
+        :return: A generator of a RequestResult with the generated document for each target, in the order of the
+                 targets. Each result is yielded as soon as its document is rendered.
         """
+        for start in range(0, len(targets), self.EXPORT_CHUNK_SIZE):
+            yield from self._generate_document_chunk(targets[start:start + self.EXPORT_CHUNK_SIZE])
+
+    def _generate_document_chunk(self, targets: list):
+        """
+        Generates the documents of a chunk of an export, see generate_authorized_documents.
+
+        :param targets: The documents of the chunk as dictionaries with username, month and year.
+
+        :return: A generator of a RequestResult with the generated document for each target.
+        """
+        results = []
+        uncached_sources = []
+        for document_source_result in self.document_data_gatherer.get_document_sources(targets):
+            results.append(document_source_result)
+            if not document_source_result.is_successful:
+                continue
+            document_source = document_source_result.data
+            cache_key = self._get_cache_key(document_source)
+            cached_document = self.document_cache.get(cache_key) if cache_key is not None else None
+            if cached_document is not None:
+                results[-1] = RequestResult(True, "Document generated successfully", 200,
+                                            self._to_named_stream(cached_document, document_source))
+            else:
+                uncached_sources.append((len(results) - 1, cache_key, document_source))
+
+        rendered = {}
         documents = []
-        for timesheet_id in timesheet_ids:
-            timesheet = self.timesheet_service.get_timesheet_by_id(timesheet_id).data
-            if timesheet is None:
-                return RequestResult(False, "Failed to gather document data.", status_code=400)
-            if not self._check_if_authorized(requesting_username, timesheet.username):
-                return RequestResult(False, "Unauthorized to generate document", status_code=403)
-            document_generation_result = self.gather_document_data(timesheet.month, timesheet.year, timesheet.username)
-            if not document_generation_result.is_successful:
-                return document_generation_result
-            documents.append(document_generation_result.data)
-        output_dir = self.pdf_generator_strategy.generate_multiple_documents(documents).data
-        if not output_dir:
-            return RequestResult(False, "Failed to generate documents.", status_code=500)
-        stream = self._create_zip_from_directory(output_dir)
-        return RequestResult(True, "Documents generated successfully.", 200, stream)
+        document_generation_results = self.document_data_gatherer.gather_document_data(
+            [document_source for _, _, document_source in uncached_sources]) if uncached_sources else []
+        for (index, cache_key, _), document_generation_result in zip(uncached_sources, document_generation_results):
+            if document_generation_result.is_successful:
+                rendered[index] = cache_key
+                documents.append(document_generation_result.data)
+            else:
+                results[index] = document_generation_result
+        generated_documents = iter(())
+        if documents:
+            generated_documents = self.pdf_generator_strategy.stream_multiple_documents(documents,
+                                                                                        self.render_workers).data
+
+        for index, result in enumerate(results):
+            if index in rendered:
+                document = next(generated_documents)
+                if rendered[index] is not None:
+                    self.document_cache.put(rendered[index], document.getvalue())
+                result = RequestResult(True, "Document generated successfully", 200, document)
+            yield result
 
-    def _create_zip_from_directory(self, output_dir: str) -> BytesIO:
+    def generate_multiple_documents_by_id(self, timesheet_ids: list[str], requesting_username: str):
         """
-        Creates a zip file from all PDF files in the given directory.
+        Generates a zip file containing PDF documents for a specified list of timesheet IDs.
 
-        :param output_dir: The directory containing the PDF files.
+        :param timesheet_ids: The timesheet IDs for which to generate the documents.
 
-        :return: The zip file as a BytesIO stream.
+        :return: A generator streaming the zip file of the generated documents.
         """
-        stream = BytesIO()
-        with ZipFile(stream, 'w') as zip_file:
-            for file in glob(output_dir + '/*.pdf'):
-                zip_file.write(file, os.path.basename(file))
-                os.remove(file)
-        stream.seek(0)
-        return stream
+        targets_result = self.get_export_targets(requesting_username, timesheet_ids=timesheet_ids)
+        if not targets_result.is_successful:
+            return targets_result
+        document_sources = []
+        for document_source_result in self.document_data_gatherer.get_document_sources(targets_result.data):
+            if not document_source_result.is_successful:
+                return document_source_result
+            document_sources.append(document_source_result.data)
+        return self._generate_zip(document_sources)
 
     def generate_document_in_date_range(self, start_date: datetime, end_date: datetime, username: str, requesting_username: str):
         """
@@ -124,23 +204,254 @@ class DocumentService:
         :param end_date: The end date of the date range.
         :param username: The username of the user for which to generate the document.
 
-        :return: The generated document.
+        :return: A generator streaming the zip file of the generated documents.
         """
         if not self._check_if_authorized(requesting_username, username):
             return RequestResult(False, "Unauthorized to generate document", status_code=403)
-        documents = []
+        targets = []
         while start_date <= end_date:
-            document_generation_result = self.gather_document_data(start_date.month, start_date.year, username)
-            if not document_generation_result.is_successful:
+            targets.append({"username": username, "month": start_date.month, "year": start_date.year})
+            start_date = self._increment_month(start_date)
+        document_sources = [document_source_result.data for document_source_result
+                            in self.document_data_gatherer.get_document_sources(targets)
+                            if document_source_result.is_successful]
+        return self._generate_zip(document_sources, skip_failures=True)
+
+    def get_export_targets(self, requesting_username: str, usernames: list[str] = None, month: int = None,
+                           year: int = None, timesheet_ids: list[str] = None, start_date: datetime = None,
+                           end_date: datetime = None, username: str = None):
+        """
+        Determines the documents of a bulk export and checks that the requesting user may access all of them.
+        The export is given either by usernames with a month and year, by timesheet IDs or by a date range
+        of a single user.
+
+        :param requesting_username: The username of the requesting user.
+        :param usernames: The usernames of the users to export the given month for.
+        :param month: The month to export.
+        :param year: The year to export.
+        :param timesheet_ids: The IDs of the timesheets to export.
+        :param start_date: The start of the date range to export.
+        :param end_date: The end of the date range to export.
+        :param username: The user whose date range is exported.
+
+        :return: A RequestResult containing the documents as a list of dictionaries with username, month and year.
+        """
+        targets = []
+        if usernames and month is not None and year is not None:
+            targets = [{"username": target_username, "month": month, "year": year} for target_username in usernames]
+        elif timesheet_ids:
+            for timesheet_id in timesheet_ids:
+                if not ObjectId.is_valid(timesheet_id):
+                    return RequestResult(False, "Invalid timesheet ID", 400)
+            timesheets = self.timesheet_service.get_timesheets_by_ids(timesheet_ids)
+            for timesheet_id in timesheet_ids:
+                timesheet = timesheets.get(str(timesheet_id))
+                if timesheet is None:
+                    return RequestResult(False, "Failed to gather document data.", status_code=400)
+                targets.append({"username": timesheet.username, "month": timesheet.month, "year": timesheet.year})
+        elif start_date and end_date and username:
+            while start_date <= end_date:
+                targets.append({"username": username, "month": start_date.month, "year": start_date.year})
                 start_date = self._increment_month(start_date)
+        else:
+            return RequestResult(False, "Missing required fields", 400)
+        for target_username in {target["username"] for target in targets}:
+            if not self._check_if_authorized(requesting_username, target_username):
+                return RequestResult(False, "Unauthorized to generate document", status_code=403)
+        return RequestResult(True, "Export targets determined", 200, targets)
+
+    def _generate_zip(self, document_sources: list, skip_failures: bool = False):
+        """
+        Generates the documents of the given sources and streams them as a zip file. Cached documents are
+        served as they are, the data of all other documents is gathered up front in one batch and the documents
+        are rendered while the zip file is sent.
+
+        :param document_sources: The DocumentSource objects of the documents.
+        :param skip_failures: Whether documents whose data cannot be gathered are left out instead of failing.
+
+        :return: A generator streaming the zip file of the generated documents.
+        """
+        cache_keys = [self._get_cache_key(document_source) for document_source in document_sources]
+        # The cache is checked once per document, as other threads may add or evict documents meanwhile
+        cached = [cache_key is not None and self.document_cache.contains(cache_key) for cache_key in cache_keys]
+        uncached_indices = [index for index, is_cached in enumerate(cached) if not is_cached]
+        document_generation_results = dict(zip(uncached_indices, self.document_data_gatherer.gather_document_data(
+            [document_sources[index] for index in uncached_indices])))
+        entries = []
+        documents = []
+        for index, (document_source, cache_key) in enumerate(zip(document_sources, cache_keys)):
+            if cached[index]:
+                entries.append((cache_key, document_source, False))
                 continue
+            document_generation_result = document_generation_results[index]
+            if not document_generation_result.is_successful:
+                if skip_failures:
+                    continue
+                return document_generation_result
             documents.append(document_generation_result.data)
-            start_date = self._increment_month(start_date)
-        output_dir = self.pdf_generator_strategy.generate_multiple_documents(documents).data
-        if not output_dir:
+            entries.append((cache_key, document_source, True))
+        generated_documents = self.pdf_generator_strategy.stream_multiple_documents(documents,
+                                                                                    self.render_workers).data
+        if generated_documents is None:
             return RequestResult(False, "Failed to generate documents.", status_code=500)
-        stream = self._create_zip_from_directory(output_dir)
-        return RequestResult(True, "Documents generated successfully.", 200, stream)
+        return RequestResult(True, "Documents generated successfully.", 200,
+                             ZipStream.stream(self._merge_cached_documents(entries, generated_documents)))
+
+    def _merge_cached_documents(self, entries: list, generated_documents):
+        """
+        Yields the documents of a bulk export in order, taking each one from the cache or the rendered documents.
+        Rendered documents are added to the cache.
+
+        :param entries: The (cache key, document source, rendered) tuples of the documents.
+        :param generated_documents: The generator of the rendered documents.
+
+        :return: A generator of the documents as named BytesIO streams.
+        """
+        for cache_key, document_source, rendered in entries:
+            if rendered:
+                document = next(generated_documents)
+                if cache_key is not None:
+                    self.document_cache.put(cache_key, document.getvalue())
+                yield document
+                continue
+            cached_document = self.document_cache.get(cache_key)
+            if cached_document is not None:
+                yield self._to_named_stream(cached_document, document_source)
+                continue
+            # The document was evicted after the export started
+            document_generation_result = self._gather_document_data(document_source)
+            if document_generation_result.is_successful:
+                yield self.pdf_generator_strategy.generate_document(document_generation_result.data).data
+
+    def _get_cache_key(self, document_source):
+        """
+        Builds the cache key of a document. Besides the timesheet ID, the key contains a version of all rendered
+        values that are not frozen with the timesheet and the IDs of both signatures, as a new signature gets a
+        new GridFS ID. All values are part of the document source, so no query is needed.
+
+        :param document_source: The DocumentSource of the document.
+
+        :return: The cache key, or None if one of the signatures is missing.
+        """
+        if document_source.signature_id is None or document_source.supervisor_signature_id is None:
+            return None
+        user = document_source.user
+        timesheet = document_source.timesheet
+        content = [str(timesheet.last_signature_change), timesheet.overtime, document_source.previous_overtime,
+                   user.personal_info.to_dict(), user.contract_info.hourly_wage, user.contract_info.working_hours]
+        content_version = hashlib.sha256(repr(content).encode('utf-8')).hexdigest()[:16]
+        return DocumentCache.get_key(timesheet.timesheet_id, content_version,
+                                     [document_source.signature_id, document_source.supervisor_signature_id])
+
+    def _to_named_stream(self, document: bytes, document_source) -> BytesIO:
+        """
+        Wraps a cached document in a BytesIO stream named like a rendered document.
+
+        :param document: The cached document.
+        :param document_source: The DocumentSource of the document.
+
+        :return: The named stream.
+        """
+        stream = BytesIO(document)
+        stream.name = self.pdf_generator_strategy.get_file_name(document_source.user.personal_info,
+                                                                document_source.timesheet.month,
+                                                                document_source.timesheet.year)
+        return stream
+
+    def prerender_document(self, timesheet_id: str):
+        """
+        Enqueues a background job rendering the document of an approved timesheet into the cache,
+        so a later download is served without rendering.
+
+        :param timesheet_id: The ID of the approved timesheet.
+
+        :return: The status of the enqueued job.
+        """
+        timesheet_id = str(timesheet_id)
+        self._set_prerender_status(timesheet_id, "Queued")
+        self._prerender_executor.submit(self._prerender, timesheet_id)
+        return RequestResult(True, "Document pre-rendering enqueued", 202, self._get_prerender_job(timesheet_id))
+
+    def get_prerender_status(self, timesheet_id: str, requesting_username: str):
+        """
+        Retrieves the status of the pre-render job of a timesheet.
+
+        :param timesheet_id: The ID of the timesheet.
+        :param requesting_username: The username of the requesting user.
+
+        :return: The status of the job, one of Queued, Rendering, Done and Failed.
+        """
+        if not ObjectId.is_valid(timesheet_id):
+            return RequestResult(False, "Invalid timesheet ID", 400)
+        timesheet = self.timesheet_service.get_timesheet_by_id(timesheet_id).data
+        if timesheet is None:
+            return RequestResult(False, "Timesheet not found", 404)
+        if not self._check_if_authorized(requesting_username, timesheet.username):
+            return RequestResult(False, "Unauthorized to access document", status_code=403)
+        job = self._get_prerender_job(timesheet_id)
+        if job is None:
+            return RequestResult(False, "No pre-render job found", 404)
+        return RequestResult(True, "Pre-render job found", 200, job)
+
+    def _prerender(self, timesheet_id: str):
+        """
+        Renders the document of a timesheet into the cache. Runs in a thread of the pre-render pool.
+
+        :param timesheet_id: The ID of the timesheet.
+        """
+        self._set_prerender_status(timesheet_id, "Rendering")
+        try:
+            timesheet = self.timesheet_service.get_timesheet_by_id(timesheet_id).data
+            if timesheet is None:
+                self._set_prerender_status(timesheet_id, "Failed", "Timesheet not found")
+                return
+            document_source_result = self._get_document_source(timesheet.month, timesheet.year, timesheet.username)
+            if not document_source_result.is_successful:
+                self._set_prerender_status(timesheet_id, "Failed", document_source_result.message)
+                return
+            document_source = document_source_result.data
+            cache_key = self._get_cache_key(document_source)
+            if cache_key is None:
+                self._set_prerender_status(timesheet_id, "Failed", "Failed to get signatures.")
+                return
+            if not self.document_cache.contains(cache_key):
+                document_generation_result = self._gather_document_data(document_source)
+                if not document_generation_result.is_successful:
+                    self._set_prerender_status(timesheet_id, "Failed", document_generation_result.message)
+                    return
+                result = self.pdf_generator_strategy.generate_document(document_generation_result.data)
+                self.document_cache.put(cache_key, result.data.getvalue())
+            self._set_prerender_status(timesheet_id, "Done")
+        except Exception as e:  # pragma: no cover
+            # The job runs detached from any request, so every error is reported through its status
+            self._set_prerender_status(timesheet_id, "Failed", str(e))
+
+    def _set_prerender_status(self, timesheet_id: str, status: str, message: str = None):
+        """
+        Updates the status of a pre-render job and forgets the oldest jobs if too many are tracked.
+
+        :param timesheet_id: The ID of the timesheet.
+        :param status: The new status of the job.
+        :param message: An optional message, e.g. the reason of a failure.
+        """
+        with self._prerender_jobs_lock:
+            self._prerender_jobs.pop(timesheet_id, None)
+            self._prerender_jobs[timesheet_id] = {"timesheetId": timesheet_id, "status": status, "message": message,
+                                                  "updatedAt": datetime.now(timezone.utc).isoformat()}
+            while len(self._prerender_jobs) > self.MAX_PRERENDER_JOBS:
+                self._prerender_jobs.popitem(last=False)
+
+    def _get_prerender_job(self, timesheet_id: str):
+        """
+        Returns a copy of the tracked pre-render job of a timesheet.
+
+        :param timesheet_id: The ID of the timesheet.
+
+        :return: The job, or None if no job is tracked for the timesheet.
+        """
+        with self._prerender_jobs_lock:
+            job = self._prerender_jobs.get(str(timesheet_id))
+            return dict(job) if job is not None else None
 
     def _increment_month(self, date):
         """
@@ -162,45 +473,33 @@ class DocumentService:
 
         :return: The document data.
         """
-        user = self.user_service.get_profile(username)
-        if user.role != UserRole.HIWI:
-            return RequestResult(False, "User is not a HIWI.", status_code=400)
-        result = self.timesheet_service.get_timesheet(username, month, year)
-        if result.status_code != 200:
-            return RequestResult(False, "Failed to get timesheet data.", status_code=400)
-        if result.data.status != TimesheetStatus.COMPLETE:
-            return RequestResult (False, "Timesheet is not complete.", status_code=400)
-        supervisor = self.user_service.get_profile(user.supervisor)
-        if supervisor.role != UserRole.SUPERVISOR:
-            return RequestResult(False, "Supervisor is not a supervisor.", status_code=400)
-        timesheet = result.data
-        time_entries = self.time_entry_service.get_entries_of_timesheet(timesheet.timesheet_id).data
-        signature_stream = self.file_service.get_image(username, FileType.SIGNATURE)
-        supervisor_signature_stream = self.file_service.get_image(supervisor.username, FileType.SIGNATURE)
-        previous_overtime = self.timesheet_service.get_previous_overtime(username, month, year)
-        if signature_stream is None:
-            return RequestResult(False, "Failed to get Hiwi signature.", status_code=400)
-        if supervisor_signature_stream is None:
-            return RequestResult(False, "Failed to get supervisor signature.", status_code=400)
-        document = DocumentData(month, year, user.personal_info, user.contract_info, self._time_format(previous_overtime), signature_stream,
-                                supervisor_signature_stream, self._time_format(timesheet.overtime), time_entries,
-                                "00:00",
-                                timesheet.last_signature_change)
-        return RequestResult(True, "Document data gathered successfully.", 200, document)
-
-    def _time_format(self, minutes: int):
-        """
-        Formats the given number of minutes to a time string.
-
-        :param minutes: The number of minutes to format.
-
-        :return: The formatted time string.
-        """
-
-        is_negative = minutes < 0
-        hours, minutes = divmod(abs(minutes), 60)
-        formatted_time = f"{'-' if is_negative else ''}{int(hours):02d}:{int(minutes):02d}"
-        return formatted_time
+        document_source_result = self._get_document_source(month, year, username)
+        if not document_source_result.is_successful:
+            return document_source_result
+        return self._gather_document_data(document_source_result.data)
+
+    def _get_document_source(self, month: int, year: int, username: str):
+        """
+        Checks that a document can be generated and retrieves the users and the timesheet it is based on.
+
+        :param month: The month of the document.
+        :param year: The year of the document.
+        :param username: The username of the user of the document.
+
+        :return: A RequestResult containing the DocumentSource of the document.
+        """
+        return self.document_data_gatherer.get_document_sources([{"username": username, "month": month,
+                                                                  "year": year}])[0]
+
+    def _gather_document_data(self, document_source):
+        """
+        Gathers the time entries and signatures of a document.
+
+        :param document_source: The DocumentSource of the document.
+
+        :return: The document data.
+        """
+        return self.document_data_gatherer.gather_document_data([document_source])[0]
 
     def _check_if_authorized(self, requesting_username: str, username: str):
         """
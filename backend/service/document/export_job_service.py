@@ -0,0 +1,215 @@
+import os
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from zipfile import ZipFile, ZipInfo
+
+from model.request_result import RequestResult
+from service.document.document_service import DocumentService
+from utils.security_utils import SecurityUtils
+
+
+class ExportJobService:
+    """
+    Runs bulk document exports as background jobs. Creating a job only determines the documents and checks
+    the authorization of the requesting user; gathering, rendering and zipping happen in a bounded pool of
+    worker threads while the client polls the progress of the job. The finished zip file is kept on disk
+    until the job expires. The export directory and the zip files are only accessible to the user running
+    the application.
+
+    The jobs are tracked in memory and are therefore local to a worker process. Zip files whose job is unknown,
+    e.g. because they were left by a previous process, are removed once they are older than the time to live.
+    """
+
+    # Statuses of the jobs that count towards the limit of jobs per user
+    UNFINISHED_STATUSES = ("Queued", "Running")
+
+    def __init__(self, document_service: DocumentService = None):
+        """
+        Initializes the ExportJobService.
+
+        :param document_service: The DocumentService generating the documents. A new instance is created if none
+                                 is given.
+        """
+        self.document_service = document_service or DocumentService()
+        self.export_dir = os.getenv('DOCUMENT_EXPORT_DIR',
+                                    os.path.join(tempfile.gettempdir(), 'clockwise_document_exports'))
+        # Seconds for which a job and its zip file are kept after the job finished
+        self.job_ttl = int(os.getenv('DOCUMENT_EXPORT_TTL_SECONDS', '3600'))
+        self.max_jobs_per_user = int(os.getenv('DOCUMENT_EXPORT_MAX_JOBS_PER_USER', '3'))
+        self._executor = ThreadPoolExecutor(max_workers=int(os.getenv('DOCUMENT_EXPORT_WORKERS', '2')),
+                                            thread_name_prefix='document-export')
+        self._jobs = {}
+        self._lock = threading.Lock()
+        SecurityUtils.ensure_private_directory(self.export_dir)
+        self._remove_stale_files()
+
+    def create_export_job(self, requesting_username: str, **criteria):
+        """
+        Creates an export job and starts it in the background.
+
+        :param requesting_username: The username of the requesting user.
+        :param criteria: The documents to export, as accepted by DocumentService.get_export_targets.
+
+        :return: A RequestResult containing the ID of the created job, or a 429 result if the user already has
+                 the maximum number of unfinished jobs.
+        """
+        targets_result = self.document_service.get_export_targets(requesting_username, **criteria)
+        if not targets_result.is_successful:
+            return targets_result
+        job_id = uuid.uuid4().hex
+        job = {
+            "jobId": job_id,
+            "status": "Queued",
+            "requestedBy": requesting_username,
+            "total": len(targets_result.data),
+            "rendered": 0,
+            "failures": [],
+            "createdAt": datetime.now(timezone.utc).isoformat(),
+            "finishedAt": None,
+            "_finished": None,
+            "_path": os.path.join(self.export_dir, f"{job_id}.zip")
+        }
+        with self._lock:
+            unfinished_jobs = sum(1 for other_job in self._jobs.values()
+                                  if other_job["requestedBy"] == requesting_username
+                                  and other_job["status"] in self.UNFINISHED_STATUSES)
+            if unfinished_jobs >= self.max_jobs_per_user:
+                return RequestResult(False, "Too many export jobs in progress", 429)
+            self._jobs[job_id] = job
+        self._executor.submit(self._run_export_job, job_id, targets_result.data)
+        return RequestResult(True, "Export job created", 202, {"jobId": job_id})
+
+    def get_export_job(self, job_id: str, requesting_username: str):
+        """
+        Retrieves the progress of an export job.
+
+        :param job_id: The ID of the job.
+        :param requesting_username: The username of the requesting user. Only the creator may access a job.
+
+        :return: A RequestResult containing the status, the number of rendered and total documents and the failures.
+        """
+        job_result = self._get_job(job_id, requesting_username)
+        if not job_result.is_successful:
+            return job_result
+        job = job_result.data
+        return RequestResult(True, "Export job found", 200,
+                             {key: value for key, value in job.items() if not key.startswith("_")})
+
+    def get_export_file(self, job_id: str, requesting_username: str):
+        """
+        Retrieves the zip file of a finished export job.
+
+        :param job_id: The ID of the job.
+        :param requesting_username: The username of the requesting user. Only the creator may access a job.
+
+        :return: A RequestResult containing the path of the zip file.
+        """
+        job_result = self._get_job(job_id, requesting_username)
+        if not job_result.is_successful:
+            return job_result
+        job = job_result.data
+        if job["status"] != "Done":
+            return RequestResult(False, "Export job is not finished", 409)
+        if not os.path.isfile(job["_path"]):
+            return RequestResult(False, "Export file not found", 404)
+        return RequestResult(True, "Export file found", 200, job["_path"])
+
+    def expire_export_jobs(self):
+        """
+        Removes the finished jobs whose time to live has passed, together with their zip files, and the zip files
+        of unknown jobs that are older than the time to live.
+
+        :return: A RequestResult containing the number of expired jobs.
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired_jobs = [job for job in self._jobs.values()
+                            if job["_finished"] is not None and now - job["_finished"] > self.job_ttl]
+            for job in expired_jobs:
+                del self._jobs[job["jobId"]]
+        for job in expired_jobs:
+            try:
+                os.remove(job["_path"])
+            except FileNotFoundError:
+                pass
+        self._remove_stale_files()
+        return RequestResult(True, f"{len(expired_jobs)} export jobs expired", 200, len(expired_jobs))
+
+    def _remove_stale_files(self):
+        """
+        Removes the zip files in the export directory that belong to no job of this process and were last
+        modified before the time to live. A running job keeps writing its file and a finished job is kept for
+        the time to live, so the files of live jobs of other processes are not removed.
+        """
+        with self._lock:
+            job_paths = {job["_path"] for job in self._jobs.values()}
+        now = time.time()
+        for name in os.listdir(self.export_dir):
+            path = os.path.join(self.export_dir, name)
+            if not name.endswith(".zip") or path in job_paths:
+                continue
+            try:
+                if now - os.path.getmtime(path) > self.job_ttl:
+                    os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _get_job(self, job_id: str, requesting_username: str):
+        """
+        Retrieves a copy of a job after checking that the requesting user created it.
+
+        :param job_id: The ID of the job.
+        :param requesting_username: The username of the requesting user.
+
+        :return: A RequestResult containing the job.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job = dict(job, failures=list(job["failures"]))
+        if job is None:
+            return RequestResult(False, "Export job not found", 404)
+        if job["requestedBy"] != requesting_username:
+            return RequestResult(False, "Unauthorized to access export job", 403)
+        return RequestResult(True, "Export job found", 200, job)
+
+    def _update_job(self, job_id: str, **values):
+        with self._lock:
+            self._jobs[job_id].update(values)
+
+    def _run_export_job(self, job_id: str, targets: list):
+        """
+        Generates the documents of an export job and writes them into the zip file of the job. The documents are
+        gathered in chunks and rendered by the shared rendering pool, see DocumentService.generate_authorized_documents,
+        and the progress is updated whenever a document is finished. Runs in a thread of the export pool.
+
+        :param job_id: The ID of the job.
+        :param targets: The documents to export, as dictionaries with username, month and year.
+        """
+        self._update_job(job_id, status="Running")
+        path = self._jobs[job_id]["_path"]
+        try:
+            # All entries share one timestamp, like the entries of a streamed export
+            date_time = datetime.now().timetuple()[:6]
+            with SecurityUtils.open_private_file(path) as file, ZipFile(file, 'w') as zip_file:
+                for target, result in zip(targets, self.document_service.generate_authorized_documents(targets)):
+                    with self._lock:
+                        job = self._jobs[job_id]
+                        if result.is_successful:
+                            job["rendered"] += 1
+                        else:
+                            job["failures"].append(dict(target, message=result.message))
+                    if result.is_successful:
+                        zip_file.writestr(ZipInfo(result.data.name, date_time=date_time), result.data.getvalue())
+            status = "Done"
+        except Exception as e:  # pragma: no cover
+            # The job runs detached from any request, so every error is reported through its status
+            with self._lock:
+                self._jobs[job_id]["failures"].append({"message": str(e)})
+            status = "Failed"
+        self._update_job(job_id, status=status, finishedAt=datetime.now(timezone.utc).isoformat(),
+                         _finished=time.monotonic())
@@ -1,16 +1,83 @@
+import atexit
+import multiprocessing
 import os
-from datetime import datetime
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 
+import fitz
 import pytz
-from fillpdf import fillpdfs
 
 from model.vacation_entry import VacationEntry
 from service.document.document_generator_strategy import DocumentGeneratorStrategy
+from service.document.pdf_template_engine import PDFTemplateEngine
 from model.document_data import DocumentData
 from model.request_result import RequestResult
 from model.time_entry_type import TimeEntryType
 
 
+def _render_document(render_job: dict) -> bytes:
+    """
+    Renders a prepared PDF document in a worker process of the rendering pool.
+
+    :param render_job: The render job created by PDFGeneratorStrategy.create_render_job.
+
+    :return: The rendered PDF document.
+    """
+    return PDFGeneratorStrategy().render(render_job)
+
+
+_render_pools = {}
+_render_pool_lock = threading.Lock()
+
+
+def get_render_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Returns the pool of processes rendering documents with the given number of workers, shared by all requests of the
+    worker process. The pool is created on first use, so concurrent exports queue their documents in the same pool
+    instead of starting processes of their own, and the workers keep their parsed template between exports.
+
+    :param workers: The number of rendering processes of the pool.
+    :return: The process-wide rendering pool of that size.
+    """
+    render_pool = _render_pools.get(workers)
+    if render_pool is not None:
+        return render_pool
+    with _render_pool_lock:
+        if workers not in _render_pools:
+            # Spawned workers do not inherit the database client or the scheduler threads of the web worker
+            _render_pools[workers] = ProcessPoolExecutor(max_workers=workers,
+                                                         mp_context=multiprocessing.get_context("spawn"))
+        return _render_pools[workers]
+
+
+def shutdown_render_pool():
+    """
+    Shuts down the rendering pools that were created. The next export creates a new pool.
+    """
+    with _render_pool_lock:
+        render_pools = list(_render_pools.values())
+        _render_pools.clear()
+    for render_pool in render_pools:
+        render_pool.shutdown(cancel_futures=True)
+
+
+def _reset_after_fork():
+    """
+    Drops the references to the parent's rendering pools in a forked child. The child creates its own pool on first
+    use.
+    """
+    global _render_pools
+    global _render_pool_lock
+    _render_pools = {}
+    _render_pool_lock = threading.Lock()
+
+
+atexit.register(shutdown_render_pool)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
 class PDFGeneratorStrategy(DocumentGeneratorStrategy):
     """
     The PDFGeneratorStrategy class is responsible for generating PDF documents.
@@ -18,7 +85,6 @@ class PDFGeneratorStrategy(DocumentGeneratorStrategy):
     """
     BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     TEMPLATE_PATH = os.path.join(BASE_DIR, "..", "resources", "timesheet_template.pdf")
-    TEMP_DIR = os.path.join(BASE_DIR, "..", "resources", "temp")
     SIGNATURE_WIDTH = 300
     SIGNATURE_HEIGHT = 30
     SIGNATURE_X_POS = 18
@@ -28,18 +94,29 @@ class PDFGeneratorStrategy(DocumentGeneratorStrategy):
 
     def generate_document(self, document_data: DocumentData):
         """
-        Generates a PDF document based on the given data.
+        Generates a PDF document based on the given data. The form is filled and both signatures are placed
+        in memory, so no temporary files are written and concurrent requests cannot interfere.
 
         :param document_data: The data to use for generating the PDF document.
 
-        :return: The generated PDF document.
+        :return: The generated PDF document as a BytesIO stream, named after the document.
         """
         if document_data is None:
             return RequestResult(False, "No data provided", 400)
 
-        if not os.path.exists(self.TEMP_DIR):
-            os.makedirs(self.TEMP_DIR)
+        render_job = self.create_render_job(document_data)
+        return RequestResult(True, "Document generated successfully", 200,
+                             self._to_named_stream(render_job, self.render(render_job)))
+
+    def create_render_job(self, document_data: DocumentData) -> dict:
+        """
+        Converts the document data into a render job. The job only contains plain data, i.e. the form values
+        and the signature images, so it can be sent to another process for rendering.
+
+        :param document_data: The data to use for generating the PDF document.
 
+        :return: The render job.
+        """
         if document_data.time_entries is None:
             document_data.time_entries = []
 
@@ -54,52 +131,55 @@ class PDFGeneratorStrategy(DocumentGeneratorStrategy):
         hours, minutes = divmod(vacation_minutes, 60)
         duration_str = f"{int(hours):02d}:{int(minutes):02d}"
         data_dict["Urlaub anteilig"] = duration_str
-        output_path_pdf = self._get_output_path(document_data, "Unsigned.pdf")
-        fillpdfs.write_fillable_pdf(self.TEMPLATE_PATH,
-                                    output_path_pdf,
-                                    data_dict)
-        signature_path = self._get_output_path(document_data, "Signature.png")
-        self._temporary_store_signature(document_data.signature, signature_path)
-
-        supervisor_signature_path = self._get_output_path(document_data, "SupervisorSignature.png")
-        self._temporary_store_signature(document_data.supervisor_signature, supervisor_signature_path)
-
-        output_path_pdf_signed = self._get_output_path(document_data, "Signed.pdf")
-        self._place_signature(output_path_pdf, output_path_pdf_signed, signature_path, True)
+        return {
+            "fileName": self.get_file_name(document_data.personal_info, document_data.month, document_data.year),
+            "formData": data_dict,
+            "signature": document_data.signature.read(),
+            "supervisorSignature": document_data.supervisor_signature.read()
+        }
 
-        output_path_pdf_approved = self._get_output_path(document_data, "Approved.pdf")
-        self._place_signature(output_path_pdf_signed, output_path_pdf_approved, supervisor_signature_path, False)
-        self._cleanup_temp_files([output_path_pdf, output_path_pdf_signed, signature_path, supervisor_signature_path])
+    def render(self, render_job: dict) -> bytes:
+        """
+        Fills the form of the template and places both signatures. The template is parsed once per process,
+        see PDFTemplateEngine. The document keeps the ID of the template, so rendering the same job always
+        results in the same bytes.
 
-        return RequestResult(True, "Document generated successfully", 200, output_path_pdf_approved)
+        :param render_job: The render job created by create_render_job.
 
-    def _place_signature(self, pdf_path, output_path, signature_path, type_hiwi: bool):
+        :return: The rendered PDF document.
+        """
+        document = PDFTemplateEngine.get_instance(self.TEMPLATE_PATH).fill(render_job["formData"])
+        self._place_signature(document, render_job["signature"], True)
+        self._place_signature(document, render_job["supervisorSignature"], False)
+        approved_pdf = document.tobytes(no_new_id=True)
+        document.close()
+        return approved_pdf
+
+    def _place_signature(self, document, signature: bytes, type_hiwi: bool):
         """
-        Places the signature on the PDF document.
+        Places the signature on the first page of the PDF document.
 
-        :param pdf_path: The path to the PDF document.
-        :param output_path: The path to the output PDF document.
-        :param signature_path: The path to the signature image.
+        :param document: The opened PDF document.
+        :param signature: The signature image.
         :param type_hiwi: The type of the signature (Hiwi or supervisor).
         """
         signature_x_pos = self.SIGNATURE_X_POS if type_hiwi else self.SUPERVISOR_SIGNATURE_X_POS
+        document[0].insert_image(fitz.Rect(signature_x_pos, self.SIGNATURE_Y_POS,
+                                           signature_x_pos + self.SIGNATURE_WIDTH,
+                                           self.SIGNATURE_Y_POS + self.SIGNATURE_HEIGHT), stream=signature)
 
-        fillpdfs.place_image(signature_path, signature_x_pos, self.SIGNATURE_Y_POS, pdf_path, output_path, 1,
-                             width=self.SIGNATURE_WIDTH, height=self.SIGNATURE_HEIGHT)
-
-
-    def _get_output_path(self, document_data, suffix):
+    def get_file_name(self, personal_info, month: int, year: int):
         """
-        Returns the output path for the generated PDF document.
+        Returns the file name of the generated PDF document.
 
-        :param document_data: The document data.
-        :param suffix: The suffix to append to the file name.
+        :param personal_info: The personal information of the Hiwi.
+        :param month: The month of the document.
+        :param year: The year of the document.
 
-        :return: The output path for the generated PDF document.
+        :return: The file name of the generated PDF document.
         """
-        return os.path.join(self.TEMP_DIR,
-                            f"{document_data.personal_info.first_name}_{document_data.personal_info.last_name}"
-                            f"_{document_data.month}_{suffix}")
+        return f"{personal_info.first_name}_{personal_info.last_name}_{month}_{year}_Approved.pdf"
+
     def _format_time_entry_data(self, time_entry, i):
         """
         Formats the time entry data for the PDF document.
@@ -157,38 +237,71 @@ class PDFGeneratorStrategy(DocumentGeneratorStrategy):
         }
         return data_dict
 
-    def _temporary_store_signature(self, signature_stream, path):
+    def generate_multiple_documents(self, documents: list[DocumentData], workers: int = 1):
         """
-        Stores the signature image in a temporary file.
+        Generates multiple PDF documents based on the given list of data.
 
-        :param signature_stream: The signature image stream.
+        :param documents: The list of data to use for generating the PDF documents.
+        :param workers: The number of processes rendering the documents in parallel, see stream_multiple_documents.
 
-        :param path: The path to store the signature image.
+        :return: The list of generated PDF documents as named BytesIO streams, in the order of the given data.
         """
-        with open(path, "wb") as file:
-            file.write(signature_stream.read())
-            file.close()
-
-    def _cleanup_temp_files(self, files):
-        for file_path in files:
-            os.remove(file_path)
+        result = self.stream_multiple_documents(documents, workers)
+        if result.is_successful:
+            result.data = list(result.data)
+        return result
 
-    def generate_multiple_documents(self, documents: list[DocumentData]):
+    def stream_multiple_documents(self, documents: list[DocumentData], workers: int = 1):
         """
-        Generates multiple PDF documents based on the given list of data.
+        Generates multiple PDF documents lazily, so each document can be processed as soon as it is rendered.
+        With more than one worker, the documents are rendered in parallel by the shared pool of that many processes,
+        see get_render_pool. The render jobs are created in the calling process, so the workers only receive plain
+        data and never access the database.
 
         :param documents: The list of data to use for generating the PDF documents.
+        :param workers: The number of processes rendering the documents. With more than one, the documents are sent
+                        to the shared rendering pool of that size, otherwise they are rendered in the calling process.
 
-        :return: The list of generated PDF documents.
+        :return: A generator of the generated PDF documents as named BytesIO streams, in the order of the given data.
         """
         if documents is None:
             return RequestResult(False, "No data provided", 400)
 
+        render_jobs = []
         for document_data in documents:
             if not document_data:
                 return RequestResult(False, "No data provided", 400)
-            result = self.generate_document(document_data)
-            if result.status_code != 200:
-                return RequestResult(False, "Some of the documents couldn't be generated",
-                                     result.status_code, self.TEMP_DIR)
-        return RequestResult(True, "Documents generated successfully", 200, self.TEMP_DIR)
+            render_jobs.append(self.create_render_job(document_data))
+        return RequestResult(True, "Documents generated successfully", 200,
+                             self._render_documents(render_jobs, workers))
+
+    def _render_documents(self, render_jobs: list[dict], workers: int):
+        """
+        Renders the given jobs, sequentially or by the shared pool of processes.
+
+        :param render_jobs: The render jobs created by create_render_job.
+        :param workers: The number of processes rendering the jobs, see stream_multiple_documents.
+
+        :return: A generator of the rendered PDF documents as named BytesIO streams.
+        """
+        if workers > 1 and len(render_jobs) > 1:
+            rendered_documents = get_render_pool(workers).map(_render_document, render_jobs)
+            for render_job, rendered_document in zip(render_jobs, rendered_documents):
+                yield self._to_named_stream(render_job, rendered_document)
+        else:
+            for render_job in render_jobs:
+                yield self._to_named_stream(render_job, self.render(render_job))
+
+    @staticmethod
+    def _to_named_stream(render_job: dict, rendered_document: bytes) -> BytesIO:
+        """
+        Wraps a rendered document in a BytesIO stream named after the document.
+
+        :param render_job: The render job of the document.
+        :param rendered_document: The rendered PDF document.
+
+        :return: The named stream.
+        """
+        stream = BytesIO(rendered_document)
+        stream.name = render_job["fileName"]
+        return stream
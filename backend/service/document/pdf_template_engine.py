@@ -0,0 +1,77 @@
+import threading
+
+import fitz
+
+
+class PDFTemplateEngine:
+    """
+    Fills a fillable PDF template in memory. The template is read and its form fields are mapped to their objects
+    once per process; every document is filled on a copy opened from the loaded template, so neither the template
+    file nor its form is parsed again and concurrent renders do not share any mutable state.
+
+    Like fillpdf, the engine writes the values of the fields and lets the viewer create their appearance.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    @staticmethod
+    def get_instance(template_path: str):
+        """
+        Provides the engine of a template, loading the template on first use.
+
+        :param template_path: The path of the fillable PDF template.
+        :return: The engine of the template.
+        """
+        engine = PDFTemplateEngine._instances.get(template_path)
+        if engine is None:
+            with PDFTemplateEngine._instances_lock:
+                engine = PDFTemplateEngine._instances.get(template_path)
+                if engine is None:
+                    engine = PDFTemplateEngine(template_path)
+                    PDFTemplateEngine._instances[template_path] = engine
+        return engine
+
+    def __init__(self, template_path: str):
+        """
+        Loads the template and maps its form fields.
+
+        :param template_path: The path of the fillable PDF template.
+        """
+        with open(template_path, 'rb') as template_file:
+            self.template = template_file.read()
+        template = fitz.open(stream=self.template, filetype="pdf")
+        # Maps the name of each field to the object of its widget and whether it is a check box
+        self.fields = {}
+        for page in template:
+            for widget in page.widgets():
+                self.fields[widget.field_name] = (widget.xref,
+                                                  widget.field_type == fitz.PDF_WIDGET_TYPE_CHECKBOX)
+        acro_form_type, acro_form = template.xref_get_key(template.pdf_catalog(), "AcroForm")
+        self.acro_form_xref = int(acro_form.split()[0]) if acro_form_type == "xref" else None
+        template.close()
+
+    def fill(self, form_data: dict):
+        """
+        Fills a copy of the template with the given values. Values of fields the template does not contain are
+        ignored.
+
+        :param form_data: The values of the form fields by field name. Check boxes take the name of their state.
+        :return: The filled document, opened with PyMuPDF. The caller is responsible for closing it.
+        """
+        document = fitz.open(stream=self.template, filetype="pdf")
+        for field_name, value in form_data.items():
+            field = self.fields.get(field_name)
+            if field is None:
+                continue
+            xref, is_check_box = field
+            if is_check_box:
+                document.xref_set_key(xref, "V", f"/{value}")
+                document.xref_set_key(xref, "AS", f"/{value}")
+            else:
+                document.xref_set_key(xref, "V", fitz.get_pdf_str(str(value)))
+                # The appearance of the empty field would hide the value
+                document.xref_set_key(xref, "AP", "null")
+        if self.acro_form_xref is not None:
+            document.xref_set_key(self.acro_form_xref, "NeedAppearances", "true")
+        return document
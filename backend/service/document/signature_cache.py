@@ -0,0 +1,126 @@
+import os
+import threading
+from collections import OrderedDict
+from io import BytesIO
+
+from PIL import Image
+
+from service.document.pdf_generator_strategy import PDFGeneratorStrategy
+
+
+class SignatureCache:
+    """
+    In-memory cache of signature images, keyed by their GridFS ID and normalized to the stamp on the document.
+
+    A replaced signature gets a new GridFS ID, so an entry never has to be updated; it is only removed when the
+    signature is replaced or deleted, or evicted in least recently used order once the cache exceeds its memory
+    limit. The cache is local to a worker process.
+    """
+
+    # Pixels per point of the stamp, so the signatures stay sharp when the document is printed
+    STAMP_RESOLUTION = 4
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @staticmethod
+    def get_instance():
+        """
+        Provides the singleton instance of the SignatureCache.
+
+        :return: The singleton instance of the SignatureCache.
+        """
+        if SignatureCache._instance is None:
+            with SignatureCache._instance_lock:
+                if SignatureCache._instance is None:
+                    SignatureCache._instance = SignatureCache()
+        return SignatureCache._instance
+
+    def __init__(self, max_bytes: int = None):
+        """
+        Initializes the cache.
+
+        :param max_bytes: The maximum total size of the cached images. Defaults to the SIGNATURE_CACHE_MAX_BYTES
+                          environment variable or 16 MB.
+        """
+        self.max_bytes = max_bytes or int(os.getenv('SIGNATURE_CACHE_MAX_BYTES', str(16 * 1024 * 1024)))
+        self._signatures = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(image: bytes) -> bytes:
+        """
+        Scales a signature image to fit the stamp of the document, keeping its proportions, and centers it on a
+        transparent image of the size of the stamp. The renderer then places it without scaling or decoding the
+        original image.
+
+        :param image: The uploaded signature image.
+        :return: The normalized signature as PNG image.
+        :raises OSError: If the image cannot be decoded.
+        """
+        stamp_width = PDFGeneratorStrategy.SIGNATURE_WIDTH * SignatureCache.STAMP_RESOLUTION
+        stamp_height = PDFGeneratorStrategy.SIGNATURE_HEIGHT * SignatureCache.STAMP_RESOLUTION
+        with Image.open(BytesIO(image)) as signature:
+            signature = signature.convert('RGBA')
+            scale = min(stamp_width / signature.width, stamp_height / signature.height)
+            signature = signature.resize((max(1, round(signature.width * scale)),
+                                          max(1, round(signature.height * scale))), Image.LANCZOS)
+        stamp = Image.new('RGBA', (stamp_width, stamp_height), (255, 255, 255, 0))
+        stamp.paste(signature, ((stamp_width - signature.width) // 2, (stamp_height - signature.height) // 2))
+        normalized_signature = BytesIO()
+        stamp.save(normalized_signature, 'PNG')
+        return normalized_signature.getvalue()
+
+    def get(self, gridfs_id):
+        """
+        Returns a cached signature and marks it as recently used.
+
+        :param gridfs_id: The GridFS ID of the signature.
+        :return: The normalized signature, or None if it is not cached.
+        """
+        with self._lock:
+            signature = self._signatures.get(str(gridfs_id))
+            if signature is not None:
+                self._signatures.move_to_end(str(gridfs_id))
+            return signature
+
+    def put(self, gridfs_id, signature: bytes):
+        """
+        Caches a normalized signature and evicts the least recently used signatures if the cache is full.
+        Signatures larger than the cache are not cached.
+
+        :param gridfs_id: The GridFS ID of the signature.
+        :param signature: The normalized signature.
+        """
+        if len(signature) > self.max_bytes:
+            return
+        with self._lock:
+            self._remove(str(gridfs_id))
+            self._signatures[str(gridfs_id)] = signature
+            self._size += len(signature)
+            while self._size > self.max_bytes:
+                _, evicted_signature = self._signatures.popitem(last=False)
+                self._size -= len(evicted_signature)
+
+    def invalidate(self, gridfs_id):
+        """
+        Removes a signature, e.g. after it was replaced or deleted.
+
+        :param gridfs_id: The GridFS ID of the signature.
+        """
+        with self._lock:
+            self._remove(str(gridfs_id))
+
+    def clear(self):
+        """
+        Removes all cached signatures.
+        """
+        with self._lock:
+            self._signatures.clear()
+            self._size = 0
+
+    def _remove(self, key: str):
+        signature = self._signatures.pop(key, None)
+        if signature is not None:
+            self._size -= len(signature)
@@ -0,0 +1,153 @@
+from datetime import datetime
+
+import pytz
+
+from model.repository.time_entry_repository import TimeEntryRepository
+from model.repository.timesheet_repository import TimesheetRepository
+from model.request_result import RequestResult
+from model.time_entry_type import TimeEntryType
+from model.user.role import UserRole
+from model.vacation_entry import VacationEntry
+from model.work_entry import WorkEntry
+from service.user_service import UserService
+from utils.table_stream import TableStream
+
+
+class TableExportService:
+    """
+    Exports timesheets as tables for payroll, as a lightweight alternative to the rendered documents.
+    The rows are read from database cursors while the table is streamed, so an export of a year of the
+    whole lab starts immediately and does not hold all rows in memory.
+    """
+
+    TIMESHEET_HEADER = ["Username", "Month", "Year", "Status", "Total Time (minutes)", "Vacation (minutes)",
+                       "Overtime (minutes)", "Last Signature Change"]
+    TIME_ENTRY_HEADER = ["Username", "Date", "Start", "End", "Break (minutes)", "Duration (minutes)",
+                         "Entry Type", "Activity", "Project", "Activity Type"]
+    ROW_TYPES = ("timesheets", "timeEntries")
+    FILE_FORMATS = ("csv", "xlsx")
+
+    def __init__(self, user_service: UserService = None):
+        """
+        Initializes the TableExportService instance.
+
+        :param user_service: The UserService used to authorize the requesting user. A new instance is created if none
+                             is given.
+        """
+        self.user_service = user_service or UserService()
+        self.timesheet_repository = TimesheetRepository.get_instance()
+        self.time_entry_repository = TimeEntryRepository.get_instance()
+
+    def export_table(self, requesting_username: str, start_date: datetime, end_date: datetime,
+                     usernames: list[str] = None, row_type: str = "timesheets", file_format: str = "csv"):
+        """
+        Exports the timesheets of a time period as a table. The time period includes the months of the start
+        and the end date.
+
+        :param requesting_username: The username of the requesting user.
+        :param start_date: The start date of the time period.
+        :param end_date: The end date of the time period.
+        :param usernames: The users to export. Defaults to all Hiwis the requesting user may access.
+        :param row_type: "timesheets" for one row per timesheet with its totals, "timeEntries" for one row per
+                         time entry.
+        :param file_format: The format of the table, "csv" or "xlsx".
+
+        :return: A RequestResult containing a generator streaming the table.
+        """
+        if row_type not in self.ROW_TYPES:
+            return RequestResult(False, "Invalid row type", 400)
+        if file_format not in self.FILE_FORMATS:
+            return RequestResult(False, "Invalid file format", 400)
+        if start_date is None or end_date is None or start_date > end_date:
+            return RequestResult(False, "Invalid time period", 400)
+        usernames_result = self._get_usernames(requesting_username, usernames)
+        if not usernames_result.is_successful:
+            return usernames_result
+        if row_type == "timesheets":
+            header = self.TIMESHEET_HEADER
+            rows = self._get_timesheet_rows(usernames_result.data, start_date, end_date)
+        else:
+            header = self.TIME_ENTRY_HEADER
+            rows = self._get_time_entry_rows(usernames_result.data, start_date, end_date)
+        if file_format == "csv":
+            return RequestResult(True, "Export started", 200, TableStream.stream_csv(header, rows))
+        return RequestResult(True, "Export started", 200, TableStream.stream_xlsx(header, rows, "Timesheets"))
+
+    def _get_usernames(self, requesting_username: str, usernames: list[str] = None):
+        """
+        Determines the users of an export and checks that the requesting user may access all of them.
+
+        :param requesting_username: The username of the requesting user.
+        :param usernames: The requested users, or None for all Hiwis the requesting user may access.
+
+        :return: A RequestResult containing the sorted usernames.
+        """
+        requesting_user = self.user_service.get_profile(requesting_username)
+        if requesting_user is None:
+            return RequestResult(False, "User not found", 404)
+        if requesting_user.role == UserRole.ADMIN or requesting_user.role == UserRole.SECRETARY:
+            accessible_usernames = None
+        elif requesting_user.role == UserRole.SUPERVISOR:
+            accessible_usernames = set(requesting_user.hiwis)
+        else:
+            accessible_usernames = {requesting_username}
+        if usernames:
+            if accessible_usernames is not None and not set(usernames) <= accessible_usernames:
+                return RequestResult(False, "Unauthorized to export timesheets", 403)
+            return RequestResult(True, "", 200, sorted(set(usernames)))
+        if accessible_usernames is None:
+            hiwis = self.user_service.get_users_by_role(UserRole.HIWI.value).data
+            return RequestResult(True, "", 200, sorted(hiwi.username for hiwi in hiwis))
+        return RequestResult(True, "", 200, sorted(accessible_usernames))
+
+    def _get_timesheet_rows(self, usernames: list[str], start_date: datetime, end_date: datetime):
+        """
+        Yields one row per timesheet, read from a cursor while the table is written.
+        """
+        for timesheet_data in self.timesheet_repository.find_timesheets_by_time_period(usernames, start_date,
+                                                                                        end_date):
+            yield [timesheet_data["username"], timesheet_data["month"], timesheet_data["year"],
+                   timesheet_data.get("status"), timesheet_data.get("totalTime", 0),
+                   timesheet_data.get("vacationMinutes", 0), timesheet_data.get("overtime", 0),
+                   self._format_datetime(timesheet_data.get("lastSignatureChange"), "%d.%m.%Y %H:%M")]
+
+    def _get_time_entry_rows(self, usernames: list[str], start_date: datetime, end_date: datetime):
+        """
+        Yields one row per time entry, user by user in chronological order. Only the IDs of the timesheets
+        are collected, the entries are read from a cursor per user while the table is written.
+        """
+        timesheet_ids = {username: [] for username in usernames}
+        for timesheet_data in self.timesheet_repository.find_timesheets_by_time_period(
+                usernames, start_date, end_date, {"_id": 1, "username": 1}):
+            timesheet_ids[timesheet_data["username"]].append(timesheet_data["_id"])
+        for username in usernames:
+            if not timesheet_ids[username]:
+                continue
+            for entry_data in self.time_entry_repository.find_time_entries_by_timesheet_ids(timesheet_ids[username]):
+                entry_type = TimeEntryType.get_type_by_value(entry_data['entryType'])
+                if entry_type == TimeEntryType.WORK_ENTRY:
+                    entry = WorkEntry.from_dict(entry_data)
+                    yield [username, self._format_datetime(entry.start_time, "%d.%m.%Y"),
+                           self._format_datetime(entry.start_time, "%H:%M"),
+                           self._format_datetime(entry.end_time, "%H:%M"), entry.break_time, entry.get_duration(),
+                           entry_type.value, entry.activity, entry.project_name,
+                           entry.activity_type.value if entry.activity_type else None]
+                elif entry_type == TimeEntryType.VACATION_ENTRY:
+                    entry = VacationEntry.from_dict(entry_data)
+                    yield [username, self._format_datetime(entry.start_time, "%d.%m.%Y"),
+                           self._format_datetime(entry.start_time, "%H:%M"),
+                           self._format_datetime(entry.end_time, "%H:%M"), 0, entry.get_duration(),
+                           entry_type.value, None, None, None]
+
+    @staticmethod
+    def _format_datetime(value: datetime, date_format: str):
+        """
+        Formats a point in time stored in UTC in the time zone of the lab.
+
+        :param value: The point in time, or None.
+        :param date_format: The format of the result.
+        :return: The formatted point in time, or None.
+        """
+        if value is None:
+            return None
+        return value.replace(tzinfo=pytz.utc).astimezone(pytz.timezone('Europe/Berlin')).strftime(date_format)
@@ -3,6 +3,8 @@ import os
 from model.repository.file_repository import FileRepository
 from model.request_result import RequestResult
 from model.file.FileType import FileType
+from service.document.document_cache import DocumentCache
+from service.document.signature_cache import SignatureCache
 
 
 class FileService:
@@ -59,6 +61,9 @@ class FileService:
             return RequestResult(False, "File size exceeds the allowed limit of 20 MB.", 400)
         existing_metadata = self.file_repository.get_image_metadata(username, file_type)
         if existing_metadata:
+            if file_type == FileType.SIGNATURE:
+                DocumentCache.get_instance().invalidate_signature(existing_metadata['gridfsId'])
+                SignatureCache.get_instance().invalidate(existing_metadata['gridfsId'])
             return self.file_repository.update_image(file, existing_metadata['gridfsId'], username, file_type)
         return self.file_repository.upload_image(file, username, file_type)
 
@@ -80,8 +85,49 @@ class FileService:
         image_id = image_metadata.get('gridfsId')
         if not image_id:
             return RequestResult(False, "Image ID not found", 404)
+        if file_type == FileType.SIGNATURE:
+            DocumentCache.get_instance().invalidate_signature(image_id)
+            SignatureCache.get_instance().invalidate(image_id)
         return self.file_repository.delete_image(image_id)
 
+    def get_image_ids(self, usernames, file_type: FileType) -> dict:
+        """
+        Retrieves the GridFS IDs of the images of several users with a single query.
+
+        :param usernames: The usernames associated with the images.
+        :param file_type: The type of the images.
+        :return: A dictionary mapping the usernames to the GridFS IDs of the images that were found.
+        :rtype: dict
+        """
+        return {metadata['username']: metadata['gridfsId']
+                for metadata in self.file_repository.get_images_metadata(usernames, file_type)}
+
+    def get_image_by_id(self, gridfs_id):
+        """
+        Retrieves an image by its GridFS ID.
+
+        :param gridfs_id: The GridFS ID of the image.
+        :return: The image object if found, otherwise None.
+        :rtype: file-like object or None
+        """
+        return self.file_repository.get_image_by_id(gridfs_id)
+
+    def get_image_id(self, username: str, file_type: FileType):
+        """
+        Retrieves the GridFS ID of an image without reading the image. As a replaced image gets a new ID,
+        the ID identifies the version of the image.
+
+        :param username: The username associated with the image.
+        :param file_type: The type of the image.
+        :type username: str
+        :type file_type: FileType
+        :return: The GridFS ID of the image if found, otherwise None.
+        """
+        image_metadata = self.file_repository.get_image_metadata(username, file_type)
+        if not image_metadata:
+            return None
+        return image_metadata.get('gridfsId')
+
     def get_image(self, username: str, file_type: FileType):
         """
         Retrieves an image based on the specified username and file type.
@@ -0,0 +1,116 @@
+import os
+import threading
+from datetime import date, datetime, timedelta
+
+import holidays
+import numpy as np
+
+
+class HolidayCalendarService:
+    """
+    Calendar of the public holidays in the region of the institute, shared by all validators of a worker process.
+
+    The holidays of a window of years around the current year are computed once when the calendar is created and
+    stored by their ordinal day, so looking up a date is a single dictionary access. They are also kept as a sorted
+    array of days since the epoch for the membership tests of batch validation. Years outside the window are
+    computed on their first lookup.
+    """
+
+    _EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @staticmethod
+    def get_instance():
+        """
+        Provides the singleton instance of the HolidayCalendarService.
+
+        :return: The singleton instance of the HolidayCalendarService.
+        """
+        if HolidayCalendarService._instance is None:
+            with HolidayCalendarService._instance_lock:
+                if HolidayCalendarService._instance is None:
+                    HolidayCalendarService._instance = HolidayCalendarService()
+        return HolidayCalendarService._instance
+
+    def __init__(self, country: str = None, subdivision: str = None, years_before: int = None,
+                 years_after: int = None):
+        """
+        Initializes the calendar and computes the holidays of the years of its window.
+
+        :param country: The ISO code of the country. Defaults to the HOLIDAY_COUNTRY environment variable or DE.
+        :param subdivision: The code of the state or region. Defaults to the HOLIDAY_SUBDIVISION environment
+                            variable or BW (Baden-Württemberg).
+        :param years_before: The number of years before the current year computed in advance. Defaults to the
+                             HOLIDAY_YEARS_BEFORE environment variable or 5.
+        :param years_after: The number of years after the current year computed in advance. Defaults to the
+                            HOLIDAY_YEARS_AFTER environment variable or 1.
+        """
+        self.country = country or os.getenv('HOLIDAY_COUNTRY', 'DE')
+        self.subdivision = subdivision or os.getenv('HOLIDAY_SUBDIVISION', 'BW')
+        if years_before is None:
+            years_before = int(os.getenv('HOLIDAY_YEARS_BEFORE', '5'))
+        if years_after is None:
+            years_after = int(os.getenv('HOLIDAY_YEARS_AFTER', '1'))
+        self._holiday_names = {}
+        self._holiday_days = np.array([], dtype=np.int64)
+        self._years = frozenset()
+        self._lock = threading.Lock()
+        current_year = datetime.now().year
+        self._add_years(range(current_year - years_before, current_year + years_after + 1))
+
+    def is_holiday(self, day: date) -> bool:
+        """
+        Checks whether a date is a public holiday.
+
+        :param day: The date to check.
+        :return: True if the date is a public holiday, otherwise False.
+        """
+        return self.get_holiday_name(day) is not None
+
+    def get_holiday_name(self, day: date):
+        """
+        Returns the name of the public holiday on a date.
+
+        :param day: The date to look up.
+        :return: The name of the holiday, or None if the date is no public holiday.
+        """
+        if day.year not in self._years:
+            self._add_years([day.year])
+        return self._holiday_names.get(day.toordinal())
+
+    def are_holidays(self, days: np.ndarray) -> np.ndarray:
+        """
+        Checks for several days at once whether they are public holidays.
+
+        :param days: The days as days since the epoch.
+        :return: An array of booleans indicating which of the days are public holidays.
+        """
+        if len(days) == 0:
+            return np.zeros(0, dtype=bool)
+        first_year = (date(1970, 1, 1) + timedelta(days=int(days.min()))).year
+        last_year = (date(1970, 1, 1) + timedelta(days=int(days.max()))).year
+        if not self._years.issuperset(range(first_year, last_year + 1)):
+            self._add_years(range(first_year, last_year + 1))
+        return np.isin(days, self._holiday_days)
+
+    def _add_years(self, years):
+        """
+        Computes the holidays of the given years that are not in the calendar yet.
+
+        :param years: The years to add.
+        """
+        with self._lock:
+            missing_years = sorted(set(years) - self._years)
+            if not missing_years:
+                return
+            calendar = holidays.country_holidays(self.country, subdiv=self.subdivision, years=missing_years)
+            holiday_names = dict(self._holiday_names)
+            for day, name in calendar.items():
+                holiday_names[day.toordinal()] = name
+            # Readers use the previous state until all structures of the new years are complete
+            self._holiday_days = np.array(sorted(ordinal - self._EPOCH_ORDINAL for ordinal in holiday_names),
+                                          dtype=np.int64)
+            self._holiday_names = holiday_names
+            self._years = self._years | frozenset(missing_years)
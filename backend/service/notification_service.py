@@ -1,4 +1,6 @@
 import copy
+import threading
+import time
 from datetime import datetime, timezone
 
 import requests
@@ -14,13 +16,29 @@ from model.request_result import RequestResult
 
 
 class NotificationService:
+    # Seconds for which the Slack token is cached before it is read from the database again
+    SLACK_TOKEN_TTL = 60
+
     def __init__(self):
-        db = initialize_db()
-        self.SLACK_TOKEN = db.administration.find_one({}, {"_id": 0, "slackToken": 1}).get("slackToken", "")
+        self._slack_token = None
+        self._slack_token_loaded_at = None
         self.notification_repository = NotificationRepository.get_instance()
         self.user_repository = UserRepository.get_instance()
         self.timesheet_repository = TimesheetRepository.get_instance()
 
+    @property
+    def SLACK_TOKEN(self) -> str:
+        """
+        The Slack token of the administration settings. As the service is shared for the lifetime of a worker,
+        the token is reloaded periodically so that changes of the settings are picked up.
+        """
+        now = time.monotonic()
+        if self._slack_token_loaded_at is None or now - self._slack_token_loaded_at > self.SLACK_TOKEN_TTL:
+            settings = initialize_db().administration.find_one({}, {"_id": 0, "slackToken": 1}) or {}
+            self._slack_token = settings.get("slackToken", "")
+            self._slack_token_loaded_at = now
+        return self._slack_token
+
     @jwt_required()
     def send_notification(self, notification_data: dict):
         if notification_data is None:
@@ -69,6 +87,53 @@ class NotificationService:
                 return slack_result
         return result
 
+    @jwt_required()
+    def send_notifications(self, notifications_data: list):
+        """
+        Sends several timesheet status notifications of the current user at once. The receivers are looked up
+        with a single query, the in-app notifications are created with a single write and the Slack messages are
+        posted in one background thread, so the request does not wait for Slack.
+
+        :param notifications_data: The notifications to send, each containing the receiver and the message.
+        :return: The result of the creation of the in-app notifications.
+        """
+        if not notifications_data:
+            return RequestResult(True, "No notifications to send", 200, data=[])
+        sender = get_jwt_identity()
+        users_data = self.user_repository.find_by_usernames(
+            [notification_data.get("receiver") for notification_data in notifications_data] + [sender])
+        sender_data = users_data.get(sender)
+        notifications = []
+        for notification_data in notifications_data:
+            if notification_data.get("receiver") not in users_data:
+                continue
+            notifications.append(NotificationMessage(notification_data.get("receiver"), sender,
+                                                     notification_data.get("message"),
+                                                     MessageType.TIMESHEET_STATUS_CHANGE,
+                                                     datetime.now(timezone.utc)))
+        result = self.notification_repository.create_notifications(notifications)
+        if not result.is_successful:
+            return result
+        slack_thread = threading.Thread(target=self._send_slack_messages,
+                                        args=(notifications, users_data, sender_data), daemon=True)
+        slack_thread.start()
+        return RequestResult(True, "Notifications sent successfully", 201, data=notifications)
+
+    def _send_slack_messages(self, notifications: list, users_data: dict, sender_data: dict):
+        """
+        Posts the Slack messages of several notifications. Failures are ignored, as the in-app
+        notifications have already been created.
+
+        :param notifications: The notifications to post.
+        :param users_data: The user data of the receivers, keyed by username.
+        :param sender_data: The user data of the sender.
+        """
+        for notification in notifications:
+            try:
+                self._send_slack_message(notification, users_data[notification.receiver], sender_data)
+            except requests.RequestException: # pragma: no cover
+                continue
+
     @jwt_required()
     def read_all_notifications(self):
         """
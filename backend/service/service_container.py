@@ -0,0 +1,104 @@
+import threading
+
+
+class ServiceContainer:
+    """
+    Application-scoped container that builds the service object graph once per worker process and
+    hands the shared service instances to the controllers. Services are created lazily on first access,
+    so a worker forked from a preloaded application builds its services after the fork.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @staticmethod
+    def get_instance():
+        """
+        Provides the singleton instance of the ServiceContainer.
+
+        :return: The singleton instance of the ServiceContainer.
+        """
+        if ServiceContainer._instance is None:
+            with ServiceContainer._instance_lock:
+                if ServiceContainer._instance is None:
+                    ServiceContainer._instance = ServiceContainer()
+        return ServiceContainer._instance
+
+    def __init__(self):
+        """
+        Initializes an empty container. No service is built until it is requested.
+        """
+        self._services = {}
+        self._lock = threading.RLock()
+
+    def _get_or_create(self, name: str, factory):
+        """
+        Returns the service registered under the given name, building it with the factory on first access.
+
+        :param name: The name of the service.
+        :param factory: A callable without arguments that builds the service.
+        :return: The shared service instance.
+        """
+        service = self._services.get(name)
+        if service is None:
+            with self._lock:
+                service = self._services.get(name)
+                if service is None:
+                    service = factory()
+                    self._services[name] = service
+        return service
+
+    @property
+    def user_service(self):
+        from service.user_service import UserService
+        return self._get_or_create('user_service', UserService)
+
+    @property
+    def auth_service(self):
+        from service.auth_service import AuthenticationService
+        return self._get_or_create('auth_service', AuthenticationService)
+
+    @property
+    def file_service(self):
+        from service.file_service import FileService
+        return self._get_or_create('file_service', FileService)
+
+    @property
+    def notification_service(self):
+        from service.notification_service import NotificationService
+        return self._get_or_create('notification_service', NotificationService)
+
+    @property
+    def timesheet_service(self):
+        from service.timesheet_service import TimesheetService
+        return self._get_or_create('timesheet_service', lambda: TimesheetService(
+            user_service=self.user_service,
+            notification_service=self.notification_service))
+
+    @property
+    def time_entry_service(self):
+        from service.time_entry_service import TimeEntryService
+        return self._get_or_create('time_entry_service', lambda: TimeEntryService(
+            timesheet_service=self.timesheet_service,
+            user_service=self.user_service))
+
+    @property
+    def document_service(self):
+        from service.document.document_service import DocumentService
+        return self._get_or_create('document_service', lambda: DocumentService(
+            user_service=self.user_service,
+            time_entry_service=self.time_entry_service,
+            timesheet_service=self.timesheet_service,
+            file_service=self.file_service))
+
+    @property
+    def export_job_service(self):
+        from service.document.export_job_service import ExportJobService
+        return self._get_or_create('export_job_service', lambda: ExportJobService(
+            document_service=self.document_service))
+
+    @property
+    def table_export_service(self):
+        from service.document.table_export_service import TableExportService
+        return self._get_or_create('table_export_service', lambda: TableExportService(
+            user_service=self.user_service))
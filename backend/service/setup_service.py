@@ -1,6 +1,7 @@
 import time
 import random
 from db import initialize_db
+from model.repository.index_registry import INDEX_REGISTRY, ensure_indexes
 from model.user.role import UserRole
 from model.repository.user_repository import UserRepository
 from service.user_service import UserService
@@ -115,9 +116,23 @@ class SetupService:
         admin_collection.insert_one({"slackToken": ""})
         print("\033[32mDefault SlackToken entry created.\033[0m")
 
+    def ensure_indexes(self) -> bool:
+        """
+        Creates all indexes declared in the index registry. Existing indexes are left untouched.
+
+        :return: True if all indexes exist, False if any index could not be created.
+        """
+        failures = ensure_indexes(self.db)
+        for index_name, message in failures.items():
+            print(f"\033[33mFailed to create index {index_name}: {message}\033[0m")
+        if not failures:
+            index_count = sum(len(indexes) for indexes in INDEX_REGISTRY.values())
+            print(f"\033[32m{index_count} database indexes are in place.\033[0m")
+        return not failures
+
     def run_setup(self):
         """
-        Executes the setup process by ensuring the existence of an admin user
+        Executes the setup process by ensuring the existence of an admin user, the database indexes
         and initializing the administration collection in the database.
         If everything is already correctly set up, it prints a message indicating so.
         """
@@ -125,6 +140,7 @@ class SetupService:
         print(f"Waiting for {random_delay:.2f} seconds to avoid race conditions.")
         time.sleep(random_delay)
 
+        self.ensure_indexes()
         admin_exists = self.ensure_admin_exists()
         admin_collection_initialized = self.initialize_admin_collection()
 
@@ -11,10 +11,12 @@ from model.request_result import RequestResult
 from model.time_entry_type import TimeEntryType
 from model.time_entry_validator.break_length_strategy import BreakLengthStrategy
 from model.time_entry_validator.holiday_strategy import HolidayStrategy
+from model.time_entry_validator.time_entry_validation_context import TimeEntryValidationContext
 from model.time_entry_validator.time_entry_validator import TimeEntryValidator
 from model.time_entry_validator.vacation_time_strategy import VacationTimeStrategy
 from model.time_entry_validator.weekend_strategy import WeekendStrategy
 from model.time_entry_validator.working_time_strategy import WorkingTimeStrategy
+from model.timesheet import Timesheet
 from model.timesheet_status import TimesheetStatus
 from model.vacation_entry import VacationEntry
 from model.work_entry import WorkEntry
@@ -28,7 +30,10 @@ class TimeEntryService:
     the TimesheetService for handling related timesheet operations, and a validator for time entry data validation.
     """
 
-    def __init__(self):
+    # Upper bound of the rows of a single import, which covers a month with several entries per day
+    MAX_IMPORT_ROWS = 100
+
+    def __init__(self, timesheet_service: TimesheetService = None, user_service: UserService = None):
         """
         Initializes a new instance of the TimeEntryService class.
 
@@ -36,9 +41,12 @@ class TimeEntryService:
         with both the TimeEntryRepository for data storage and retrieval, and
         a TimesheetService for handling related timesheet operations, as well as a
         validator for time entry data validation.
+
+        :param timesheet_service: The TimesheetService to use. A new instance is created if none is given.
+        :param user_service: The UserService to use. A new instance is created if none is given.
         """
         self.time_entry_repository = TimeEntryRepository.get_instance()
-        self.timesheet_service = TimesheetService()
+        self.timesheet_service = timesheet_service or TimesheetService()
         self.entry_input_validator = TimeEntryDataValidator()
 
         self.work_entry_validator = TimeEntryValidator()
@@ -53,7 +61,7 @@ class TimeEntryService:
         self.vacation_entry_validator.add_validation_rule(VacationTimeStrategy())
         self.vacation_entry_validator.add_validation_rule(WeekendStrategy())
 
-        self.user_service = UserService()
+        self.user_service = user_service or UserService()
         self.entry_type_mapping = {
             TimeEntryType.WORK_ENTRY: WorkEntry,
             TimeEntryType.VACATION_ENTRY: VacationEntry
@@ -88,12 +96,13 @@ class TimeEntryService:
             if not result.is_successful:
                 return RequestResult(False, result.message, result.status_code)
 
-            timesheet_id = self.timesheet_service.get_timesheet(username, start_date.month,
-                                                                start_date.year).data.timesheet_id
-            entry_data['timesheetId'] = str(timesheet_id)
+            timesheet = self.timesheet_service.get_timesheet(username, start_date.month, start_date.year).data
+            entry_data['timesheetId'] = str(timesheet.timesheet_id)
+        else:
+            timesheet = self.timesheet_service.get_timesheet_by_id(entry_data['timesheetId']).data
 
-        timesheet_status = self.timesheet_service.get_timesheet_status(entry_data['timesheetId']).data
-        if timesheet_status == TimesheetStatus.COMPLETE or timesheet_status == TimesheetStatus.WAITING_FOR_APPROVAL:
+        if timesheet is not None and (timesheet.status == TimesheetStatus.COMPLETE
+                                      or timesheet.status == TimesheetStatus.WAITING_FOR_APPROVAL):
             return RequestResult(False, "Cannot add time entry to a submitted timesheet", status_code=409)
 
         # Validate input data
@@ -109,7 +118,8 @@ class TimeEntryService:
         time_entry = entry_class.from_dict(entry_data)
 
         # Validate the entry through strategy pattern
-        strategy_validation_results = self._strategy_validate(time_entry)
+        context = TimeEntryValidationContext(self.user_service.get_contract_info(username).data)
+        strategy_validation_results = self._strategy_validate(time_entry, context)
         for result in strategy_validation_results:
             if result.status == ValidationStatus.FAILURE:
                 return RequestResult(False, result.message, status_code=400)
@@ -126,7 +136,9 @@ class TimeEntryService:
             self.user_service.remove_vacation_minutes(username, time_entry.get_duration())
         self.user_service.add_overtime_minutes(username, time_entry.get_duration())
 
-        result = self.timesheet_service.set_total_and_vacation_time(time_entry.timesheet_id)
+        vacation_minutes = time_entry.get_duration() if entry_type == TimeEntryType.VACATION_ENTRY else 0
+        result = self.timesheet_service.apply_time_entry_delta(time_entry.timesheet_id, time_entry.get_duration(),
+                                                               vacation_minutes)
         if not result.is_successful:
             return result
 
@@ -142,12 +154,14 @@ class TimeEntryService:
         return RequestResult(True, f"{entry_type.name} entry added successfully", status_code=200,
                              data={"_id": entry_creation_result.data["_id"]})
 
-    def _strategy_validate(self, entry: TimeEntry):
+    def _strategy_validate(self, entry: TimeEntry, context: TimeEntryValidationContext = None):
         """
         Validates a time entry using the strategy pattern.
 
         :param entry: The time entry to validate.
         :type entry: TimeEntry
+        :param context: The data of the user loaded for the validation, e.g. the contract information.
+        :type context: TimeEntryValidationContext
         :return: A list of ValidationResult objects containing the results of the validation.
         :rtype: list[ValidationResult]
         """
@@ -158,10 +172,33 @@ class TimeEntryService:
             entry_validator = self.vacation_entry_validator
 
         if entry_validator is not None:
-            strategy_validation_results = entry_validator.validate_entry(entry)
+            strategy_validation_results = entry_validator.validate_entry(entry, context)
             return strategy_validation_results
         return []
 
+    def _strategy_validate_entries(self, entries: list, context: TimeEntryValidationContext = None):
+        """
+        Validates several time entries using the strategy pattern. The entries of each type are validated
+        together as a batch.
+
+        :param entries: The time entries to validate.
+        :type entries: list[TimeEntry]
+        :param context: The data of the user loaded for the validation, e.g. the contract information.
+        :type context: TimeEntryValidationContext
+        :return: A list containing the ValidationResult objects of every entry, in the order of the entries.
+        :rtype: list[list[ValidationResult]]
+        """
+        results = [[] for _ in entries]
+        for entry_type, entry_validator in ((TimeEntryType.WORK_ENTRY, self.work_entry_validator),
+                                            (TimeEntryType.VACATION_ENTRY, self.vacation_entry_validator)):
+            indices = [index for index, entry in enumerate(entries) if entry.entry_type == entry_type]
+            if not indices:
+                continue
+            batch_results = entry_validator.validate_entries([entries[index] for index in indices], context)
+            for index, entry_results in zip(indices, batch_results):
+                results[index] = entry_results
+        return results
+
     def create_work_entry(self, entry_data: dict, username: str) -> RequestResult:
         """
         Creates a new work time entry in the system based on the provided entry data.
@@ -188,6 +225,171 @@ class TimeEntryService:
         """
         return self._add_time_entry(entry_data, TimeEntryType.VACATION_ENTRY, username)
 
+    def import_time_entries(self, entries_data, username: str) -> RequestResult:
+        """
+        Imports the time entries of a user at once, e.g. a month that was tracked in another tool. All rows are
+        validated together: the timesheets they belong to are read with one query, duplicate days are checked
+        against the existing entries of these timesheets, which are read with one query as well, and the valid
+        entries are inserted with a single write. The balances of the user, the totals of the timesheets and the
+        overtime are updated once for the whole import. Invalid rows are skipped and reported.
+
+        :param entries_data: An iterable of dictionaries containing the time entry attributes. It is consumed
+                             lazily and may raise a ValueError if a row cannot be read, which rejects the import.
+                             Rows without entry type are work entries.
+        :param username: The username of the user importing the time entries.
+        :type username: str
+        :return: A RequestResult object containing the result of every row as data.
+        :rtype: RequestResult
+        """
+        rows = []
+        results = []
+        try:
+            for row_number, entry_data in enumerate(entries_data, 1):
+                if row_number > self.MAX_IMPORT_ROWS:
+                    return RequestResult(False, f"An import is limited to {self.MAX_IMPORT_ROWS} time entries", 413)
+                results.append(None)
+                if not isinstance(entry_data, dict):
+                    results[-1] = RequestResult(False, "Invalid time entry data", 400)
+                    continue
+                entry_data = dict(entry_data)
+                entry_data.setdefault('entryType', TimeEntryType.WORK_ENTRY.value)
+                try:
+                    start_date = entry_data['startTime']
+                    if isinstance(start_date, str):
+                        start_date = datetime.datetime.fromisoformat(start_date.replace('Z', ""))
+                    start_date = datetime.datetime(start_date.year, start_date.month, start_date.day)
+                except (KeyError, AttributeError, TypeError, ValueError):
+                    results[-1] = RequestResult(False, "Invalid datetime format in startTime.", 400)
+                    continue
+                rows.append((row_number - 1, entry_data, start_date))
+        except ValueError as e:
+            # A row of an uploaded file could not be read, see TimeEntryReader.read_csv
+            return RequestResult(False, str(e), 400)
+        if not results:
+            return RequestResult(False, "No time entries provided", 400)
+
+        timesheets = self._get_import_timesheets(username, {(start_date.month, start_date.year)
+                                                            for _, _, start_date in rows})
+        existing_entries = self.time_entry_repository.get_time_entries_by_timesheet_ids(
+            [timesheet.timesheet_id for timesheet in timesheets.values() if isinstance(timesheet, Timesheet)])
+        booked_days = {datetime.datetime(entry_data['startTime'].year, entry_data['startTime'].month,
+                                         entry_data['startTime'].day) for entry_data in existing_entries}
+        contract_info = self.user_service.get_contract_info(username).data
+        remaining_vacation_minutes = contract_info.vacation_minutes if contract_info is not None else 0
+
+        candidates = []
+        for index, entry_data, start_date in rows:
+            timesheet = timesheets[(start_date.month, start_date.year)]
+            if isinstance(timesheet, RequestResult):
+                results[index] = timesheet
+                continue
+            if timesheet.status == TimesheetStatus.COMPLETE or timesheet.status == TimesheetStatus.WAITING_FOR_APPROVAL:
+                results[index] = RequestResult(False, "Cannot add time entry to a submitted timesheet", 409)
+                continue
+            entry_data['timesheetId'] = str(timesheet.timesheet_id)
+            data_validation_result = self.entry_input_validator.is_valid(entry_data)
+            if data_validation_result.status == ValidationStatus.FAILURE:
+                results[index] = RequestResult(False, data_validation_result.message, 400)
+                continue
+            if not isinstance(entry_data.get('breakTime', 0), int):
+                results[index] = RequestResult(False, "Invalid breakTime.", 400)
+                continue
+            entry_type = TimeEntryType.get_type_by_value(entry_data['entryType'])
+            candidates.append((index, start_date, data_validation_result,
+                               self.entry_type_mapping[entry_type].from_dict(entry_data)))
+
+        context = TimeEntryValidationContext(contract_info)
+        strategy_validation_results = self._strategy_validate_entries([time_entry for _, _, _, time_entry
+                                                                       in candidates], context)
+        time_entries = []
+        for (index, start_date, data_validation_result, time_entry), entry_validation_results in zip(
+                candidates, strategy_validation_results):
+            validation_results = [data_validation_result] + entry_validation_results
+            failure = next((result for result in validation_results
+                            if result.status == ValidationStatus.FAILURE), None)
+            if failure is not None:
+                results[index] = RequestResult(False, failure.message, 400)
+                continue
+            if start_date in booked_days:
+                results[index] = RequestResult(False, "A time entry already exists for this day", 409)
+                continue
+            if time_entry.entry_type == TimeEntryType.VACATION_ENTRY:
+                # The entries of the import draw from the same vacation balance
+                if remaining_vacation_minutes - time_entry.get_duration() < 0:
+                    results[index] = RequestResult(False, "Vacation time exceeds the remaining vacation time.", 400)
+                    continue
+                remaining_vacation_minutes -= time_entry.get_duration()
+            booked_days.add(start_date)
+            warning = next((result for result in validation_results
+                            if result.status == ValidationStatus.WARNING), None)
+            if warning is not None:
+                results[index] = RequestResult(
+                    True, f"{time_entry.entry_type.name} entry added with warnings ´{warning.message}´", 200)
+            else:
+                results[index] = RequestResult(True, f"{time_entry.entry_type.name} entry added successfully", 200)
+            time_entries.append((index, time_entry))
+
+        creation_result = self.time_entry_repository.create_time_entries([time_entry for _, time_entry in time_entries])
+        if not creation_result.is_successful:
+            return creation_result
+        for (index, _), time_entry_id in zip(time_entries, creation_result.data):
+            results[index].data = {"_id": str(time_entry_id)}
+        if time_entries:
+            self._apply_imported_time_entries(username, [time_entry for _, time_entry in time_entries])
+        return RequestResult(True, f"{len(time_entries)} of {len(results)} time entries imported", 200,
+                             [dict(result.to_dict(), row=row_number) for row_number, result in enumerate(results, 1)])
+
+    def _get_import_timesheets(self, username: str, months: set) -> dict:
+        """
+        Ensures that the timesheets of the imported months exist and reads them with a single query.
+
+        :param username: The username of the user importing the time entries.
+        :param months: The (month, year) tuples of the imported time entries.
+        :return: A dictionary mapping the (month, year) tuples to the timesheet, or to a failed RequestResult if
+                 the timesheet does not exist and cannot be created.
+        """
+        timesheets = {}
+        for month, year in months:
+            result = self.timesheet_service.ensure_timesheet_exists(username, month, year)
+            if not result.is_successful:
+                timesheets[(month, year)] = RequestResult(False, result.message, result.status_code)
+        found_timesheets = self.timesheet_service.get_timesheets_by_months(
+            [(username, month, year) for month, year in months if (month, year) not in timesheets])
+        for month, year in months:
+            if (month, year) not in timesheets:
+                timesheets[(month, year)] = found_timesheets.get((username, month, year),
+                                                                 RequestResult(False, "Timesheet not found", 404))
+        return timesheets
+
+    def _apply_imported_time_entries(self, username: str, time_entries: list):
+        """
+        Updates the balances of the user and the totals of the timesheets by the imported time entries, once per
+        balance and timesheet, and recalculates the overtime from the earliest imported month on.
+
+        :param username: The username of the user importing the time entries.
+        :param time_entries: The imported TimeEntry objects.
+        """
+        total_minutes = sum(time_entry.get_duration() for time_entry in time_entries)
+        vacation_minutes = sum(time_entry.get_duration() for time_entry in time_entries
+                               if time_entry.entry_type == TimeEntryType.VACATION_ENTRY)
+        if vacation_minutes:
+            self.user_service.remove_vacation_minutes(username, vacation_minutes)
+        self.user_service.add_overtime_minutes(username, total_minutes)
+
+        deltas = {}
+        for time_entry in time_entries:
+            total_delta, vacation_delta = deltas.get(time_entry.timesheet_id, (0, 0))
+            deltas[time_entry.timesheet_id] = (
+                total_delta + time_entry.get_duration(),
+                vacation_delta + (time_entry.get_duration()
+                                  if time_entry.entry_type == TimeEntryType.VACATION_ENTRY else 0))
+        for timesheet_id, (total_delta, vacation_delta) in deltas.items():
+            self.timesheet_service.apply_time_entry_delta(timesheet_id, total_delta, vacation_delta)
+        # The overtime of a month is carried into all following months, so it is recalculated once from the
+        # earliest imported month on
+        earliest_entry = min(time_entries, key=lambda time_entry: time_entry.start_time)
+        self.timesheet_service.calculate_overtime(earliest_entry.timesheet_id)
+
     @jwt_required()
     def update_time_entry(self, entry_id: str, update_data: dict) -> RequestResult:
         """
@@ -236,7 +438,8 @@ class TimeEntryService:
                 return RequestResult(False, "A time entry already exists for this date", status_code=409)
 
         # Validate the updated entry through strategy pattern
-        strategy_validation_results = self._strategy_validate(updated_time_entry)
+        context = TimeEntryValidationContext(self.user_service.get_contract_info(get_jwt_identity()).data)
+        strategy_validation_results = self._strategy_validate(updated_time_entry, context)
         for result in strategy_validation_results:
             if result.status == ValidationStatus.FAILURE:
                 return RequestResult(False, result.message, status_code=400)
@@ -246,8 +449,6 @@ class TimeEntryService:
         if not repo_result.is_successful:  #pragma: no cover
             return repo_result
 
-        self.timesheet_service.calculate_overtime(existing_entry_data['timesheetId'])
-
         if existing_entry_data['entryType'] == TimeEntryType.VACATION_ENTRY.value:
             existing_entry = VacationEntry.from_dict(existing_entry_data)
             update_entry = VacationEntry.from_dict(update_data)
@@ -265,9 +466,16 @@ class TimeEntryService:
         elif update_entry.get_duration() < existing_entry.get_duration():
             self.user_service.remove_overtime_minutes(get_jwt_identity(),
                                                       abs(update_entry.get_duration() - existing_entry.get_duration()))
-        result = self.timesheet_service.set_total_and_vacation_time(updated_time_entry.timesheet_id)
+        existing_vacation_minutes = existing_entry.get_duration() \
+            if existing_entry.entry_type == TimeEntryType.VACATION_ENTRY else 0
+        updated_vacation_minutes = updated_time_entry.get_duration() \
+            if updated_time_entry.entry_type == TimeEntryType.VACATION_ENTRY else 0
+        result = self.timesheet_service.apply_time_entry_delta(
+            updated_time_entry.timesheet_id, updated_time_entry.get_duration() - existing_entry.get_duration(),
+            updated_vacation_minutes - existing_vacation_minutes)
         if not result.is_successful:
             return result
+        self.timesheet_service.calculate_overtime(existing_entry_data['timesheetId'])
         if validation_result.status == ValidationStatus.WARNING:
             return RequestResult(True, f"entry updated with warnings ´{validation_result.message}´",
                                  status_code=200)
@@ -299,10 +507,14 @@ class TimeEntryService:
             self.user_service.add_vacation_minutes(get_jwt_identity(), time_entry.get_duration())
 
         self.user_service.remove_overtime_minutes(get_jwt_identity(), time_entry.get_duration())
-        self.timesheet_service.calculate_overtime(time_entry_data['timesheetId'])
 
-        result = self.timesheet_service.set_total_and_vacation_time(time_entry.timesheet_id)
-        if not result.is_successful and delete_result.is_successful:
+        if not delete_result.is_successful:
+            return delete_result
+        vacation_minutes = time_entry.get_duration() if time_entry.entry_type == TimeEntryType.VACATION_ENTRY else 0
+        result = self.timesheet_service.apply_time_entry_delta(time_entry.timesheet_id, -time_entry.get_duration(),
+                                                               -vacation_minutes)
+        self.timesheet_service.calculate_overtime(time_entry_data['timesheetId'])
+        if not result.is_successful:
             result.message = "Time entry deleted, but total hours could not be updated."
             return result
         return delete_result
@@ -350,3 +562,24 @@ class TimeEntryService:
 
         sorted_time_entries = sorted(time_entries, key=lambda entry: entry.start_time, reverse=True)
         return RequestResult(is_successful=True, message="", status_code=200, data=sorted_time_entries)
+
+    def get_entries_of_timesheets(self, timesheet_ids: list) -> dict:
+        """
+        Retrieves the time entries of several timesheets with a single query and converts them into
+        TimeEntry objects, sorted like the result of get_entries_of_timesheet.
+
+        :param timesheet_ids: The IDs of the timesheets for which to retrieve entries.
+        :type timesheet_ids: list
+        :return: A dictionary mapping the timesheet IDs to the lists of their time entries.
+        :rtype: dict
+        """
+        time_entries = {str(timesheet_id): [] for timesheet_id in timesheet_ids}
+        for entry_data in self.time_entry_repository.get_time_entries_by_timesheet_ids(timesheet_ids):
+            entry_type = TimeEntryType.get_type_by_value(entry_data['entryType'])
+            if entry_type == TimeEntryType.WORK_ENTRY:
+                time_entries[entry_data['timesheetId']].append(WorkEntry.from_dict(entry_data))
+            elif entry_type == TimeEntryType.VACATION_ENTRY:
+                time_entries[entry_data['timesheetId']].append(VacationEntry.from_dict(entry_data))
+        for entries in time_entries.values():
+            entries.sort(key=lambda entry: entry.start_time, reverse=True)
+        return time_entries
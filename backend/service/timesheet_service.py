@@ -14,6 +14,7 @@ from model.time_sheet_validator.timesheet_validator import TimesheetValidator
 from model.time_sheet_validator.weekly_working_hours_strategy import WeeklyHoursStrategy
 from model.timesheet import Timesheet
 from model.timesheet_status import TimesheetStatus
+from service.document.document_cache import DocumentCache
 from service.notification_service import NotificationService
 from service.user_service import UserService
 
@@ -25,14 +26,20 @@ class TimesheetService:
     TimesheetRepository to interact with the model-data layer.
     """
 
-    def __init__(self):
+    def __init__(self, user_service: UserService = None, notification_service: NotificationService = None):
+        """
+        Initializes a new instance of the TimesheetService class.
+
+        :param user_service: The UserService to use. A new instance is created if none is given.
+        :param notification_service: The NotificationService to use. A new instance is created if none is given.
+        """
         self.timesheet_repository = TimesheetRepository.get_instance()
         self.time_entry_repository = TimeEntryRepository.get_instance()
-        self.user_service = UserService()
-        self.time_entry_repository = TimeEntryRepository.get_instance()
-        self.notification_service = NotificationService()
+        self.user_service = user_service or UserService()
+        self.notification_service = notification_service or NotificationService()
+        self.document_cache = DocumentCache.get_instance()
         self.timesheet_validator = TimesheetValidator()
-        self.timesheet_validator.add_validation_rule(BeforeSignedTimesheetsStrategy())
+        self.timesheet_validator.add_validation_rule(BeforeSignedTimesheetsStrategy(self.timesheet_repository))
         self.timesheet_validator.add_validation_rule(WeeklyHoursStrategy())
 
     def ensure_timesheet_exists(self, username: str, month: int, year: int):
@@ -70,28 +77,91 @@ class TimesheetService:
 
         return RequestResult(False, "Failed to create timesheet", 500)
 
-    def set_total_and_vacation_time(self, timesheet_id: str):
+    def _compute_total_and_vacation_time(self, timesheet_id: str):
         """
-        Updates the total hours of a timesheet based on the sum of all its time entries.
+        Computes the total time and vacation minutes of a timesheet from all its time entries.
 
-        :param timesheet_id: The ID of the timesheet to update.
-        :type timesheet_id: str
+        :param timesheet_id: The ID of the timesheet.
+        :return: A tuple of the total time and the vacation minutes.
         """
         time_entries_data = self.time_entry_repository.get_time_entries_by_timesheet_id(timesheet_id)
         time_entries = [TimeEntry.from_dict(entry_data) for entry_data in time_entries_data]
         vacation_time = sum([entry.get_duration() for entry in time_entries
                              if entry.entry_type.value == "Vacation Entry"])
         total_time = sum([entry.get_duration() for entry in time_entries])
-        timesheet = self.timesheet_repository.get_timesheet_by_id(timesheet_id)
-        if not timesheet:
+        return total_time, vacation_time
+
+    def set_total_and_vacation_time(self, timesheet_id: str):
+        """
+        Updates the total hours of a timesheet based on the sum of all its time entries.
+        This is a full recomputation, changes of single entries are applied with apply_time_entry_delta.
+
+        :param timesheet_id: The ID of the timesheet to update.
+        :type timesheet_id: str
+        """
+        total_time, vacation_time = self._compute_total_and_vacation_time(timesheet_id)
+        result = self.timesheet_repository.set_totals(timesheet_id, total_time, vacation_time)
+        if result.status_code == 404:
             return RequestResult(False, "Timesheet not found", 404)
-        timesheet['totalTime'] = total_time
-        timesheet['vacationMinutes'] = vacation_time
-        result = self.timesheet_repository.update_timesheet_by_dict(timesheet)
         if result.is_successful:
             return RequestResult(True, "Total time updated", 200)
         return RequestResult(False, "Failed to update total time", 500)
 
+    def apply_time_entry_delta(self, timesheet_id: str, total_time_delta: int, vacation_minutes_delta: int = 0):
+        """
+        Updates the total hours and vacation minutes of a timesheet by the change of a single time entry,
+        without reading the other entries of the timesheet.
+
+        :param timesheet_id: The ID of the timesheet to update.
+        :param total_time_delta: The change of the total time in minutes.
+        :param vacation_minutes_delta: The change of the vacation minutes.
+        :return: The result of the update operation.
+        """
+        result = self.timesheet_repository.increment_totals(timesheet_id, total_time_delta, vacation_minutes_delta)
+        if result.status_code == 404:
+            return RequestResult(False, "Timesheet not found", 404)
+        if result.is_successful:
+            return RequestResult(True, "Total time updated", 200)
+        return RequestResult(False, "Failed to update total time", 500)
+
+    def reconcile_total_and_vacation_time(self, timesheet_id: str = None):
+        """
+        Verifies the incrementally maintained totals against a full recomputation and corrects
+        every timesheet whose stored totals differ. The totals are only overwritten if they have not changed
+        since they were read, a timesheet changed in the meantime is left to the next reconciliation.
+        A timesheet that cannot be corrected does not stop the correction of the others.
+
+        :param timesheet_id: The ID of the timesheet to verify. If None, all timesheets are verified.
+        :return: A RequestResult with the IDs of the corrected timesheets in the data field.
+        """
+        if timesheet_id is not None:
+            timesheet_data = self.timesheet_repository.get_timesheet_by_id(timesheet_id)
+            if timesheet_data is None:
+                return RequestResult(False, "Timesheet not found", 404)
+            timesheets_data = [timesheet_data]
+        else:
+            timesheets_data = self.timesheet_repository.get_timesheets()
+        corrected_timesheet_ids = []
+        failed_timesheet_ids = []
+        for timesheet_data in timesheets_data:
+            total_time, vacation_time = self._compute_total_and_vacation_time(timesheet_data["_id"])
+            if (timesheet_data.get("totalTime", 0) == total_time
+                    and timesheet_data.get("vacationMinutes", 0) == vacation_time):
+                continue
+            result = self.timesheet_repository.set_totals(timesheet_data["_id"], total_time, vacation_time,
+                                                          timesheet_data.get("totalTime"),
+                                                          timesheet_data.get("vacationMinutes"),
+                                                          check_expected=True)
+            if result.is_successful:
+                corrected_timesheet_ids.append(str(timesheet_data["_id"]))
+            elif result.status_code != 409:
+                failed_timesheet_ids.append(str(timesheet_data["_id"]))
+        if failed_timesheet_ids:
+            return RequestResult(False, f"{len(corrected_timesheet_ids)} timesheets corrected, failed to correct "
+                                        f"{', '.join(failed_timesheet_ids)}", 500, corrected_timesheet_ids)
+        return RequestResult(True, f"{len(corrected_timesheet_ids)} timesheets corrected", 200,
+                             corrected_timesheet_ids)
+
     @jwt_required()
     def sign_timesheet(self, timesheet_id: str):
         """
@@ -118,7 +188,6 @@ class TimesheetService:
             return RequestResult(False, "Total time not found", 404)
         total_time = timesheet_data['totalTime']
         contract_data = hiwi_data.contract_info
-        #print("percentage: " + str(total_time / (contract_data.working_hours*60)))
         if contract_data is None:
             return RequestResult(False, "Contract data for hiwi not found.", 404)
         if total_time / (contract_data.working_hours*60) < 0.8:
@@ -131,15 +200,21 @@ class TimesheetService:
         for result in validation_result:
             if result.status == ValidationStatus.FAILURE:
                 return RequestResult(False, result.message, 400)
-        hiwi_full_name = hiwi_data.personal_info.first_name + " " + hiwi_data.personal_info.last_name
-        notification_result = self.notification_service.send_notification({"receiver": supervisor_username,
-                                                                           "message_type": "Timesheet Status Change",
-                                                                           "message":
-                                                                               f"{hiwi_full_name} signed timesheet \n"
-                                                                               f"{timesheet_data['month']}/"
-                                                                               f"{timesheet_data['year']}"})
 
-        return self._set_timesheet_status(timesheet_id, TimesheetStatus.WAITING_FOR_APPROVAL)
+        updated_timesheet_data = self.timesheet_repository.transition_status(
+            timesheet_id, [TimesheetStatus.NOT_SUBMITTED, TimesheetStatus.REVISION],
+            TimesheetStatus.WAITING_FOR_APPROVAL)
+        if updated_timesheet_data is None:
+            # The timesheet has been signed or deleted since it was read
+            return self._get_transition_error(timesheet_id, "Timesheet already signed", "Timesheet already signed")
+        self.document_cache.invalidate_timesheet(timesheet_id)
+        hiwi_full_name = hiwi_data.personal_info.first_name + " " + hiwi_data.personal_info.last_name
+        self.notification_service.send_notification({"receiver": supervisor_username,
+                                                     "message_type": "Timesheet Status Change",
+                                                     "message": f"{hiwi_full_name} signed timesheet \n"
+                                                                f"{timesheet_data['month']}/"
+                                                                f"{timesheet_data['year']}"})
+        return RequestResult(True, "Timesheet status updated successfully", 200, updated_timesheet_data)
 
     @jwt_required()
     def approve_timesheet(self, timesheet_id: str):
@@ -152,20 +227,76 @@ class TimesheetService:
         :return: The result of the approval operation.
         :rtype: RequestResult
         """
-        timesheet_data = self.timesheet_repository.get_timesheet_by_id(timesheet_id)
+        timesheet_data = self.timesheet_repository.transition_status(
+            timesheet_id, [TimesheetStatus.WAITING_FOR_APPROVAL], TimesheetStatus.COMPLETE)
         if timesheet_data is None:
-            return RequestResult(False, "Timesheet not found", 404)
-        if timesheet_data['status'] == 'Complete':
-            return RequestResult(False, "Timesheet already approved", 409)
-        if timesheet_data['status'] != 'Waiting for Approval':
-            return RequestResult(False, "Timesheet cannot be approved", 400)
-        notification_result = self.notification_service.send_notification({"receiver": timesheet_data["username"],
-                                                                           "message_type": "Timesheet Status Change",
-                                                                           "message": f"Timesheet approved and "
-                                                                                      f"marked as completed: \n"
-                                                                                      f"{timesheet_data['month']}/"
-                                                                                      f"{timesheet_data['year']}"})
-        return self._set_timesheet_status(timesheet_id, TimesheetStatus.COMPLETE)
+            return self._get_transition_error(timesheet_id, "Timesheet already approved",
+                                              "Timesheet cannot be approved")
+        self.document_cache.invalidate_timesheet(timesheet_id)
+        self._prerender_document(timesheet_id)
+        self.notification_service.send_notification({"receiver": timesheet_data["username"],
+                                                     "message_type": "Timesheet Status Change",
+                                                     "message": f"Timesheet approved and "
+                                                                f"marked as completed: \n"
+                                                                f"{timesheet_data['month']}/"
+                                                                f"{timesheet_data['year']}"})
+        return RequestResult(True, "Timesheet status updated successfully", 200, timesheet_data)
+
+    @jwt_required()
+    def approve_timesheets(self, timesheet_ids: list):
+        """
+        Method used by the supervisor to approve several timesheets at once. The timesheets are read with a single
+        query, every eligible timesheet is approved with a conditional update and the notifications of the Hiwis are
+        sent as one batch.
+
+        :param timesheet_ids: The IDs of the timesheets to approve.
+        :type timesheet_ids: list
+        :return: The result of the approval operation, containing the result of every timesheet ID as data.
+        :rtype: RequestResult
+        """
+        results = {}
+        valid_ids = []
+        for timesheet_id in timesheet_ids:
+            if not isinstance(timesheet_id, str) or not ObjectId.is_valid(timesheet_id):
+                results[str(timesheet_id)] = RequestResult(False, "Invalid timesheet ID", 400)
+            else:
+                valid_ids.append(timesheet_id)
+        valid_ids = list(dict.fromkeys(valid_ids))
+        timesheets_data = {str(timesheet_data['_id']): timesheet_data
+                           for timesheet_data in self.timesheet_repository.get_timesheets_by_ids(valid_ids) or []}
+        eligible_ids = []
+        for timesheet_id in valid_ids:
+            timesheet_data = timesheets_data.get(timesheet_id)
+            if timesheet_data is None:
+                results[timesheet_id] = RequestResult(False, "Timesheet not found", 404)
+            elif timesheet_data['status'] == TimesheetStatus.COMPLETE.value:
+                results[timesheet_id] = RequestResult(False, "Timesheet already approved", 409)
+            elif timesheet_data['status'] != TimesheetStatus.WAITING_FOR_APPROVAL.value:
+                results[timesheet_id] = RequestResult(False, "Timesheet cannot be approved", 400)
+            else:
+                eligible_ids.append(timesheet_id)
+
+        approved_ids = self.timesheet_repository.transition_statuses(
+            eligible_ids, [TimesheetStatus.WAITING_FOR_APPROVAL], TimesheetStatus.COMPLETE)
+        if approved_ids is None:
+            return RequestResult(False, "Timesheets could not be approved", 500)
+        approved_ids = {str(approved_id) for approved_id in approved_ids}
+        notifications_data = []
+        for timesheet_id in eligible_ids:
+            if timesheet_id not in approved_ids:
+                # The status was changed by a concurrent request after it was read
+                results[timesheet_id] = RequestResult(False, "Timesheet status changed concurrently", 409)
+                continue
+            timesheet_data = timesheets_data[timesheet_id]
+            self.document_cache.invalidate_timesheet(timesheet_id)
+            self._prerender_document(timesheet_id)
+            results[timesheet_id] = RequestResult(True, "Timesheet status updated successfully", 200)
+            notifications_data.append({"receiver": timesheet_data["username"],
+                                       "message": f"Timesheet approved and marked as completed: \n"
+                                                  f"{timesheet_data['month']}/{timesheet_data['year']}"})
+        self.notification_service.send_notifications(notifications_data)
+        return RequestResult(True, f"{len(approved_ids)} of {len(results)} timesheets approved", 200,
+                             {timesheet_id: result.to_dict() for timesheet_id, result in results.items()})
 
     @jwt_required()
     def request_change(self, timesheet_id: str, change_message: str):
@@ -178,44 +309,54 @@ class TimesheetService:
         :return: The result of the request change operation.
         :rtype: RequestResult
         """
-        timesheet_data = self.timesheet_repository.get_timesheet_by_id(timesheet_id)
+        timesheet_data = self.timesheet_repository.transition_status(
+            timesheet_id, [TimesheetStatus.WAITING_FOR_APPROVAL], TimesheetStatus.REVISION)
         if timesheet_data is None:
-            return RequestResult(False, "Timesheet not found", 404)
-        if timesheet_data['status'] == 'Complete':
-            return RequestResult(False, "Timesheet already approved", 409)
-        if timesheet_data['status'] != 'Waiting for Approval':
-            return RequestResult(False, "HiWi didn't submitted the timesheet", 400)
+            return self._get_transition_error(timesheet_id, "Timesheet already approved",
+                                              "HiWi didn't submitted the timesheet")
+        self.document_cache.invalidate_timesheet(timesheet_id)
+        supervisor_full_name = "Your supervisor"
         hiwi_data = self.user_service.get_profile(timesheet_data["username"])
-        if hiwi_data is None:
-            return RequestResult(False, "HiWi not found", 404)
-        supervisor = self.user_service.get_profile(hiwi_data.supervisor)
-        if supervisor is None:
-            return RequestResult(False, "Supervisor not found", 404)
-        supervisor_full_name = supervisor.personal_info.first_name + " " + supervisor.personal_info.last_name
+        supervisor = self.user_service.get_profile(hiwi_data.supervisor) if hiwi_data is not None else None
+        if supervisor is not None:
+            supervisor_full_name = supervisor.personal_info.first_name + " " + supervisor.personal_info.last_name
 
         self.notification_service.send_notification({"receiver": timesheet_data["username"],
-                                                                           "message_type": "Timesheet Status Change",
-                                                                           "message": f"{supervisor_full_name} requests changes to your timesheet: "
-                                                                                      f"{timesheet_data['month']}/"
-                                                                                      f"{timesheet_data['year']} \n"
-                                                                                      f"Message: {change_message}"})
-        return self._set_timesheet_status(timesheet_id, TimesheetStatus.REVISION)
+                                                     "message_type": "Timesheet Status Change",
+                                                     "message": f"{supervisor_full_name} requests changes to your timesheet: "
+                                                                f"{timesheet_data['month']}/"
+                                                                f"{timesheet_data['year']} \n"
+                                                                f"Message: {change_message}"})
+        return RequestResult(True, "Timesheet status updated successfully", 200, timesheet_data)
 
-    def _set_timesheet_status(self, timesheet_id: str, status: TimesheetStatus):
+    def _prerender_document(self, timesheet_id: str):
         """
-        Sets the status of a timesheet.
-        
-        :param timesheet_id: The ID of the timesheet to update
-        :param status: The new status of the timesheet
-        :return: The result of the status update operation
+        Enqueues the rendering of the document of an approved timesheet, so it can be downloaded right away.
+
+        :param timesheet_id: The ID of the approved timesheet.
         """
-        result = self.timesheet_repository.set_timesheet_status(timesheet_id, status)
-        if result.is_successful:
-            timesheet_data = self.timesheet_repository.get_timesheet_by_id(timesheet_id)
-            timesheet = Timesheet.from_dict(timesheet_data)
-            timesheet.last_signature_change = datetime.utcnow()
-            self.timesheet_repository.update_timesheet(timesheet)
-        return result
+        # Local import needed to avoid circular imports
+        from service.service_container import ServiceContainer
+        ServiceContainer.get_instance().document_service.prerender_document(timesheet_id)
+
+    def _get_transition_error(self, timesheet_id: str, complete_message: str, invalid_status_message: str):
+        """
+        Determines why a status transition of a timesheet was rejected. Only called after the conditional
+        update did not match, so a successful transition needs no additional read.
+
+        :param timesheet_id: The ID of the timesheet
+        :param complete_message: The message if the timesheet is already complete
+        :param invalid_status_message: The message if the timesheet has any other unexpected status
+        :return: A RequestResult describing the error
+        """
+        timesheet_data = self.timesheet_repository.get_timesheet_by_id(timesheet_id)
+        if timesheet_data is None:
+            return RequestResult(False, "Timesheet not found", 404)
+        if timesheet_data['status'] == TimesheetStatus.COMPLETE.value:
+            return RequestResult(False, complete_message, 409)
+        if timesheet_data['status'] == TimesheetStatus.WAITING_FOR_APPROVAL.value:
+            return RequestResult(False, invalid_status_message, 409)
+        return RequestResult(False, invalid_status_message, 400)
 
     def _create_timesheet(self, username: str, month: int, year: int):
         """
@@ -237,20 +378,67 @@ class TimesheetService:
             return RequestResult(True, "Timesheet created", 201, {"_id": result.data["_id"]})
         return RequestResult(False, "Failed to create timesheet", 500)
 
-    def _recalculate_overtime(self, username: str, month: int, year: int):
-        for _ in range(4):
-            next_month = month + 1 if month < 12 else 1
-            if next_month == 1:
-                year += 1
-            next_timesheet = self.timesheet_repository.get_timesheet(username, next_month, year)
-            if next_timesheet is not None:
-                self.calculate_overtime(next_timesheet["_id"])
-            month = next_month
+    @staticmethod
+    def _get_previous_month(month: int, year: int):
+        """
+        Returns the month preceding the given month.
+
+        :param month: The month
+        :param year: The year of the month
+        :return: A tuple of the previous month and its year
+        """
+        if month > 1:
+            return month - 1, year
+        return 12, year - 1
+
+    def _update_overtime_ledger(self, username: str, month: int, year: int):
+        """
+        Updates the overtime ledger of a Hiwi from the given month onwards. The overtime stored in a timesheet
+        is the running balance, i.e. the overtime of the month plus the balance carried over from the previous month.
+        The balances are computed in a single chronological pass over the affected timesheets, and only the changed
+        balances are written with one bulk write. Completed timesheets keep their balance and carry it over.
 
+        :param username: The username of the Hiwi
+        :param month: The first month whose balance has changed
+        :param year: The year of the first changed month
+        :return: A dictionary mapping the IDs of the affected timesheets to their overtime balance,
+                 or None if the ledger could not be updated
+        """
+        previous_month, previous_year = self._get_previous_month(month, year)
+        timesheets_data = self.timesheet_repository.get_timesheets_since(username, previous_month, previous_year)
+        if timesheets_data is None:
+            return None
+        hiwi = self.user_service.get_profile(username)
+        if hiwi is None or hiwi.contract_info is None:
+            return None
+        monthly_working_minutes = hiwi.contract_info.working_hours * 60
+
+        overtime_by_month = {}
+        overtime_by_timesheet_id = {}
+        changed_overtime = {}
+        for timesheet_data in timesheets_data:
+            key = (timesheet_data["year"], timesheet_data["month"])
+            stored_overtime = timesheet_data.get("overtime", 0)
+            if key < (year, month) or timesheet_data["status"] == TimesheetStatus.COMPLETE.value:
+                overtime = stored_overtime
+            else:
+                carry_over_month, carry_over_year = self._get_previous_month(timesheet_data["month"],
+                                                                             timesheet_data["year"])
+                carry_over = overtime_by_month.get((carry_over_year, carry_over_month), 0)
+                overtime = timesheet_data.get("totalTime", 0) - monthly_working_minutes + carry_over
+                if overtime != stored_overtime:
+                    changed_overtime[timesheet_data["_id"]] = overtime
+            overtime_by_month[key] = overtime
+            overtime_by_timesheet_id[timesheet_data["_id"]] = overtime
+
+        result = self.timesheet_repository.set_overtime_values(changed_overtime)
+        if not result.is_successful:
+            return None
+        return overtime_by_timesheet_id
 
     def calculate_overtime(self, timesheet_id):
         """
-        Calculates the overtime for a timesheet.
+        Calculates the overtime for a timesheet and updates the balances of all following months.
 
         :param timesheet_id: The ID of the timesheet
         :return: The result of the overtime calculation
@@ -258,40 +446,29 @@ class TimesheetService:
         timesheet_data = self.timesheet_repository.get_timesheet_by_id(timesheet_id)
         if timesheet_data is None:
             return RequestResult(False, "Timesheet not found", 404)
-        timee_entries_data = self.time_entry_repository.get_time_entries_by_timesheet_id(timesheet_id)
-        if timee_entries_data is None:
-            return RequestResult(False, "No time entries found", 404)
-        total_minutes = 0
-        for entry in timee_entries_data:
-            time_entry = TimeEntry.from_dict(entry)
-            total_minutes += time_entry.get_duration()
-        hiwi = self.user_service.get_profile(timesheet_data["username"])
-        monthly_working_hours = hiwi.contract_info.working_hours
-        previous_overtime = self.get_previous_overtime(timesheet_data["username"], timesheet_data["month"],
-                                                       timesheet_data["year"])
-        overtime_minutes = total_minutes - (monthly_working_hours * 60) + previous_overtime
-        timesheet_data["overtime"] = overtime_minutes
-        if timesheet_data["status"] != TimesheetStatus.COMPLETE.value:
-            self.timesheet_repository.update_timesheet_by_dict(timesheet_data)
-            self._recalculate_overtime(timesheet_data["username"], timesheet_data["month"], timesheet_data["year"])
-            return RequestResult(True, "", 200, overtime_minutes)
-        return RequestResult(False, "Overtime can't be edited when Timesheet is complete", 409)
+        if timesheet_data["status"] == TimesheetStatus.COMPLETE.value:
+            return RequestResult(False, "Overtime can't be edited when Timesheet is complete", 409)
+        overtime_by_timesheet_id = self._update_overtime_ledger(timesheet_data["username"], timesheet_data["month"],
+                                                                timesheet_data["year"])
+        if overtime_by_timesheet_id is None:
+            return RequestResult(False, "Failed to update overtime", 500)
+        return RequestResult(True, "", 200, overtime_by_timesheet_id[timesheet_data["_id"]])
 
     def get_previous_overtime(self, username: str, current_month: int, current_year: int):
         """
-        Retrieves the overtime from the previous month for a Hiwi.
+        Retrieves the overtime from the previous month for a Hiwi. As every timesheet stores its running balance,
+        this is a single indexed read.
 
         :param username: The username of the Hiwi
         :param current_month: The current month
         :param current_year: The current year
         :return: The overtime from the previous month
         """
-        previous_month = current_month - 1 if current_month > 1 else 12
-        previous_year = current_year if current_month > 1 else current_year - 1
-        timesheet_data = self.timesheet_repository.get_timesheet(username, previous_month, previous_year)
-        if timesheet_data is None:
+        previous_month, previous_year = self._get_previous_month(current_month, current_year)
+        overtime = self.timesheet_repository.get_overtime(username, previous_month, previous_year)
+        if overtime is None:
             return 0
-        return timesheet_data.get("overtime", 0)
+        return overtime
 
     def delete_timesheet_by_id(self, timesheet_id: str):
         """
@@ -307,6 +484,7 @@ class TimesheetService:
         self.user_service.remove_vacation_minutes(timesheet_data["username"])
         result = self.timesheet_repository.delete_timesheet(timesheet_id)
         if result.is_successful:
+            self.document_cache.invalidate_timesheet(timesheet_id)
             hiwi = self.user_service.get_profile(timesheet_data["username"])
             monthly_working_hours = hiwi.contract_info.working_hours
             self.user_service.add_overtime_minutes(timesheet_data["username"], monthly_working_hours * 60)
@@ -458,6 +636,29 @@ class TimesheetService:
         return RequestResult(True, "", 200,
                              Timesheet.from_dict(timesheet_data))
 
+    def get_timesheets_by_ids(self, timesheet_ids: list) -> dict:
+        """
+        Retrieves several timesheets by their IDs with a single query.
+
+        :param timesheet_ids: The IDs of the timesheets.
+        :return: A dictionary mapping the IDs to the timesheets that were found
+        """
+        return {str(timesheet_data["_id"]): Timesheet.from_dict(timesheet_data)
+                for timesheet_data in self.timesheet_repository.get_timesheets_by_ids(timesheet_ids) or []}
+
+    def get_timesheets_by_months(self, keys: list) -> dict:
+        """
+        Retrieves the timesheets of several users and months with a single query.
+
+        :param keys: The (username, month, year) tuples of the timesheets.
+        :return: A dictionary mapping the (username, month, year) tuples to the timesheets that were found
+        """
+        timesheets = {}
+        for timesheet_data in self.timesheet_repository.get_timesheets_by_months(keys):
+            timesheet = Timesheet.from_dict(timesheet_data)
+            timesheets[(timesheet.username, timesheet.month, timesheet.year)] = timesheet
+        return timesheets
+
     def is_user_archived_by_timesheet_id(self, timesheet_id: str):
         """
         Checks if the user associated with the timesheet is archived.
@@ -11,7 +11,6 @@ from model.request_result import RequestResult
 from model.user.role import UserRole
 from model.user.supervisor import Supervisor
 from model.user.user import User
-import service.file_service
 from utils.security_utils import SecurityUtils
 
 
@@ -109,24 +108,51 @@ class UserService:
 
         return round(((monthly_working_hours * 20 * 3.95) / (85 * 12) * 2), 0) / 2
 
-    def add_overtime_minutes(self, username: str, minutes: int):
+    def _increment_contract_minutes(self, username: str, overtime_minutes=0, vacation_minutes=0):
         """
-        Adds overtime hours to a user identified by their username.
+        Changes the overtime and vacation balance of a user atomically. The user is only read if the update
+        did not match, to report why the balance could not be changed.
 
-        :param username: The username of the user to add overtime hours to.
-        :param minutes: The number of minutes to add to the user's overtime balance.
+        :param username: The username of the user.
+        :param overtime_minutes: The number of minutes to add to the overtime balance.
+        :param vacation_minutes: The number of minutes to add to the vacation balance.
         :return: A RequestResult object containing the result of the operation.
         """
+        result = self.user_repository.increment_contract_minutes(username, overtime_minutes, vacation_minutes)
+        if result.status_code != 404:
+            return result
         user_data = self.user_repository.find_by_username(username)
         if not user_data:
             return RequestResult(False, "User not found", status_code=404)
-        if user_data['isArchived']:
+        if user_data.get('isArchived'):
             return RequestResult(False, "User is archived", status_code=400)
+        return RequestResult(False, "User has no contract information", status_code=400)
+
+    def _get_monthly_vacation_minutes(self, username: str):
+        """
+        Reads the working hours of a user and calculates the vacation the user earns per month.
+
+        :param username: The username of the user.
+        :return: A tuple of the monthly vacation hours and a RequestResult if the user cannot be changed, otherwise None.
+        """
+        user_data = self.user_repository.find_by_username(username)
+        if not user_data:
+            return None, RequestResult(False, "User not found", status_code=404)
+        if user_data['isArchived']:
+            return None, RequestResult(False, "User is archived", status_code=400)
         if 'contractInfo' not in user_data:
-            return RequestResult(False, "User has no contract information", status_code=400)
-        user_data['contractInfo']['overtimeMinutes'] += minutes
-        user = UserFactory.create_user_if_factory_exists(user_data)
-        return self.user_repository.update_user(user)
+            return None, RequestResult(False, "User has no contract information", status_code=400)
+        return self._calculate_vacation_minutes(user_data['contractInfo']['workingHours']), None
+
+    def add_overtime_minutes(self, username: str, minutes: int):
+        """
+        Adds overtime hours to a user identified by their username.
+
+        :param username: The username of the user to add overtime hours to.
+        :param minutes: The number of minutes to add to the user's overtime balance.
+        :return: A RequestResult object containing the result of the operation.
+        """
+        return self._increment_contract_minutes(username, overtime_minutes=minutes)
 
     def remove_overtime_minutes(self, username: str, minutes: int):
         """
@@ -136,16 +162,7 @@ class UserService:
         :param minutes: The number of minutes to remove from the user's overtime balance.
         :return: A RequestResult object containing the result of the operation.
         """
-        user_data = self.user_repository.find_by_username(username)
-        if not user_data:
-            return RequestResult(False, "User not found", status_code=404)
-        if user_data['isArchived']:
-            return RequestResult(False, "User is archived", status_code=400)
-        if 'contractInfo' not in user_data:
-            return RequestResult(False, "User has no contract information", status_code=400)
-        user_data['contractInfo']['overtimeMinutes'] -= minutes
-        user = UserFactory.create_user_if_factory_exists(user_data)
-        return self.user_repository.update_user(user)
+        return self._increment_contract_minutes(username, overtime_minutes=-minutes)
 
     def add_vacation_minutes(self, username: str, minutes: int = None):
         """
@@ -155,21 +172,12 @@ class UserService:
         :param minutes: The number of minutes to add to the user's vacation balance.
         :return: A RequestResult object containing the result of the operation.
         """
-        user_data = self.user_repository.find_by_username(username)
-        if not user_data:
-            return RequestResult(False, "User not found", status_code=404)
-        if user_data['isArchived']:
-            return RequestResult(False, "User is archived", status_code=400)
-        if 'contractInfo' not in user_data:
-            return RequestResult(False, "User has no contract information", status_code=400)
-        if minutes is not None:
-            user_data['contractInfo']['vacationMinutes'] += minutes
-        else:
-            monthly_working_hours = user_data['contractInfo']['workingHours']
-            monthly_vacation_hours = self._calculate_vacation_minutes(monthly_working_hours)
-            user_data['contractInfo']['vacationMinutes'] += monthly_vacation_hours * 60
-        user = UserFactory.create_user_if_factory_exists(user_data)
-        return self.user_repository.update_user(user)
+        if minutes is None:
+            monthly_vacation_hours, error_result = self._get_monthly_vacation_minutes(username)
+            if error_result is not None:
+                return error_result
+            minutes = monthly_vacation_hours * 60
+        return self._increment_contract_minutes(username, vacation_minutes=minutes)
 
     def remove_vacation_minutes(self, username: str, minutes: int = None):
         """
@@ -179,21 +187,12 @@ class UserService:
         :param minutes: The number of minutes to remove from the user's vacation balance.
         :return: A RequestResult object containing the result of the operation.
         """
-        user_data = self.user_repository.find_by_username(username)
-        if not user_data:
-            return RequestResult(False, "User not found", status_code=404)
-        if user_data['isArchived']:
-            return RequestResult(False, "User is archived", status_code=400)
-        if 'contractInfo' not in user_data:
-            return RequestResult(False, "User has no contract information", status_code=400)
-        if minutes is not None:
-            user_data['contractInfo']['vacationMinutes'] -= minutes
-        else:
-            monthly_working_hours = user_data['contractInfo']['workingHours']
-            monthly_vacation_hours = self._calculate_vacation_minutes(monthly_working_hours)
-            user_data['contractInfo']['vacationMinutes'] -= monthly_vacation_hours
-        user = UserFactory.create_user_if_factory_exists(user_data)
-        return self.user_repository.update_user(user)
+        if minutes is None:
+            monthly_vacation_hours, error_result = self._get_monthly_vacation_minutes(username)
+            if error_result is not None:
+                return error_result
+            minutes = monthly_vacation_hours
+        return self._increment_contract_minutes(username, vacation_minutes=-minutes)
 
     def update_user(self, user_data: dict):
         """
@@ -270,12 +269,12 @@ class UserService:
         :param username: The username of the user to be deleted.
         :return: A RequestResult object containing the result of the delete operation.
         """
-        # Local imports needed to avoid circular imports
-        from service.timesheet_service import TimesheetService
-        from service.time_entry_service import TimeEntryService
-        timesheet_service = TimesheetService()
-        time_entry_service = TimeEntryService()
-        file_service = service.file_service.FileService()
+        # Local import needed to avoid circular imports
+        from service.service_container import ServiceContainer
+        service_container = ServiceContainer.get_instance()
+        timesheet_service = service_container.timesheet_service
+        time_entry_service = service_container.time_entry_service
+        file_service = service_container.file_service
 
         if username == get_jwt_identity():
             return RequestResult(False, "You cannot delete yourself", status_code=400)
@@ -422,6 +421,23 @@ class UserService:
             return None
         return UserFactory.create_user_if_factory_exists(user_data)
 
+    def get_profiles(self, usernames) -> dict:
+        """
+        Retrieves the profiles of several users with a single query.
+
+        :param usernames: The usernames of the users whose profiles are requested.
+        :return: A dictionary mapping the usernames to the User model instances of the users that were found
+                 and are not archived.
+        """
+        profiles = {}
+        for username, user_data in self.user_repository.find_by_usernames(usernames).items():
+            if user_data.get('timesheets'):
+                user_data['timesheets'] = [str(timesheet_id) for timesheet_id in user_data['timesheets']]
+            if user_data['isArchived']:
+                continue
+            profiles[username] = UserFactory.create_user_if_factory_exists(user_data)
+        return profiles
+
     def get_contract_info(self, username: str):
         """
         Retrieves the contract information of a hiwi identified by their username.
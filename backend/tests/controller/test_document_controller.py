@@ -192,3 +192,44 @@ class TestDocumentController(unittest.TestCase):
             '/document/generateMultipleDocuments?username=testHiwi1',
             headers={'Authorization': f'Bearer {access_token}'})
         self.assertEqual(responseError.status_code, 400)
+
+    def test_create_export_job_invalid_body(self):
+        """
+        Test that the create_export_job method of the DocumentController class rejects a body that is no JSON object.
+        """
+        access_token = self._authenticate("HiwiDocumentController", "test_password")
+        response = self.client.post('/document/exportJobs', json=[],
+                                    headers={'Authorization': f'Bearer {access_token}'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_export_table(self):
+        """
+        Test the export_table method of the DocumentController class.
+        """
+        access_token = self._authenticate("HiwiDocumentController", "test_password")
+        current_date = datetime.now(timezone.utc).strftime('%d-%m-%y')
+
+        response = self.client.get(
+            f'/document/tabularExport?startDate={current_date}&endDate={current_date}',
+            headers={'Authorization': f'Bearer {access_token}'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'text/csv')
+        lines = response.data.decode('utf-8-sig').splitlines()
+        self.assertTrue(lines[0].startswith('Username,Month,Year'))
+        self.assertTrue(lines[1].startswith('HiwiDocumentController,'))
+
+        response_xlsx = self.client.get(
+            f'/document/tabularExport?startDate={current_date}&endDate={current_date}&rows=timeEntries&format=xlsx',
+            headers={'Authorization': f'Bearer {access_token}'})
+        self.assertEqual(response_xlsx.status_code, 200)
+        self.assertTrue(response_xlsx.data.startswith(b'PK'))
+
+        response_unauthorized = self.client.get(
+            f'/document/tabularExport?startDate={current_date}&endDate={current_date}'
+            f'&usernames=AdminDocumentController',
+            headers={'Authorization': f'Bearer {access_token}'})
+        self.assertEqual(response_unauthorized.status_code, 403)
+
+        response_error = self.client.get('/document/tabularExport?startDate=01-03-24',
+                                         headers={'Authorization': f'Bearer {access_token}'})
+        self.assertEqual(response_error.status_code, 400)
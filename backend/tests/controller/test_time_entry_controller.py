@@ -255,6 +255,33 @@ class TestTimeEntryController(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIsNone(self.time_entry_repository.get_time_entry_by_id((time_entry["_id"])))
 
+    def test_import_time_entries_invalid_format(self):
+        """
+        Test the import_time_entries method of the TimeEntryController class when the data is neither JSON nor CSV.
+        """
+        access_token = self.authenticate('testHiwiTimeEntryController', 'testPassword')
+        response = self.client.post('/timeEntry/importTimeEntries', data='startTime',
+                                    headers={"Authorization": f"Bearer {access_token}"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json, 'Request data must be in JSON or CSV format')
+
+    def test_import_time_entries(self):
+        """
+        Test the import_time_entries method of the TimeEntryController class with a CSV file.
+        """
+        csv_data = ('startTime,endTime,breakTime,activity,activityType,projectName,entryType\r\n'
+                    '2024-06-10T08:00:00,2024-06-10T12:00:00,0,Import,Projektarbeit,ImportTest,\r\n'
+                    '2024-06-11T08:00:00,2024-06-11T12:00:00,0,Import,Projektarbeit,ImportTest,\r\n'
+                    '2024-06-03T08:00:00,2024-06-03T12:00:00,0,Import,Projektarbeit,ImportTest,\r\n')
+        access_token = self.authenticate('testHiwiTimeEntryController', 'testPassword')
+        response = self.client.post('/timeEntry/importTimeEntries', data=csv_data.encode('utf-8'),
+                                    content_type='text/csv', headers={"Authorization": f"Bearer {access_token}"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual('2 of 3 time entries imported', response.json['message'])
+        self.assertEqual(409, response.json['results'][2]['statusCode'])
+        self.assertEqual(1, len(self.time_entry_repository.get_time_entries_by_date(datetime.date(2024, 6, 10),
+                                                                                    'testHiwiTimeEntryController')))
+
     def test_get_entries_by_timesheet_id_no_timesheet_id(self):
         """
         Test the get_entries_by_timesheet_id method of the TimeEntryController class when no timesheet ID is provided.
@@ -0,0 +1,111 @@
+import datetime
+import unittest
+from unittest import mock
+
+from bson import ObjectId
+
+from db import initialize_db
+from model.file.FileType import FileType
+from model.repository.file_repository import FileRepository
+from model.repository.index_registry import INDEX_REGISTRY, ensure_indexes
+from model.repository.notification_repository import NotificationRepository
+from model.repository.time_entry_repository import TimeEntryRepository
+from model.repository.timesheet_repository import TimesheetRepository
+from model.repository.user_repository import UserRepository
+from model.timesheet_status import TimesheetStatus
+from model.user.role import UserRole
+from tests.query_plan_helper import QueryPlanAssertions
+
+
+class TestIndexRegistry(QueryPlanAssertions, unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = initialize_db()
+        ensure_indexes(cls.db)
+
+    def test_ensure_indexes_is_idempotent(self):
+        """
+        Test that applying the index registry twice succeeds without failures.
+        """
+        self.assertEqual({}, ensure_indexes(self.db))
+        self.assertEqual({}, ensure_indexes(self.db))
+
+    def test_all_registered_indexes_exist(self):
+        """
+        Test that every index of the registry exists in the database.
+        """
+        for collection_name, indexes in INDEX_REGISTRY.items():
+            existing_indexes = self.db[collection_name].index_information()
+            for index in indexes:
+                self.assertIn(index.document['name'], existing_indexes)
+
+    def test_user_queries_use_index(self):
+        """
+        Test that the queries of the UserRepository do not scan the users collection.
+        """
+        user_repository = UserRepository()
+        self.assertQueriesUseIndex(self.db, [UserRepository], lambda: (
+            user_repository.find_by_username("testUserIndexRegistry"),
+            user_repository.find_by_usernames(["testUserIndexRegistry", "testHiwiIndexRegistry"]),
+            user_repository.get_users_by_role(UserRole.HIWI)))
+
+    def test_timesheet_queries_use_index(self):
+        """
+        Test that the queries of the TimesheetRepository do not scan the timesheets collection.
+        """
+        timesheet_repository = TimesheetRepository()
+        self.assertQueriesUseIndex(self.db, [TimesheetRepository], lambda: (
+            timesheet_repository.get_timesheet("testHiwiIndexRegistry", 5, 2024),
+            timesheet_repository.get_timesheet_id("testHiwiIndexRegistry", 5, 2024),
+            timesheet_repository.get_overtime("testHiwiIndexRegistry", 5, 2024),
+            timesheet_repository.get_timesheets_by_username("testHiwiIndexRegistry"),
+            timesheet_repository.get_timesheets_by_username_status("testHiwiIndexRegistry",
+                                                                   TimesheetStatus.NOT_SUBMITTED),
+            timesheet_repository.get_current_timesheet("testHiwiIndexRegistry"),
+            timesheet_repository.get_timesheets_by_status(TimesheetStatus.COMPLETE),
+            timesheet_repository.get_previous_timesheet("testHiwiIndexRegistry", 5, 2024),
+            timesheet_repository.get_timesheets_since("testHiwiIndexRegistry", 5, 2024),
+            timesheet_repository.get_timesheet_by_id(str(ObjectId())),
+            timesheet_repository.get_timesheets_by_ids([str(ObjectId())]),
+            timesheet_repository.transition_statuses([str(ObjectId())], [TimesheetStatus.WAITING_FOR_APPROVAL],
+                                                     TimesheetStatus.COMPLETE)))
+
+    def test_time_entry_queries_use_index(self):
+        """
+        Test that the queries of the TimeEntryRepository do not scan the timeEntries collection.
+        """
+        time_entry_repository = TimeEntryRepository()
+        timesheet_id = str(ObjectId())
+        self.assertQueriesUseIndex(self.db, [TimeEntryRepository, TimesheetRepository], lambda: (
+            time_entry_repository.get_time_entries_by_date(datetime.datetime(2024, 5, 2), "testHiwiIndexRegistry"),
+            time_entry_repository.get_time_entries_by_timesheet_id(timesheet_id),
+            time_entry_repository.get_time_entries_by_timesheet_ids([timesheet_id]),
+            list(time_entry_repository.find_time_entries_by_timesheet_ids([timesheet_id]))))
+
+    def test_notification_queries_use_index(self):
+        """
+        Test that the queries of the NotificationRepository do not scan the notifications collection.
+        """
+        notification_repository = NotificationRepository()
+        self.assertQueriesUseIndex(self.db, [NotificationRepository], lambda: (
+            notification_repository.get_notifications_by_receiver("testHiwiIndexRegistry"),
+            notification_repository.does_unread_message_exist("testHiwiIndexRegistry")))
+
+    def test_file_metadata_queries_use_index(self):
+        """
+        Test that the queries of the FileRepository do not scan the file_metadata collection.
+        """
+        file_repository = FileRepository()
+
+        def run_queries():
+            file_repository.get_image_metadata("testHiwiIndexRegistry", FileType.SIGNATURE)
+            file_repository.does_file_exist("testHiwiIndexRegistry", FileType.SIGNATURE)
+            file_repository.get_images_metadata(["testHiwiIndexRegistry"], FileType.SIGNATURE)
+            with mock.patch.object(FileRepository, 'grid_fs_bucket', new_callable=mock.PropertyMock):
+                file_repository.delete_image(ObjectId())
+
+        self.assertQueriesUseIndex(self.db, [FileRepository], run_queries)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -176,6 +176,25 @@ class TestTimeEntryRepository(unittest.TestCase):
         self.assertEqual(False, response_invalid_time_entry.is_successful)
         self.assertEqual(404, response_invalid_time_entry.status_code)
 
+    def test_create_time_entries(self):
+        """
+        Test the create_time_entries method of the TimeEntryRepository class.
+        """
+        test_time_entries = []
+        for day in (8, 9):
+            test_time_entry = self.test_april_1_time_entry_data.copy()
+            test_time_entry['_id'] = None
+            test_time_entry['startTime'] = test_time_entry['startTime'].replace(day=day)
+            test_time_entry['endTime'] = test_time_entry['endTime'].replace(day=day)
+            test_time_entries.append(test_time_entry)
+        result = self.time_entry_repository.create_time_entries(
+            [TimeEntry.from_dict(test_time_entry) for test_time_entry in test_time_entries])
+        self.assertTrue(result.is_successful)
+        self.assertEqual(2, len(result.data))
+        for test_time_entry, time_entry_id in zip(test_time_entries, result.data):
+            test_time_entry['_id'] = time_entry_id
+            self.assertEqual(test_time_entry, self.db.timeEntries.find_one({'_id': time_entry_id}))
+
     def test_delete_time_entry(self):
         """
         Test the delete_time_entry method of the TimeEntryRepository class.
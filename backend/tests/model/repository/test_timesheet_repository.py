@@ -91,6 +91,20 @@ class TestTimesheetRepository(unittest.TestCase):
         response_no_username = self.timesheet_repository.get_timesheet(None, 5, 2024)
         self.assertIsNone(response_no_username)
 
+    def test_get_timesheets_by_months(self):
+        """
+        Test the get_timesheets_by_months method of the TimesheetRepository class.
+        """
+        timesheets = self.timesheet_repository.get_timesheets_by_months(
+            [(self.test_may_timesheet_data['username'], self.test_may_timesheet_data['month'],
+              self.test_may_timesheet_data['year']),
+             (self.test_june_timesheet_data['username'], self.test_june_timesheet_data['month'],
+              self.test_june_timesheet_data['year'])])
+        self.assertEqual(2, len(timesheets))
+        self.assertIn(self.test_may_timesheet_data, timesheets)
+        self.assertIn(self.test_june_timesheet_data, timesheets)
+        self.assertEqual([], self.timesheet_repository.get_timesheets_by_months([]))
+
     def test_get_current_timesheet(self):
         """
         Test the get_current_timesheet method of the TimesheetRepository class.
@@ -195,6 +209,17 @@ class TestTimesheetRepository(unittest.TestCase):
             self.assertIn(timesheet, [self.test_april_timesheet_data, self.test_may_timesheet_data,
                                       self.test_june_timesheet_data])
 
+    def test_get_previous_timesheet(self):
+        """
+        Test the get_previous_timesheet method of the TimesheetRepository class.
+        """
+        self.assertEqual(self.test_may_timesheet_data,
+                         self.timesheet_repository.get_previous_timesheet('testHiwiTimesheetRepo', 6, 2024))
+        self.assertEqual(self.test_june_timesheet_data,
+                         self.timesheet_repository.get_previous_timesheet('testHiwiTimesheetRepo', 1, 2025))
+        self.assertIsNone(self.timesheet_repository.get_previous_timesheet('testHiwiTimesheetRepo', 4, 2024))
+        self.assertIsNone(self.timesheet_repository.get_previous_timesheet(None, 6, 2024))
+
     def test_get_timesheets_by_username_no_username(self):
         """
         Test the get_timesheets_by_username method of the TimesheetRepository class with no username.
@@ -305,6 +330,50 @@ class TestTimesheetRepository(unittest.TestCase):
         self.assertEqual(False, response_invalid_timesheet_data.is_successful)
         self.assertEqual(404, response_invalid_timesheet_data.status_code)
 
+    def test_transition_status(self):
+        """
+        Test the transition_status method of the TimesheetRepository class.
+        """
+        timesheet_data = self.timesheet_repository.transition_status(str(self.test_may_timesheet_data['_id']),
+                                                                     [TimesheetStatus.WAITING_FOR_APPROVAL],
+                                                                     TimesheetStatus.COMPLETE)
+        self.assertEqual(str(TimesheetStatus.COMPLETE), timesheet_data['status'])
+        self.assertGreater(timesheet_data['lastSignatureChange'], self.test_may_timesheet_data['lastSignatureChange'])
+        self.assertEqual(str(TimesheetStatus.COMPLETE),
+                         self.db.timesheets.find_one({'_id': self.test_may_timesheet_data['_id']})['status'])
+
+    def test_transition_status_unexpected_status(self):
+        """
+        Test that the transition_status method of the TimesheetRepository class does not change a timesheet
+        with another status, e.g. one that has been approved concurrently.
+        """
+        timesheet_data = self.timesheet_repository.transition_status(str(self.test_april_timesheet_data['_id']),
+                                                                     [TimesheetStatus.WAITING_FOR_APPROVAL],
+                                                                     TimesheetStatus.REVISION)
+        self.assertIsNone(timesheet_data)
+        self.assertEqual(str(TimesheetStatus.COMPLETE),
+                         self.db.timesheets.find_one({'_id': self.test_april_timesheet_data['_id']})['status'])
+        self.assertIsNone(self.timesheet_repository.transition_status("666666666666666666666666",
+                                                                      [TimesheetStatus.WAITING_FOR_APPROVAL],
+                                                                      TimesheetStatus.COMPLETE))
+
+    def test_transition_statuses(self):
+        """
+        Test that the transition_statuses method of the TimesheetRepository class only changes the timesheets
+        with an expected status and returns their IDs.
+        """
+        changed_ids = self.timesheet_repository.transition_statuses(
+            [str(self.test_may_timesheet_data['_id']), str(self.test_april_timesheet_data['_id'])],
+            [TimesheetStatus.WAITING_FOR_APPROVAL], TimesheetStatus.COMPLETE)
+        self.assertEqual([self.test_may_timesheet_data['_id']], changed_ids)
+        self.assertEqual(str(TimesheetStatus.COMPLETE),
+                         self.db.timesheets.find_one({'_id': self.test_may_timesheet_data['_id']})['status'])
+        self.assertEqual([], self.timesheet_repository.transition_statuses(
+            [str(self.test_may_timesheet_data['_id'])], [TimesheetStatus.WAITING_FOR_APPROVAL],
+            TimesheetStatus.COMPLETE))
+        self.assertEqual([], self.timesheet_repository.transition_statuses([], [TimesheetStatus.WAITING_FOR_APPROVAL],
+                                                                           TimesheetStatus.COMPLETE))
+
     def test_create_timesheet_by_dict(self):
         """
         Test the create_timesheet_by_dict method of the TimesheetRepository class.
@@ -0,0 +1,85 @@
+import unittest
+
+from flask import Flask
+
+from model.repository.user_identity_map import UserIdentityMap
+from model.repository.user_repository import UserRepository
+
+
+class TestUserIdentityMap(unittest.TestCase):
+    """
+    Test suite for the UserIdentityMap class.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = Flask(__name__)
+        cls.app.debug = True
+        cls.user_repository = UserRepository.get_instance()
+
+    def test_get_outside_request(self):
+        """
+        Test that nothing is cached outside a request.
+        """
+        UserIdentityMap.put('testHiwi1', {'username': 'testHiwi1'})
+        self.assertEqual((False, None), UserIdentityMap.get('testHiwi1'))
+
+    def test_get_returns_copy(self):
+        """
+        Test that a cached document is returned as a copy, so callers cannot modify the map.
+        """
+        with self.app.test_request_context():
+            UserIdentityMap.put('testHiwi1', {'username': 'testHiwi1', 'personalInfo': {'firstName': 'Test'}})
+            found, user_data = UserIdentityMap.get('testHiwi1')
+            self.assertTrue(found)
+            user_data['personalInfo']['firstName'] = 'Changed'
+            self.assertEqual('Test', UserIdentityMap.get('testHiwi1')[1]['personalInfo']['firstName'])
+            self.assertEqual(2, UserIdentityMap.get_saved_reads())
+
+    def test_missing_user_is_cached(self):
+        """
+        Test that the lookup of a non-existing user is remembered as well.
+        """
+        with self.app.test_request_context():
+            UserIdentityMap.put('nonExistingUser', None)
+            self.assertEqual((True, None), UserIdentityMap.get('nonExistingUser'))
+
+    def test_invalidate(self):
+        """
+        Test that invalidated users are read again.
+        """
+        with self.app.test_request_context():
+            UserIdentityMap.put('testHiwi1', {'username': 'testHiwi1'})
+            UserIdentityMap.put('testHiwi2', {'username': 'testHiwi2'})
+            UserIdentityMap.invalidate('testHiwi1')
+            self.assertFalse(UserIdentityMap.get('testHiwi1')[0])
+            self.assertTrue(UserIdentityMap.get('testHiwi2')[0])
+            UserIdentityMap.invalidate()
+            self.assertFalse(UserIdentityMap.get('testHiwi2')[0])
+
+    def test_map_is_request_scoped(self):
+        """
+        Test that every request starts with an empty identity map.
+        """
+        with self.app.test_request_context():
+            UserIdentityMap.put('testHiwi1', {'username': 'testHiwi1'})
+        with self.app.test_request_context():
+            self.assertFalse(UserIdentityMap.get('testHiwi1')[0])
+            self.assertEqual(0, UserIdentityMap.get_saved_reads())
+
+    def test_find_by_username_reads_once_per_request(self):
+        """
+        Test that repeated lookups of a user in one request are answered from the identity map
+        and that an update of the user is visible afterwards.
+        """
+        with self.app.test_request_context():
+            user_data = self.user_repository.find_by_username('testHiwi1')
+            self.assertEqual(user_data, self.user_repository.find_by_username('testHiwi1'))
+            self.assertEqual(1, UserIdentityMap.get_saved_reads())
+            self.user_repository.set_last_login('testHiwi1', user_data.get('lastLogin'))
+            self.user_repository.find_by_username('testHiwi1')
+            self.assertEqual(1, UserIdentityMap.get_saved_reads())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -209,6 +209,30 @@ class TestUserRepository(unittest.TestCase):
         user = User.from_dict(test_user_data)
         self.user_repository.update_user(user)
 
+    def test_increment_contract_minutes_no_contract_info(self):
+        """
+        Test the increment_contract_minutes method of the UserRepository class for a user without contract information.
+        """
+        response = self.user_repository.increment_contract_minutes("testAdminUserRepo", 10, 10)
+        self.assertEqual("User not found", response.message)
+        self.assertEqual(False, response.is_successful)
+        self.assertEqual(404, response.status_code)
+
+    def test_increment_contract_minutes(self):
+        """
+        Test the increment_contract_minutes method of the UserRepository class.
+        """
+        self.db.users.update_one({"username": "testAdminUserRepo"},
+                                 {"$set": {"contractInfo": {"vacationMinutes": 100, "overtimeMinutes": 0}}})
+        response = self.user_repository.increment_contract_minutes("testAdminUserRepo", 30, -20)
+        self.assertEqual(True, response.is_successful)
+        self.assertEqual(200, response.status_code)
+        response = self.user_repository.increment_contract_minutes("testAdminUserRepo", -10)
+        self.assertEqual(True, response.is_successful)
+        contract_info = self.user_repository.find_by_username("testAdminUserRepo")["contractInfo"]
+        self.assertEqual(20, contract_info["overtimeMinutes"])
+        self.assertEqual(80, contract_info["vacationMinutes"])
+
     def test_delete_user_no_username(self):
         """
         Test the delete_user method of the UserRepository class for no username.
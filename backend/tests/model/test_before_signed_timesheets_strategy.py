@@ -0,0 +1,50 @@
+import unittest
+from unittest import mock
+
+from bson import ObjectId
+
+from controller.input_validator.validation_status import ValidationStatus
+from model.time_sheet_validator.before_signed_timesheets_strategy import BeforeSignedTimesheetsStrategy
+from model.timesheet import Timesheet
+from model.timesheet_status import TimesheetStatus
+
+
+class TestBeforeSignedTimesheetsStrategy(unittest.TestCase):
+
+    def setUp(self):
+        self.timesheet_repository = mock.Mock()
+        self.strategy = BeforeSignedTimesheetsStrategy(self.timesheet_repository)
+        self.timesheet = Timesheet("testHiwi", 6, 2024, ObjectId(), TimesheetStatus.NOT_SUBMITTED)
+
+    def test_validate_previous_timesheet_complete(self):
+        """
+        Test that a timesheet is valid if the previous timesheet is complete, which is read with one lookup.
+        """
+        self.timesheet_repository.get_previous_timesheet.return_value = {"status": TimesheetStatus.COMPLETE.value}
+        result = self.strategy.validate(self.timesheet, [])
+        self.assertEqual(ValidationStatus.SUCCESS, result.status)
+        self.timesheet_repository.get_previous_timesheet.assert_called_once_with("testHiwi", 6, 2024)
+        self.timesheet_repository.get_timesheets_by_username.assert_not_called()
+
+    def test_validate_previous_timesheet_not_complete(self):
+        """
+        Test that a timesheet is invalid if the previous timesheet is not complete.
+        """
+        self.timesheet_repository.get_previous_timesheet.return_value = {
+            "status": TimesheetStatus.WAITING_FOR_APPROVAL.value}
+        result = self.strategy.validate(self.timesheet, [])
+        self.assertEqual(ValidationStatus.FAILURE, result.status)
+        self.assertEqual("A previous Timesheet is not completed.", result.message)
+
+    def test_validate_no_previous_timesheet(self):
+        """
+        Test that the first timesheet of a user is valid.
+        """
+        self.timesheet_repository.get_previous_timesheet.return_value = None
+        result = self.strategy.validate(self.timesheet, [])
+        self.assertEqual(ValidationStatus.SUCCESS, result.status)
+        self.assertEqual("No previous Timesheets found.", result.message)
+
+
+if __name__ == '__main__':
+    unittest.main()
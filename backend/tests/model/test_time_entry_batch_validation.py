@@ -0,0 +1,116 @@
+import datetime
+import random
+import unittest
+
+from controller.input_validator.validation_status import ValidationStatus
+from model.time_entry_validator.break_length_strategy import BreakLengthStrategy
+from model.time_entry_validator.holiday_strategy import HolidayStrategy
+from model.time_entry_validator.time_entry_batch import TimeEntryBatch
+from model.time_entry_validator.time_entry_validator import TimeEntryValidator
+from model.time_entry_validator.weekend_strategy import WeekendStrategy
+from model.time_entry_validator.working_time_strategy import WorkingTimeStrategy
+from model.vacation_entry import VacationEntry
+from model.work_entry import WorkEntry
+
+
+class TestTimeEntryBatchValidation(unittest.TestCase):
+    """
+    Tests that the vectorized validation of batches returns the same results as the validation of single entries.
+    """
+
+    STRATEGIES = [WorkingTimeStrategy(), BreakLengthStrategy(), HolidayStrategy(), WeekendStrategy()]
+
+    @classmethod
+    def setUpClass(cls):
+        random_generator = random.Random(42)
+        cls.entries = []
+        for _ in range(2000):
+            start_time = (datetime.datetime(2023, 1, 1)
+                          + datetime.timedelta(days=random_generator.randrange(3 * 365),
+                                               minutes=random_generator.randrange(24 * 60),
+                                               seconds=random_generator.choice([0, 0, 0, 59]),
+                                               microseconds=random_generator.choice([0, 0, 0, 1, 999999])))
+            end_time = start_time + datetime.timedelta(minutes=random_generator.randrange(1, 16 * 60))
+            if random_generator.random() < 0.2:
+                cls.entries.append(VacationEntry("timesheetId", start_time, end_time))
+            else:
+                cls.entries.append(WorkEntry("timesheetId", start_time, end_time,
+                                             random_generator.choice([0, 15, 29, 30, 44, 45, 60, 22.5]),
+                                             "activity", "project"))
+        # Boundaries of the rules
+        for start, end, break_time in [((2024, 6, 3, 6, 0), (2024, 6, 3, 16, 0), 45),
+                                       ((2024, 6, 3, 4, 0), (2024, 6, 3, 16, 0), 45),
+                                       ((2024, 6, 3, 3, 59), (2024, 6, 3, 8, 0), 0),
+                                       ((2024, 6, 3, 16, 0), (2024, 6, 3, 18, 0), 0),
+                                       ((2024, 6, 3, 8, 0), (2024, 6, 3, 14, 0), 0),
+                                       ((2024, 6, 3, 8, 0), (2024, 6, 3, 14, 1), 0),
+                                       ((2024, 6, 3, 8, 0), (2024, 6, 3, 17, 30), 30),
+                                       ((2024, 6, 3, 23, 0), (2024, 6, 4, 1, 0), 0),
+                                       ((2024, 5, 1, 8, 0), (2024, 5, 1, 12, 0), 0),
+                                       ((2024, 12, 31, 8, 0), (2025, 1, 1, 12, 0), 0),
+                                       ((1969, 12, 27, 8, 0), (1969, 12, 27, 12, 0), 0)]:
+            cls.entries.append(WorkEntry("timesheetId", datetime.datetime(*start), datetime.datetime(*end),
+                                         break_time, "activity", "project"))
+
+    def _assert_same_results(self, expected, actual):
+        self.assertEqual([(result.status, result.message) for result in expected],
+                         [(result.status, result.message) for result in actual])
+
+    def test_strategy_parity(self):
+        """
+        Test that every strategy returns the same result for a batch as for the single entries.
+        """
+        batch = TimeEntryBatch(self.entries)
+        self.assertTrue(batch.vectorized)
+        for strategy in self.STRATEGIES:
+            with self.subTest(strategy=type(strategy).__name__):
+                self._assert_same_results([strategy.validate(entry) for entry in self.entries],
+                                          strategy.validate_batch(batch))
+
+    def test_durations(self):
+        """
+        Test that the packed durations equal the durations of the entries.
+        """
+        batch = TimeEntryBatch(self.entries)
+        self.assertEqual([entry.get_duration() for entry in self.entries], batch.durations.tolist())
+
+    def test_validate_entries(self):
+        """
+        Test that validating a batch returns the results of validate_entry for every entry.
+        """
+        validator = TimeEntryValidator()
+        for strategy in self.STRATEGIES:
+            validator.add_validation_rule(strategy)
+        batch_results = validator.validate_entries(self.entries)
+        self.assertEqual(len(self.entries), len(batch_results))
+        for entry, entry_results in zip(self.entries, batch_results):
+            self._assert_same_results(validator.validate_entry(entry), entry_results)
+        self.assertTrue(any(result.status == ValidationStatus.WARNING
+                            for entry_results in batch_results for result in entry_results))
+        self.assertTrue(any(result.status == ValidationStatus.FAILURE
+                            for entry_results in batch_results for result in entry_results))
+
+    def test_validate_entries_time_zone(self):
+        """
+        Test that entries with time zone information are validated one by one.
+        """
+        start_time = datetime.datetime(2024, 6, 3, 8, 0, tzinfo=datetime.timezone.utc)
+        entries = [WorkEntry("timesheetId", start_time, start_time + datetime.timedelta(hours=4), 0, "activity",
+                             "project")]
+        self.assertFalse(TimeEntryBatch(entries).vectorized)
+        validator = TimeEntryValidator()
+        validator.add_validation_rule(WeekendStrategy())
+        self._assert_same_results(validator.validate_entry(entries[0]), validator.validate_entries(entries)[0])
+
+    def test_validate_entries_empty(self):
+        """
+        Test that an empty batch is validated without results.
+        """
+        validator = TimeEntryValidator()
+        for strategy in self.STRATEGIES:
+            validator.add_validation_rule(strategy)
+        self.assertEqual([], validator.validate_entries([]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import datetime
+import unittest
+from unittest import mock
+
+from bson import ObjectId
+
+from controller.input_validator.validation_status import ValidationStatus
+from model.request_result import RequestResult
+from model.time_entry_validator.time_entry_validation_context import TimeEntryValidationContext
+from model.time_entry_validator.vacation_time_strategy import VacationTimeStrategy
+from model.timesheet import Timesheet
+from model.timesheet_status import TimesheetStatus
+from model.user.contract_information import ContractInfo
+from model.vacation_entry import VacationEntry
+from model.work_entry import WorkEntry
+from service.time_entry_service import TimeEntryService
+
+
+class TestTimeEntryValidationContext(unittest.TestCase):
+    """
+    Tests that the validation strategies read the data of the user from the validation context.
+    """
+
+    def setUp(self):
+        self.contract_info = ContractInfo(40, 15, 600)
+        self.context = TimeEntryValidationContext(self.contract_info)
+        self.vacation_entry = VacationEntry("timesheetId", datetime.datetime(2024, 6, 3, 8, 0),
+                                            datetime.datetime(2024, 6, 3, 14, 0))
+        self.time_entry_service = TimeEntryService(mock.Mock(), mock.Mock())
+
+    def test_vacation_time_strategy(self):
+        """
+        Test that the vacation time is checked against the contract snapshot of the context.
+        """
+        strategy = VacationTimeStrategy()
+        self.assertEqual(ValidationStatus.SUCCESS, strategy.validate(self.vacation_entry, self.context).status)
+        self.contract_info.vacation_minutes = 300
+        result = strategy.validate(self.vacation_entry, self.context)
+        self.assertEqual(ValidationStatus.FAILURE, result.status)
+        self.assertEqual("Vacation time exceeds the remaining vacation time.", result.message)
+
+    def test_vacation_time_strategy_without_contract(self):
+        """
+        Test that a vacation entry fails the validation if the context holds no contract information.
+        """
+        strategy = VacationTimeStrategy()
+        self.assertEqual(ValidationStatus.FAILURE, strategy.validate(self.vacation_entry).status)
+        self.assertEqual(ValidationStatus.FAILURE,
+                         strategy.validate(self.vacation_entry, TimeEntryValidationContext()).status)
+
+    def test_validation_issues_no_queries(self):
+        """
+        Test that validating entries with a context neither accesses the database nor creates services.
+        """
+        work_entry = WorkEntry("timesheetId", datetime.datetime(2024, 6, 3, 8, 0),
+                               datetime.datetime(2024, 6, 3, 18, 0), 45, "activity", "project")
+        with mock.patch('db.get_client') as get_client, \
+                mock.patch('service.user_service.UserService.__init__') as create_user_service, \
+                mock.patch('service.service_container.ServiceContainer.get_instance') as get_service_container:
+            results = self.time_entry_service._strategy_validate(self.vacation_entry, self.context)
+            batch_results = self.time_entry_service._strategy_validate_entries(
+                [work_entry, self.vacation_entry] * TimeEntryService.MAX_IMPORT_ROWS, self.context)
+        self.assertEqual(0, get_client.call_count)
+        create_user_service.assert_not_called()
+        get_service_container.assert_not_called()
+        self.assertTrue(all(result.status == ValidationStatus.SUCCESS for result in results))
+        self.assertEqual([result.status for result in results], [result.status for result in batch_results[1]])
+
+    def test_add_time_entry_context(self):
+        """
+        Test that an added entry is checked against the timesheet it is added to, read with a single lookup.
+        """
+        timesheet = Timesheet("testHiwi", 6, 2024, ObjectId(), TimesheetStatus.NOT_SUBMITTED)
+        timesheet_service = self.time_entry_service.timesheet_service
+        timesheet_service.get_timesheet_by_id.return_value = RequestResult(True, "", 200, timesheet)
+        self.time_entry_service.user_service.get_contract_info.return_value = RequestResult(True, "", 200,
+                                                                                            self.contract_info)
+        self.time_entry_service.time_entry_repository = mock.Mock()
+        self.time_entry_service.time_entry_repository.get_time_entries_by_date.return_value = []
+        self.time_entry_service.time_entry_repository.create_time_entry.return_value = RequestResult(
+            True, "", 201, {"_id": str(ObjectId())})
+        entry_data = {"timesheetId": str(timesheet.timesheet_id), "startTime": "2024-06-03T08:00:00Z",
+                      "endTime": "2024-06-03T12:00:00Z"}
+        with mock.patch.object(TimeEntryService, '_strategy_validate', return_value=[]) as strategy_validate:
+            self.time_entry_service.create_vacation_entry(entry_data, "testHiwi")
+        context = strategy_validate.call_args.args[1]
+        self.assertIs(self.contract_info, context.contract_info)
+        timesheet_service.get_timesheet_by_id.assert_called_once_with(str(timesheet.timesheet_id))
+        timesheet_service.get_timesheet_status.assert_not_called()
+
+        timesheet.status = TimesheetStatus.WAITING_FOR_APPROVAL
+        result = self.time_entry_service.create_vacation_entry(dict(entry_data), "testHiwi")
+        self.assertEqual(409, result.status_code)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+from unittest import mock
+
+
+class CapturingCursor:
+    """
+    An empty cursor that records the sort order applied to the query it belongs to.
+    """
+
+    def __init__(self, query: dict):
+        self.query = query
+
+    def sort(self, key_or_list, direction=None):
+        self.query['sort'] = [(key_or_list, direction)] if isinstance(key_or_list, str) else key_or_list
+        return self
+
+    def __iter__(self):
+        return iter([])
+
+
+class CapturingCollection:
+    """
+    A collection that records the filters of the queries run against it instead of running them.
+    Reads return no documents, writes return a mocked result.
+    """
+
+    WRITE_METHODS = ("update_one", "update_many", "delete_one", "delete_many")
+
+    def __init__(self, name: str, queries: list):
+        self.name = name
+        self.queries = queries
+
+    def _record(self, query_filter, sort=None) -> dict:
+        query = {"collection": self.name, "filter": query_filter or {}, "sort": sort}
+        self.queries.append(query)
+        return query
+
+    def find(self, query_filter=None, projection=None, sort=None, **kwargs):
+        return CapturingCursor(self._record(query_filter, sort))
+
+    def find_one(self, query_filter=None, projection=None, sort=None, **kwargs):
+        self._record(query_filter, sort)
+        return None
+
+    def find_one_and_update(self, query_filter, update, sort=None, **kwargs):
+        self._record(query_filter, sort)
+        return None
+
+    def count_documents(self, query_filter, **kwargs):
+        self._record(query_filter)
+        return 0
+
+    def _write(self, query_filter, *args, sort=None, **kwargs):
+        self._record(query_filter, sort)
+        return mock.Mock()
+
+    def __getattr__(self, name):
+        if name not in self.WRITE_METHODS:
+            raise AttributeError(name)
+        return self._write
+
+
+class CapturingDatabase:
+    """
+    A database whose collections record the queries of the repositories, see capture_queries.
+    """
+
+    def __init__(self):
+        self.queries = []
+
+    def __getattr__(self, name):
+        return CapturingCollection(name, self.queries)
+
+    def __getitem__(self, name):
+        return CapturingCollection(name, self.queries)
+
+
+class QueryPlanAssertions:
+    """
+    Mixin for unittest.TestCase classes that checks the query plans of repository queries.
+    A query that is not backed by an index shows up as a COLLSCAN stage in its winning plan.
+    """
+
+    def _collect_stages(self, plan) -> list[str]:
+        """
+        Recursively collects the names of all stages of a query plan.
+
+        :param plan: The (sub)plan as returned by explain().
+        :return: A list of the stage names.
+        """
+        stages = []
+        if isinstance(plan, dict):
+            if 'stage' in plan:
+                stages.append(plan['stage'])
+            for value in plan.values():
+                stages.extend(self._collect_stages(value))
+        elif isinstance(plan, list):
+            for value in plan:
+                stages.extend(self._collect_stages(value))
+        return stages
+
+    def capture_queries(self, repository_classes: list, call) -> list[dict]:
+        """
+        Runs a repository call against a capturing database and returns the queries it ran, so the query plans of
+        the filters the repositories actually build can be checked.
+
+        :param repository_classes: The repository classes whose database is replaced during the call.
+        :param call: A callable running the repository methods.
+        :return: The queries with the name of the collection, the filter and the sort order.
+        """
+        database = CapturingDatabase()
+        patches = [mock.patch.object(repository_class, 'db', new_callable=mock.PropertyMock, return_value=database)
+                   for repository_class in repository_classes]
+        for patch in patches:
+            patch.start()
+        try:
+            call()
+        finally:
+            for patch in patches:
+                patch.stop()
+        self.assertTrue(database.queries, "The call did not run any query")
+        return database.queries
+
+    def assertQueriesUseIndex(self, db, repository_classes: list, call):
+        """
+        Captures the queries of a repository call and fails if any of them is not backed by an index.
+
+        :param db: The database the captured queries are explained against.
+        :param repository_classes: The repository classes whose database is replaced during the call.
+        :param call: A callable running the repository methods.
+        """
+        for query in self.capture_queries(repository_classes, call):
+            self.assertNoCollectionScan(db[query["collection"]], query["filter"], query["sort"])
+
+    def assertNoCollectionScan(self, collection, query: dict, sort=None):
+        """
+        Runs explain() for the given query and fails if the winning plan contains a COLLSCAN stage.
+
+        :param collection: The collection the query is run against.
+        :param query: The filter of the query.
+        :param sort: An optional sort specification of the query.
+        """
+        cursor = collection.find(query)
+        if sort is not None:
+            cursor = cursor.sort(sort)
+        winning_plan = cursor.explain()['queryPlanner']['winningPlan']
+        stages = self._collect_stages(winning_plan)
+        self.assertNotIn('COLLSCAN', stages,
+                         f"Query {query} on '{collection.name}' is not backed by an index: {stages}")
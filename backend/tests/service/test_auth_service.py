@@ -1,5 +1,7 @@
 import unittest
+from unittest import mock
 
+from flask_jwt_extended import decode_token
 from flask_jwt_extended.exceptions import NoAuthorizationError
 
 from app import app
@@ -7,7 +9,8 @@ from model.repository.user_repository import UserRepository
 from model.user.role import UserRole
 from model.user.supervisor import Supervisor
 from model.user.user import User
-from service.auth_service import AuthenticationService
+from service.auth_service import AuthenticationService, check_access
+from utils.access_version_table import AccessVersionTable
 from utils.security_utils import SecurityUtils
 
 
@@ -70,6 +73,44 @@ class TestAuthService(unittest.TestCase):
             token = self.auth_service.create_token("AdminAuthService", "Admin")
             self.assertIsNotNone(token)
 
+    def test_create_token_claims(self):
+        """
+        Test that the token contains the role and the access version of the user.
+        """
+        with app.app_context():
+            token = self.auth_service.create_token("AdminAuthService", UserRole.ADMIN)
+            claims = decode_token(token)
+            self.assertEqual("Admin", claims["role"])
+            self.assertEqual(AccessVersionTable.get_version("AdminAuthService"), claims["accessVersion"])
+
+    def test_check_access_without_db_read(self):
+        """
+        Test that check_access authorizes from the token claims without reading the user from the database.
+        """
+        protected = check_access(roles=[UserRole.ADMIN])(lambda: "granted")
+        supervisor_only = check_access(roles=[UserRole.SUPERVISOR])(lambda: "granted")
+        with self.app.app_context():
+            token = self.auth_service.create_token("AdminAuthService", UserRole.ADMIN)
+            with self.app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+                with mock.patch.object(UserRepository, 'find_by_username') as find_by_username:
+                    self.assertEqual("granted", protected())
+                    self.assertRaises(NoAuthorizationError, supervisor_only)
+                    find_by_username.assert_not_called()
+
+    def test_check_access_after_account_change(self):
+        """
+        Test that tokens issued before a change of the user are authorized with the recorded state.
+        """
+        protected = check_access(roles=[UserRole.SUPERVISOR])(lambda: "granted")
+        with self.app.app_context():
+            token = self.auth_service.create_token("StaleAuthService", UserRole.ADMIN)
+            AccessVersionTable.record_change("StaleAuthService", UserRole.SUPERVISOR)
+            with self.app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+                self.assertEqual("granted", protected())
+            AccessVersionTable.record_change("StaleAuthService")
+            with self.app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+                self.assertRaises(NoAuthorizationError, protected)
+
     def test_get_user_from_token(self):
         with self.app.app_context():
             # Create a token
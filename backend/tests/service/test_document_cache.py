@@ -0,0 +1,95 @@
+import os
+import stat
+import tempfile
+import time
+import unittest
+
+from service.document.document_cache import DocumentCache
+
+
+class TestDocumentCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.document_cache = DocumentCache(self.cache_dir.name, max_entries=2)
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    def test_put_and_get(self):
+        """
+        Test that a cached document is returned for the same key only.
+        """
+        key = DocumentCache.get_key("66a1", "version1", ["sig1", "sig2"])
+        self.document_cache.put(key, b"%PDF-document")
+        self.assertTrue(self.document_cache.contains(key))
+        self.assertEqual(b"%PDF-document", self.document_cache.get(key))
+        self.assertIsNone(self.document_cache.get(DocumentCache.get_key("66a1", "version2", ["sig1", "sig2"])))
+
+    def test_evicts_least_recently_used(self):
+        """
+        Test that the least recently used document is evicted once the cache is full.
+        """
+        first_key = DocumentCache.get_key("66a1", "version", ["sig1", "sig2"])
+        second_key = DocumentCache.get_key("66a2", "version", ["sig1", "sig2"])
+        third_key = DocumentCache.get_key("66a3", "version", ["sig1", "sig2"])
+        self.document_cache.put(first_key, b"first")
+        self.document_cache.put(second_key, b"second")
+        # Mark the first document as older than the second one, then use it again
+        os.utime(os.path.join(self.cache_dir.name, f"{first_key}.pdf"), (time.time() - 20, time.time() - 20))
+        os.utime(os.path.join(self.cache_dir.name, f"{second_key}.pdf"), (time.time() - 10, time.time() - 10))
+        self.document_cache.get(first_key)
+        self.document_cache.put(third_key, b"third")
+        self.assertTrue(self.document_cache.contains(first_key))
+        self.assertFalse(self.document_cache.contains(second_key))
+        self.assertTrue(self.document_cache.contains(third_key))
+
+    def test_invalidate_timesheet(self):
+        """
+        Test that invalidating a timesheet removes all of its documents.
+        """
+        key = DocumentCache.get_key("66a1", "version", ["sig1", "sig2"])
+        other_key = DocumentCache.get_key("66a2", "version", ["sig1", "sig2"])
+        self.document_cache.put(key, b"first")
+        self.document_cache.put(other_key, b"second")
+        self.document_cache.invalidate_timesheet("66a1")
+        self.assertFalse(self.document_cache.contains(key))
+        self.assertTrue(self.document_cache.contains(other_key))
+
+    def test_invalidate_signature(self):
+        """
+        Test that invalidating a signature removes all documents carrying it.
+        """
+        key = DocumentCache.get_key("66a1", "version", ["sig1", "supervisorSig"])
+        other_key = DocumentCache.get_key("66a2", "version", ["sig2", "otherSupervisorSig"])
+        self.document_cache.put(key, b"first")
+        self.document_cache.put(other_key, b"second")
+        self.document_cache.invalidate_signature("supervisorSig")
+        self.assertFalse(self.document_cache.contains(key))
+        self.assertTrue(self.document_cache.contains(other_key))
+
+
+    @unittest.skipIf(os.name != 'posix', "File permissions are POSIX specific")
+    def test_private_permissions(self):
+        """
+        Test that the cache directory and the cached documents can only be accessed by the owner.
+        """
+        cache_dir = os.path.join(self.cache_dir.name, "cache")
+        document_cache = DocumentCache(cache_dir)
+        key = DocumentCache.get_key("66a1", "version", ["sig1", "sig2"])
+        document_cache.put(key, b"%PDF-document")
+        self.assertEqual(0o700, stat.S_IMODE(os.stat(cache_dir).st_mode))
+        self.assertEqual(0o600, stat.S_IMODE(os.stat(os.path.join(cache_dir, f"{key}.pdf")).st_mode))
+
+    @unittest.skipIf(os.name != 'posix', "Symbolic links are POSIX specific")
+    def test_rejects_symbolic_link(self):
+        """
+        Test that a symbolic link planted in place of the cache directory is not used.
+        """
+        link = os.path.join(self.cache_dir.name, "link")
+        os.symlink(self.cache_dir.name, link)
+        with self.assertRaises(PermissionError):
+            DocumentCache(link)
+
+if __name__ == '__main__':
+    unittest.main()
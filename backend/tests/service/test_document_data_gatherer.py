@@ -0,0 +1,124 @@
+import unittest
+from io import BytesIO
+from unittest import mock
+
+from bson import ObjectId
+from PIL import Image
+
+from model.file.FileType import FileType
+from model.timesheet import Timesheet
+from model.timesheet_status import TimesheetStatus
+from model.user.role import UserRole
+from service.document.document_data_gatherer import DocumentDataGatherer
+from service.document.signature_cache import SignatureCache
+
+
+class TestDocumentDataGatherer(unittest.TestCase):
+
+    def setUp(self):
+        self.supervisor = mock.Mock(username="testSupervisor", role=UserRole.SUPERVISOR)
+        self.hiwis = {username: mock.Mock(username=username, role=UserRole.HIWI, supervisor="testSupervisor")
+                      for username in ("testHiwi1", "testHiwi2")}
+        self.timesheets = {}
+        for username in self.hiwis:
+            self.timesheets[(username, 5, 2024)] = Timesheet(username, 5, 2024, ObjectId(),
+                                                             TimesheetStatus.COMPLETE, overtime=-90)
+            self.timesheets[(username, 4, 2024)] = Timesheet(username, 4, 2024, ObjectId(),
+                                                             TimesheetStatus.COMPLETE, overtime=125)
+        self.user_service = mock.Mock()
+        self.user_service.get_profiles.side_effect = self._get_profiles
+        self.timesheet_service = mock.Mock()
+        self.timesheet_service.get_timesheets_by_months.return_value = self.timesheets
+        self.time_entry_service = mock.Mock()
+        self.time_entry_service.get_entries_of_timesheets.side_effect = \
+            lambda timesheet_ids: {str(timesheet_id): [] for timesheet_id in timesheet_ids}
+        self.file_service = mock.Mock()
+        self.file_service.get_image_ids.return_value = {"testHiwi1": "signature1", "testHiwi2": "signature2",
+                                                        "testSupervisor": "supervisorSignature"}
+        self.file_service.get_image_by_id.side_effect = self._get_image_by_id
+        self.signature_cache = SignatureCache()
+        self.gatherer = DocumentDataGatherer(self.user_service, self.timesheet_service, self.time_entry_service,
+                                             self.file_service, self.signature_cache)
+
+    @staticmethod
+    def _get_image_by_id(signature_id):
+        stream = BytesIO()
+        Image.new('RGB', (200, 50), 'blue' if signature_id == "supervisorSignature" else 'white').save(stream, 'PNG')
+        stream.seek(0)
+        return stream
+
+    def _get_profiles(self, usernames):
+        users = dict(self.hiwis, testSupervisor=self.supervisor)
+        return {username: users[username] for username in usernames if username in users}
+
+    def test_get_document_sources(self):
+        """
+        Test that the sources of several documents are loaded with one query per collection.
+        """
+        targets = [{"username": username, "month": 5, "year": 2024} for username in self.hiwis]
+        results = self.gatherer.get_document_sources(targets)
+        self.assertEqual(2, self.user_service.get_profiles.call_count)
+        self.timesheet_service.get_timesheets_by_months.assert_called_once()
+        self.file_service.get_image_ids.assert_called_once()
+        self.assertEqual(FileType.SIGNATURE, self.file_service.get_image_ids.call_args.args[1])
+        self.assertTrue(all(result.is_successful for result in results))
+        self.assertEqual(["testHiwi1", "testHiwi2"], [result.data.user.username for result in results])
+        self.assertEqual(125, results[0].data.previous_overtime)
+        self.assertEqual("supervisorSignature", results[1].data.supervisor_signature_id)
+
+    def test_get_document_sources_failures(self):
+        """
+        Test that a failing document does not affect the other documents of the batch.
+        """
+        self.timesheets[("testHiwi2", 5, 2024)].status = TimesheetStatus.WAITING_FOR_APPROVAL
+        targets = [{"username": "testHiwi1", "month": 5, "year": 2024},
+                   {"username": "testHiwi2", "month": 5, "year": 2024},
+                   {"username": "testHiwi1", "month": 7, "year": 2024},
+                   {"username": "unknownUser", "month": 5, "year": 2024}]
+        results = self.gatherer.get_document_sources(targets)
+        self.assertTrue(results[0].is_successful)
+        self.assertEqual("Timesheet is not complete.", results[1].message)
+        self.assertEqual("Failed to get timesheet data.", results[2].message)
+        self.assertEqual(404, results[3].status_code)
+
+    def test_gather_document_data(self):
+        """
+        Test that the data of several documents is gathered with one entry query and one read per signature.
+        """
+        targets = [{"username": username, "month": 5, "year": 2024} for username in self.hiwis]
+        sources = [result.data for result in self.gatherer.get_document_sources(targets)]
+        results = self.gatherer.gather_document_data(sources)
+        self.time_entry_service.get_entries_of_timesheets.assert_called_once()
+        # The shared supervisor signature is read once
+        self.assertEqual(3, self.file_service.get_image_by_id.call_count)
+        self.assertTrue(all(result.is_successful for result in results))
+        self.assertEqual(self.signature_cache.get("supervisorSignature"), results[0].data.supervisor_signature.read())
+        self.assertEqual(self.signature_cache.get("supervisorSignature"), results[1].data.supervisor_signature.read())
+        self.assertEqual(self.signature_cache.get("signature2"), results[1].data.signature.read())
+        self.assertEqual("-01:30", results[0].data.overtime)
+        self.assertEqual("02:05", results[0].data.overtime_from_previous_month)
+
+    def test_gather_document_data_cached_signatures(self):
+        """
+        Test that signatures read by an earlier export are taken from the signature cache.
+        """
+        targets = [{"username": username, "month": 5, "year": 2024} for username in self.hiwis]
+        sources = [result.data for result in self.gatherer.get_document_sources(targets)]
+        self.gatherer.gather_document_data(sources)
+        self.gatherer.gather_document_data(sources)
+        self.assertEqual(3, self.file_service.get_image_by_id.call_count)
+
+    def test_gather_document_data_missing_signature(self):
+        """
+        Test that a document without a supervisor signature fails.
+        """
+        del self.file_service.get_image_ids.return_value["testSupervisor"]
+        sources = [result.data for result in
+                   self.gatherer.get_document_sources([{"username": "testHiwi1", "month": 5, "year": 2024}])]
+        result = self.gatherer.gather_document_data(sources)[0]
+        self.assertFalse(result.is_successful)
+        self.assertEqual("Failed to get supervisor signature.", result.message)
+
+
+if __name__ == '__main__':
+    unittest.main()
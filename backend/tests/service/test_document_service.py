@@ -1,4 +1,5 @@
 import os
+import time
 import unittest
 from datetime import datetime
 
@@ -178,6 +179,51 @@ class TestDocumentService(unittest.TestCase):
                 self.assertEqual(generate_document_result.status_code, 200)
                 self.assertIsNotNone(generate_document_result.message)
 
+    def test_generate_document_in_memory(self):
+        """
+        Test that the generate_document method of the DocumentService class returns the signed PDF as a named stream.
+        """
+        with self.app.app_context():
+            access_token = self._authenticate('testHiwiDocService', 'test_password')
+            with self.app.test_request_context(headers={"Authorization": f"Bearer {access_token}"}):
+                generate_document_result = self.document_service.generate_document(self.current_month, self.current_year, "testHiwiDocService", "testHiwiDocService")
+                self.assertEqual(200, generate_document_result.status_code)
+                self.assertTrue(generate_document_result.data.getvalue().startswith(b'%PDF'))
+                self.assertTrue(generate_document_result.data.name.endswith('_Approved.pdf'))
+
+    def test_generate_document_cached(self):
+        """
+        Test that a repeated download of a document is served from the document cache.
+        """
+        with self.app.app_context():
+            access_token = self._authenticate('testHiwiDocService', 'test_password')
+            with self.app.test_request_context(headers={"Authorization": f"Bearer {access_token}"}):
+                first_result = self.document_service.generate_document(self.current_month, self.current_year, "testHiwiDocService", "testHiwiDocService")
+                document_source = self.document_service._get_document_source(self.current_month, self.current_year, "testHiwiDocService").data
+                cache_key = self.document_service._get_cache_key(document_source)
+                self.assertTrue(self.document_service.document_cache.contains(cache_key))
+                second_result = self.document_service.generate_document(self.current_month, self.current_year, "testHiwiDocService", "testHiwiDocService")
+                self.assertEqual(first_result.data.getvalue(), second_result.data.getvalue())
+                self.assertEqual(first_result.data.name, second_result.data.name)
+
+    def test_prerender_document(self):
+        """
+        Test that the prerender_document method of the DocumentService class renders the document into the cache.
+        """
+        timesheet_id = str(self.timesheet.timesheet_id)
+        self.document_service.document_cache.invalidate_timesheet(timesheet_id)
+        enqueue_result = self.document_service.prerender_document(timesheet_id)
+        self.assertEqual(202, enqueue_result.status_code)
+        for _ in range(100):
+            status_result = self.document_service.get_prerender_status(timesheet_id, "testHiwiDocService")
+            if status_result.data["status"] in ("Done", "Failed"):
+                break
+            time.sleep(0.1)
+        self.assertEqual("Done", status_result.data["status"])
+        document_source = self.document_service._get_document_source(self.current_month, self.current_year, "testHiwiDocService").data
+        self.assertTrue(self.document_service.document_cache.contains(
+            self.document_service._get_cache_key(document_source)))
+
     def test_generate_multiple_documents(self):
         """
         Test the generate_multiple_documents method of the DocumentService class.
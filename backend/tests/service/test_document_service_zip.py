@@ -0,0 +1,54 @@
+import unittest
+from io import BytesIO
+from unittest import mock
+
+from model.request_result import RequestResult
+from service.document.document_service import DocumentService
+
+
+class TestDocumentServiceZip(unittest.TestCase):
+
+    def setUp(self):
+        self.document_service = DocumentService(mock.Mock(), mock.Mock(), mock.Mock(), mock.Mock())
+        self.document_service.document_cache = mock.Mock()
+        self.document_service.document_data_gatherer = mock.Mock()
+        self.document_service.document_data_gatherer.gather_document_data.side_effect = \
+            lambda document_sources: [RequestResult(True, "", 200, document_source.name)
+                                      for document_source in document_sources]
+        self.document_service.pdf_generator_strategy = mock.Mock()
+        self.document_service.pdf_generator_strategy.stream_multiple_documents.side_effect = \
+            lambda documents, workers: RequestResult(True, "", 200, (self._to_stream(document)
+                                                                     for document in documents))
+        self.document_sources = [mock.Mock(), mock.Mock()]
+        self.document_sources[0].name = "A"
+        self.document_sources[1].name = "B"
+
+    @staticmethod
+    def _to_stream(name):
+        stream = BytesIO(f"%PDF-{name}".encode())
+        stream.name = f"{name}.pdf"
+        return stream
+
+    def test_generate_zip_document_cached_concurrently(self):
+        """
+        Test that a document cached by another thread during an export does not shift the gathered data of
+        the other documents.
+        """
+        cached_keys = set()
+
+        def contains(cache_key):
+            # Another thread caches each document right after its first check
+            is_cached = cache_key in cached_keys
+            cached_keys.add(cache_key)
+            return is_cached
+
+        self.document_service.document_cache.contains.side_effect = contains
+        with mock.patch.object(DocumentService, '_get_cache_key', side_effect=lambda source: f"key-{source.name}"):
+            result = self.document_service._generate_zip(self.document_sources)
+            b"".join(result.data)
+        self.assertEqual([mock.call("key-A", b"%PDF-A"), mock.call("key-B", b"%PDF-B")],
+                         self.document_service.document_cache.put.call_args_list)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import os
+import stat
+import tempfile
+import time
+import unittest
+from io import BytesIO
+from unittest import mock
+from zipfile import ZipFile
+
+from model.request_result import RequestResult
+from service.document.document_service import DocumentService
+from service.document.export_job_service import ExportJobService
+
+
+class TestExportJobService(unittest.TestCase):
+
+    def setUp(self):
+        self.export_dir = tempfile.TemporaryDirectory()
+        self.document_service = mock.Mock()
+        self.document_service.get_export_targets.return_value = RequestResult(
+            True, "", 200, [{"username": "testHiwi", "month": 5, "year": 2024},
+                            {"username": "testHiwi", "month": 6, "year": 2024}])
+        self.document_service.generate_authorized_documents.side_effect = \
+            lambda targets: (self._generate_document(target["month"], target["year"], target["username"])
+                             for target in targets)
+        with mock.patch.dict(os.environ, {'DOCUMENT_EXPORT_DIR': self.export_dir.name}):
+            self.export_job_service = ExportJobService(self.document_service)
+
+    def tearDown(self):
+        self.export_dir.cleanup()
+
+    @staticmethod
+    def _generate_document(month, year, username):
+        if month == 6:
+            return RequestResult(False, "Timesheet is not complete.", 400)
+        document = BytesIO(b"%PDF-document")
+        document.name = f"{username}_{month}_{year}_Approved.pdf"
+        return RequestResult(True, "Document generated successfully", 200, document)
+
+    def _wait_for_job(self, job_id):
+        for _ in range(100):
+            job = self.export_job_service.get_export_job(job_id, "testSecretary").data
+            if job["status"] in ("Done", "Failed"):
+                return job
+            time.sleep(0.05)
+        return job
+
+    def test_export_job(self):
+        """
+        Test that an export job reports its progress and failures and provides the zip file of the rendered documents.
+        """
+        result = self.export_job_service.create_export_job("testSecretary", usernames=["testHiwi"], month=5, year=2024)
+        self.assertEqual(202, result.status_code)
+        job = self._wait_for_job(result.data["jobId"])
+        self.assertEqual("Done", job["status"])
+        self.assertEqual(2, job["total"])
+        self.assertEqual(1, job["rendered"])
+        self.assertEqual([{"username": "testHiwi", "month": 6, "year": 2024, "message": "Timesheet is not complete."}],
+                         job["failures"])
+        file_result = self.export_job_service.get_export_file(result.data["jobId"], "testSecretary")
+        with ZipFile(file_result.data) as zip_file:
+            self.assertEqual(["testHiwi_5_2024_Approved.pdf"], zip_file.namelist())
+
+    def test_generate_authorized_documents(self):
+        """
+        Test that the documents of an export are gathered in chunks and rendered together per chunk.
+        """
+        document_service = DocumentService(mock.Mock(), mock.Mock(), mock.Mock(), mock.Mock(), render_workers=2)
+        document_service.document_cache = mock.Mock()
+        document_service.document_cache.get.return_value = None
+        document_service.document_data_gatherer = mock.Mock()
+        document_service.document_data_gatherer.get_document_sources.side_effect = \
+            lambda targets: [RequestResult(True, "", 200, mock.Mock(signature_id=None)) if target["month"] != 6
+                             else RequestResult(False, "Failed to get timesheet data.", 400) for target in targets]
+        document_service.document_data_gatherer.gather_document_data.side_effect = \
+            lambda document_sources: [RequestResult(True, "", 200, document_source)
+                                      for document_source in document_sources]
+        document_service.pdf_generator_strategy = mock.Mock()
+        document_service.pdf_generator_strategy.stream_multiple_documents.side_effect = \
+            lambda documents, workers: RequestResult(True, "", 200, (BytesIO(b"%PDF-document") for _ in documents))
+        targets = [{"username": "testHiwi", "month": month, "year": 2024} for month in range(1, 13)] * 5
+
+        with mock.patch.object(DocumentService, 'EXPORT_CHUNK_SIZE', 25):
+            results = list(document_service.generate_authorized_documents(targets))
+        self.assertEqual([target["month"] != 6 for target in targets], [result.is_successful for result in results])
+        self.assertEqual(3, document_service.document_data_gatherer.get_document_sources.call_count)
+        self.assertEqual(3, document_service.document_data_gatherer.gather_document_data.call_count)
+        self.assertEqual([(25 - 2, 2), (25 - 2, 2), (10 - 1, 2)],
+                         [(len(call.args[0]), call.args[1])
+                          for call in document_service.pdf_generator_strategy.stream_multiple_documents.call_args_list])
+
+    def test_export_job_limit(self):
+        """
+        Test that a user cannot queue more than the maximum number of unfinished export jobs.
+        """
+        self.export_job_service.max_jobs_per_user = 1
+        self.export_job_service._executor = mock.Mock()
+        first_result = self.export_job_service.create_export_job("testSecretary", usernames=["testHiwi"], month=5,
+                                                                 year=2024)
+        self.assertEqual(202, first_result.status_code)
+        result = self.export_job_service.create_export_job("testSecretary", usernames=["testHiwi"], month=5, year=2024)
+        self.assertEqual(429, result.status_code)
+        other_result = self.export_job_service.create_export_job("otherSecretary", usernames=["testHiwi"], month=5,
+                                                                 year=2024)
+        self.assertEqual(202, other_result.status_code)
+
+    @unittest.skipIf(os.name != 'posix', "File permissions are POSIX specific")
+    def test_export_file_private(self):
+        """
+        Test that the zip file of an export job can only be accessed by the owner.
+        """
+        result = self.export_job_service.create_export_job("testSecretary", usernames=["testHiwi"], month=5, year=2024)
+        self._wait_for_job(result.data["jobId"])
+        file_path = self.export_job_service.get_export_file(result.data["jobId"], "testSecretary").data
+        self.assertEqual(0o600, stat.S_IMODE(os.stat(file_path).st_mode))
+        self.assertEqual(0o700, stat.S_IMODE(os.stat(self.export_dir.name).st_mode))
+
+    def test_expire_stale_export_files(self):
+        """
+        Test that zip files left by a previous process are removed after the time to live.
+        """
+        stale_path = os.path.join(self.export_dir.name, "stale.zip")
+        recent_path = os.path.join(self.export_dir.name, "recent.zip")
+        for path in (stale_path, recent_path):
+            with open(path, 'wb') as file:
+                file.write(b"PK")
+        os.utime(stale_path, (time.time() - self.export_job_service.job_ttl - 10,) * 2)
+        self.export_job_service.expire_export_jobs()
+        self.assertFalse(os.path.exists(stale_path))
+        self.assertTrue(os.path.exists(recent_path))
+
+    def test_export_job_of_other_user(self):
+        """
+        Test that only the creator of an export job can access it.
+        """
+        result = self.export_job_service.create_export_job("testSecretary", usernames=["testHiwi"], month=5, year=2024)
+        self.assertEqual(403, self.export_job_service.get_export_job(result.data["jobId"], "testHiwi").status_code)
+        self.assertEqual(404, self.export_job_service.get_export_job("unknownJobId", "testSecretary").status_code)
+
+    def test_expire_export_jobs(self):
+        """
+        Test that finished export jobs and their zip files are removed after their time to live.
+        """
+        result = self.export_job_service.create_export_job("testSecretary", usernames=["testHiwi"], month=5, year=2024)
+        self._wait_for_job(result.data["jobId"])
+        file_path = self.export_job_service.get_export_file(result.data["jobId"], "testSecretary").data
+        self.assertEqual(0, self.export_job_service.expire_export_jobs().data)
+        self.export_job_service.job_ttl = -1
+        self.assertEqual(1, self.export_job_service.expire_export_jobs().data)
+        self.assertFalse(os.path.exists(file_path))
+        self.assertEqual(404, self.export_job_service.get_export_job(result.data["jobId"], "testSecretary").status_code)
+
+
+if __name__ == '__main__':
+    unittest.main()
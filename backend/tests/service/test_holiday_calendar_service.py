@@ -0,0 +1,68 @@
+import unittest
+from datetime import date, datetime, timedelta
+
+import holidays
+import numpy as np
+
+from service.holiday_calendar_service import HolidayCalendarService
+
+
+class TestHolidayCalendarService(unittest.TestCase):
+
+    def setUp(self):
+        self.holiday_calendar = HolidayCalendarService(country='DE', subdivision='BW', years_before=2,
+                                                       years_after=1)
+
+    def test_get_holiday_name(self):
+        """
+        Test that the calendar returns the holidays of the holidays package.
+        """
+        current_year = datetime.now().year
+        expected_calendar = holidays.country_holidays('DE', subdiv='BW', years=range(current_year - 2,
+                                                                                     current_year + 2))
+        day = date(current_year - 2, 1, 1)
+        while day.year < current_year + 2:
+            self.assertEqual(expected_calendar.get(day), self.holiday_calendar.get_holiday_name(day))
+            day += timedelta(days=1)
+
+    def test_is_holiday(self):
+        """
+        Test the is_holiday method of the HolidayCalendarService class.
+        """
+        self.assertTrue(self.holiday_calendar.is_holiday(date(2024, 1, 6)))
+        self.assertFalse(self.holiday_calendar.is_holiday(date(2024, 1, 8)))
+
+    def test_year_outside_window(self):
+        """
+        Test that the holidays of a year outside the precomputed window are computed on the first lookup.
+        """
+        self.assertEqual("Neujahr", self.holiday_calendar.get_holiday_name(date(2001, 1, 1)))
+        self.assertIn(2001, self.holiday_calendar._years)
+
+    def test_subdivision(self):
+        """
+        Test that the holidays depend on the configured region.
+        """
+        berlin_calendar = HolidayCalendarService(country='DE', subdivision='BE', years_before=0, years_after=0)
+        self.assertFalse(berlin_calendar.is_holiday(date(2024, 1, 6)))
+        self.assertTrue(berlin_calendar.is_holiday(date(2024, 3, 8)))
+
+    def test_are_holidays(self):
+        """
+        Test that the vectorized membership test returns the result of is_holiday for every day.
+        """
+        days = np.arange((date(1999, 1, 1) - date(1970, 1, 1)).days, (date(2031, 1, 1) - date(1970, 1, 1)).days,
+                         dtype=np.int64)
+        expected = [self.holiday_calendar.is_holiday(date(1970, 1, 1) + timedelta(days=int(day))) for day in days]
+        self.assertEqual(expected, self.holiday_calendar.are_holidays(days).tolist())
+        self.assertEqual([], self.holiday_calendar.are_holidays(np.array([], dtype=np.int64)).tolist())
+
+    def test_get_instance(self):
+        """
+        Test that the calendar is shared.
+        """
+        self.assertIs(HolidayCalendarService.get_instance(), HolidayCalendarService.get_instance())
+
+
+if __name__ == '__main__':
+    unittest.main()
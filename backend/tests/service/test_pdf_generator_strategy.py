@@ -0,0 +1,100 @@
+import unittest
+from datetime import datetime
+from io import BytesIO
+from zipfile import ZipFile
+
+from PIL import Image
+
+from model.document_data import DocumentData
+from model.user.contract_information import ContractInfo
+from model.user.personal_information import PersonalInfo
+from service.document.pdf_generator_strategy import PDFGeneratorStrategy, get_render_pool, shutdown_render_pool
+from utils.zip_stream import ZipStream
+
+
+class TestPDFGeneratorStrategy(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pdf_generator_strategy = PDFGeneratorStrategy()
+
+    def _create_document_data(self, month: int):
+        """
+        Creates the document data of a timesheet without time entries and with blank signatures.
+        """
+        personal_info = PersonalInfo("Test", "Hiwi", "test@gmail.com", "1234567890", "Test Institute")
+        contract_info = ContractInfo(15, 40, 0)
+        return DocumentData(month, 2024, personal_info, contract_info, "00:00", self._create_signature(),
+                            self._create_signature(), "00:00", [], "00:00", datetime(2024, month, 28))
+
+    @staticmethod
+    def _create_signature():
+        stream = BytesIO()
+        Image.new('RGB', (300, 30), 'white').save(stream, 'PNG')
+        stream.seek(0)
+        return stream
+
+    def test_generate_document(self):
+        """
+        Test that the generate_document method of the PDFGeneratorStrategy class returns the PDF as a named stream.
+        """
+        result = self.pdf_generator_strategy.generate_document(self._create_document_data(5))
+        self.assertEqual(200, result.status_code)
+        self.assertTrue(result.data.getvalue().startswith(b'%PDF'))
+        self.assertEqual("Test_Hiwi_5_2024_Approved.pdf", result.data.name)
+
+    def test_generate_multiple_documents_parallel(self):
+        """
+        Test that rendering with a process pool results in the same documents and zip entries as sequential rendering.
+        """
+        sequential_result = self.pdf_generator_strategy.generate_multiple_documents(
+            [self._create_document_data(month) for month in range(1, 4)])
+        parallel_result = self.pdf_generator_strategy.generate_multiple_documents(
+            [self._create_document_data(month) for month in range(1, 4)], workers=2)
+        self.assertEqual(200, parallel_result.status_code)
+        self.assertEqual([document.name for document in sequential_result.data],
+                         [document.name for document in parallel_result.data])
+        self.assertEqual([document.getvalue() for document in sequential_result.data],
+                         [document.getvalue() for document in parallel_result.data])
+
+        with ZipFile(BytesIO(b"".join(ZipStream.stream(sequential_result.data)))) as sequential_zip, \
+                ZipFile(BytesIO(b"".join(ZipStream.stream(parallel_result.data)))) as parallel_zip:
+            self.assertEqual(sequential_zip.namelist(), parallel_zip.namelist())
+            for name in sequential_zip.namelist():
+                self.assertEqual(sequential_zip.read(name), parallel_zip.read(name))
+
+    def test_render_pool_shared(self):
+        """
+        Test that all exports render through the same pool of processes.
+        """
+        self.addCleanup(shutdown_render_pool)
+        first_result = self.pdf_generator_strategy.generate_multiple_documents(
+            [self._create_document_data(month) for month in range(1, 3)], workers=2)
+        render_pool = get_render_pool(2)
+        second_result = self.pdf_generator_strategy.generate_multiple_documents(
+            [self._create_document_data(month) for month in range(3, 5)], workers=2)
+        self.assertIs(render_pool, get_render_pool(2))
+        self.assertEqual(2, render_pool._max_workers)
+        self.assertIsNot(render_pool, get_render_pool(3))
+        self.assertEqual(3, get_render_pool(3)._max_workers)
+        self.assertEqual(2, len(first_result.data))
+        self.assertEqual(2, len(second_result.data))
+        shutdown_render_pool()
+        self.assertIsNot(render_pool, get_render_pool(2))
+
+    def test_stream_multiple_documents_zip(self):
+        """
+        Test that the zip file of streamed documents is emitted entry by entry while the documents are rendered.
+        """
+        result = self.pdf_generator_strategy.stream_multiple_documents(
+            [self._create_document_data(month) for month in range(1, 3)])
+        zip_chunks = ZipStream.stream(result.data)
+        first_chunk = next(zip_chunks)
+        self.assertTrue(first_chunk.startswith(b'PK'))
+        with ZipFile(BytesIO(first_chunk + b"".join(zip_chunks))) as zip_file:
+            self.assertEqual(["Test_Hiwi_1_2024_Approved.pdf", "Test_Hiwi_2_2024_Approved.pdf"], zip_file.namelist())
+            self.assertIsNone(zip_file.testzip())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from io import BytesIO
+
+import fitz
+from fillpdf import fillpdfs
+
+from service.document.pdf_generator_strategy import PDFGeneratorStrategy
+from service.document.pdf_template_engine import PDFTemplateEngine
+
+
+class TestPDFTemplateEngine(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = PDFTemplateEngine.get_instance(PDFGeneratorStrategy.TEMPLATE_PATH)
+        cls.form_data = {
+            "Personalnummer": "1234567890",
+            "abc": 5,
+            "abdd": 2024,
+            "GF": "Müller, Änne (Test)",
+            "GFB": "On",
+            "UB": "Off",
+            "Tätigkeit Stichwort ProjektRow1": "Urlaub",
+            "hhmmRow1": "09:00",
+            "Übertrag vom Vormonat": "-01:30",
+            "Unknown field": "ignored"
+        }
+
+    @staticmethod
+    def _get_field_values(document):
+        return {widget.field_name: widget.field_value for page in document for widget in page.widgets()}
+
+    def test_get_instance(self):
+        """
+        Test that the template is loaded once per process.
+        """
+        self.assertIs(self.engine, PDFTemplateEngine.get_instance(PDFGeneratorStrategy.TEMPLATE_PATH))
+        self.assertIn("Personalnummer", self.engine.fields)
+
+    def test_fill_parity(self):
+        """
+        Test that the engine fills the form with the same values as fillpdf.
+        """
+        fillpdf_document = BytesIO()
+        fillpdfs.write_fillable_pdf(PDFGeneratorStrategy.TEMPLATE_PATH, fillpdf_document, self.form_data)
+        expected_document = fitz.open(stream=fillpdf_document.getvalue(), filetype="pdf")
+        filled_document = self.engine.fill(self.form_data)
+        document = fitz.open(stream=filled_document.tobytes(), filetype="pdf")
+        self.assertEqual(self._get_field_values(expected_document), self._get_field_values(document))
+        self.assertEqual("Müller, Änne (Test)", self._get_field_values(document)["GF"])
+        for opened_document in (expected_document, filled_document, document):
+            opened_document.close()
+
+    def test_fill_independent_copies(self):
+        """
+        Test that filling a document does not change the template or other documents.
+        """
+        first_document = self.engine.fill({"GF": "First"})
+        second_document = self.engine.fill({})
+        self.assertEqual("First", self._get_field_values(first_document)["GF"])
+        self.assertEqual("", self._get_field_values(second_document)["GF"])
+        first_document.close()
+        second_document.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
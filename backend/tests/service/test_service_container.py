@@ -0,0 +1,58 @@
+import unittest
+
+from controller.time_entry_controller import TimeEntryController
+from controller.timesheet_controller import TimesheetController
+from controller.user_controller import UserController
+from service.service_container import ServiceContainer
+
+
+class TestServiceContainer(unittest.TestCase):
+    """
+    Test suite for the ServiceContainer class.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.service_container = ServiceContainer()
+
+    def test_get_instance(self):
+        """
+        Test that get_instance always returns the same container.
+        """
+        self.assertIs(ServiceContainer.get_instance(), ServiceContainer.get_instance())
+
+    def test_services_are_built_once(self):
+        """
+        Test that every service is only built once per container.
+        """
+        self.assertIs(self.service_container.user_service, self.service_container.user_service)
+        self.assertIs(self.service_container.timesheet_service, self.service_container.timesheet_service)
+        self.assertIs(self.service_container.time_entry_service, self.service_container.time_entry_service)
+
+    def test_services_share_dependencies(self):
+        """
+        Test that the services are wired with the shared instances of their dependencies.
+        """
+        timesheet_service = self.service_container.timesheet_service
+        time_entry_service = self.service_container.time_entry_service
+        self.assertIs(self.service_container.user_service, timesheet_service.user_service)
+        self.assertIs(self.service_container.notification_service, timesheet_service.notification_service)
+        self.assertIs(timesheet_service, time_entry_service.timesheet_service)
+        self.assertIs(self.service_container.user_service, time_entry_service.user_service)
+
+    def test_controllers_use_container_services(self):
+        """
+        Test that controllers created per request reuse the services of the container.
+        """
+        first_controller = TimesheetController(self.service_container)
+        second_controller = TimesheetController(self.service_container)
+        self.assertIs(first_controller.timesheet_service, second_controller.timesheet_service)
+        self.assertIs(self.service_container.file_service, first_controller.file_service)
+        time_entry_controller = TimeEntryController(self.service_container)
+        self.assertIs(self.service_container.time_entry_service, time_entry_controller.time_entry_service)
+        user_controller = UserController(self.service_container)
+        self.assertIs(self.service_container.auth_service, user_controller.auth_service)
+
+
+if __name__ == '__main__':
+    unittest.main()
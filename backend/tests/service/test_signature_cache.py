@@ -0,0 +1,85 @@
+import unittest
+from io import BytesIO
+
+from PIL import Image
+
+from service.document.pdf_generator_strategy import PDFGeneratorStrategy
+from service.document.signature_cache import SignatureCache
+
+
+class TestSignatureCache(unittest.TestCase):
+
+    def setUp(self):
+        self.signature_cache = SignatureCache(max_bytes=100)
+
+    @staticmethod
+    def _create_image(width: int, height: int, image_format: str = 'PNG'):
+        stream = BytesIO()
+        Image.new('RGB', (width, height), 'black').save(stream, image_format)
+        return stream.getvalue()
+
+    def test_get_instance(self):
+        """
+        Test that the get_instance method of the SignatureCache class returns a singleton.
+        """
+        self.assertIs(SignatureCache.get_instance(), SignatureCache.get_instance())
+
+    def test_normalize(self):
+        """
+        Test that a signature is scaled to fit the stamp and centered on an image of the size of the stamp.
+        """
+        stamp_width = PDFGeneratorStrategy.SIGNATURE_WIDTH * SignatureCache.STAMP_RESOLUTION
+        stamp_height = PDFGeneratorStrategy.SIGNATURE_HEIGHT * SignatureCache.STAMP_RESOLUTION
+        for width, height, image_format in ((2000, 1000, 'PNG'), (60, 3, 'JPEG')):
+            with Image.open(BytesIO(SignatureCache.normalize(self._create_image(width, height, image_format)))) \
+                    as signature:
+                self.assertEqual('PNG', signature.format)
+                self.assertEqual((stamp_width, stamp_height), signature.size)
+                bounding_box = signature.getchannel('A').getbbox()
+                scale = min(stamp_width / width, stamp_height / height)
+                self.assertEqual(round(width * scale), bounding_box[2] - bounding_box[0])
+                self.assertEqual(round(height * scale), bounding_box[3] - bounding_box[1])
+
+    def test_normalize_invalid_image(self):
+        """
+        Test that an image that cannot be decoded is rejected.
+        """
+        with self.assertRaises(OSError):
+            SignatureCache.normalize(b"no image")
+
+    def test_put_and_get(self):
+        """
+        Test that a cached signature is returned by its GridFS ID.
+        """
+        self.signature_cache.put("signature", b"image")
+        self.assertEqual(b"image", self.signature_cache.get("signature"))
+        self.assertIsNone(self.signature_cache.get("otherSignature"))
+
+    def test_eviction(self):
+        """
+        Test that the least recently used signatures are evicted once the memory limit is exceeded.
+        """
+        self.signature_cache.put("first", b"1" * 40)
+        self.signature_cache.put("second", b"2" * 40)
+        self.signature_cache.get("first")
+        self.signature_cache.put("third", b"3" * 40)
+        self.assertIsNone(self.signature_cache.get("second"))
+        self.assertIsNotNone(self.signature_cache.get("first"))
+        self.assertIsNotNone(self.signature_cache.get("third"))
+        self.signature_cache.put("tooLarge", b"4" * 101)
+        self.assertIsNone(self.signature_cache.get("tooLarge"))
+
+    def test_invalidate(self):
+        """
+        Test that a replaced or deleted signature is removed from the cache.
+        """
+        self.signature_cache.put("signature", b"image")
+        self.signature_cache.invalidate("signature")
+        self.assertIsNone(self.signature_cache.get("signature"))
+        self.signature_cache.put("signature", b"image")
+        self.signature_cache.clear()
+        self.assertIsNone(self.signature_cache.get("signature"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import unittest
+import xml.etree.ElementTree as ElementTree
+from datetime import datetime
+from io import BytesIO
+from unittest import mock
+from zipfile import ZipFile
+
+from bson import ObjectId
+
+from model.user.role import UserRole
+from service.document.table_export_service import TableExportService
+from utils.table_stream import TableStream
+
+SHEET_NAMESPACE = {'sheet': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+
+
+class TestTableExportService(unittest.TestCase):
+
+    def setUp(self):
+        self.user_service = mock.Mock()
+        self.user_service.get_profile.side_effect = self._get_profile
+        self.user_service.get_users_by_role.return_value = mock.Mock(
+            data=[mock.Mock(username="testHiwi2"), mock.Mock(username="testHiwi1")])
+        self.table_export_service = TableExportService(self.user_service)
+        self.timesheet_ids = {"testHiwi1": ObjectId(), "testHiwi2": ObjectId()}
+        self.table_export_service.timesheet_repository = mock.Mock()
+        self.table_export_service.timesheet_repository.find_timesheets_by_time_period.side_effect = \
+            self._find_timesheets
+        self.table_export_service.time_entry_repository = mock.Mock()
+        self.table_export_service.time_entry_repository.find_time_entries_by_timesheet_ids.side_effect = \
+            self._find_time_entries
+
+    @staticmethod
+    def _get_profile(username):
+        roles = {"testSecretary": UserRole.SECRETARY, "testSupervisor": UserRole.SUPERVISOR}
+        return mock.Mock(username=username, role=roles.get(username, UserRole.HIWI), hiwis=["testHiwi1"])
+
+    def _find_timesheets(self, usernames, start_date, end_date, projection=None):
+        for username in usernames:
+            yield {"_id": self.timesheet_ids[username], "username": username, "month": 5, "year": 2024,
+                   "status": "Complete", "totalTime": 600, "vacationMinutes": 120, "overtime": -30,
+                   "lastSignatureChange": datetime(2024, 5, 31, 10, 0)}
+
+    def _find_time_entries(self, timesheet_ids):
+        yield {"_id": ObjectId(), "timesheetId": str(timesheet_ids[0]), "entryType": "Work Entry",
+               "startTime": datetime(2024, 5, 2, 7, 0), "endTime": datetime(2024, 5, 2, 12, 0), "breakTime": 30,
+               "activity": "=Testing", "projectName": "Timetracking", "activityType": "Projektbesprechung"}
+        yield {"_id": ObjectId(), "timesheetId": str(timesheet_ids[0]), "entryType": "Vacation Entry",
+               "startTime": datetime(2024, 5, 3, 7, 0), "endTime": datetime(2024, 5, 3, 9, 0)}
+
+    def _export(self, requesting_username, **kwargs):
+        return self.table_export_service.export_table(requesting_username, datetime(2024, 5, 1),
+                                                      datetime(2024, 5, 31), **kwargs)
+
+    def test_export_timesheets_csv(self):
+        """
+        Test that one row per timesheet of all Hiwis is exported for a secretary.
+        """
+        result = self._export("testSecretary")
+        self.assertEqual(200, result.status_code)
+        lines = b"".join(result.data).decode('utf-8-sig').splitlines()
+        self.assertEqual(",".join(TableExportService.TIMESHEET_HEADER), lines[0])
+        self.assertEqual("testHiwi1,5,2024,Complete,600,120,-30,31.05.2024 12:00", lines[1])
+        self.assertTrue(lines[2].startswith("testHiwi2,"))
+
+    def test_export_time_entries_xlsx(self):
+        """
+        Test that one row per time entry is exported as XLSX workbook.
+        """
+        result = self._export("testHiwi1", row_type="timeEntries", file_format="xlsx")
+        self.assertEqual(200, result.status_code)
+        with ZipFile(BytesIO(b"".join(result.data))) as workbook:
+            self.assertIsNone(workbook.testzip())
+            sheet = ElementTree.fromstring(workbook.read('xl/worksheets/sheet1.xml'))
+        rows = [[cell.findtext('sheet:v', namespaces=SHEET_NAMESPACE)
+                 or cell.findtext('sheet:is/sheet:t', namespaces=SHEET_NAMESPACE)
+                 for cell in row] for row in sheet.iter('{%s}row' % SHEET_NAMESPACE['sheet'])]
+        self.assertEqual(TableExportService.TIME_ENTRY_HEADER, rows[0])
+        self.assertEqual(["testHiwi1", "02.05.2024", "09:00", "14:00", "30", "270", "Work Entry", "=Testing",
+                          "Timetracking", "Projektbesprechung"], rows[1])
+        self.assertEqual("Vacation Entry", rows[2][6])
+        self.assertEqual(3, len(rows))
+
+    def test_export_unauthorized(self):
+        """
+        Test that a supervisor can only export the timesheets of their Hiwis.
+        """
+        self.assertEqual(403, self._export("testSupervisor", usernames=["testHiwi2"]).status_code)
+        self.assertEqual(200, self._export("testSupervisor", usernames=["testHiwi1"]).status_code)
+
+    def test_export_invalid_parameters(self):
+        """
+        Test that invalid row types, file formats and time periods are rejected.
+        """
+        self.assertEqual(400, self._export("testSecretary", row_type="days").status_code)
+        self.assertEqual(400, self._export("testSecretary", file_format="pdf").status_code)
+        self.assertEqual(400, self.table_export_service.export_table("testSecretary", datetime(2024, 6, 1),
+                                                                     datetime(2024, 5, 1)).status_code)
+
+    def test_stream_csv(self):
+        """
+        Test that the CSV header is streamed before the rows are read and formulas are not evaluated.
+        """
+        def rows():
+            yield ["=SUM(A1)", 1]
+            raise AssertionError("Only read when the rows are streamed")
+
+        chunks = TableStream.stream_csv(["a", "b"], rows())
+        self.assertEqual("\ufeffa,b\r\n".encode('utf-8'), next(chunks))
+        with self.assertRaises(AssertionError):
+            next(chunks)
+        self.assertEqual("'=SUM(A1),1\r\n".encode('utf-8'), b"".join(TableStream.stream_csv([], [["=SUM(A1)", 1]]))[5:])
+
+    def test_stream_xlsx_batches(self):
+        """
+        Test that a large XLSX sheet is streamed in several chunks.
+        """
+        chunks = list(TableStream.stream_xlsx(["a"], ([row] for row in range(3 * TableStream.BATCH_ROWS))))
+        self.assertGreater(len(chunks), 3)
+        with ZipFile(BytesIO(b"".join(chunks))) as workbook:
+            self.assertIn('xl/workbook.xml', workbook.namelist())
+            self.assertEqual(3 * TableStream.BATCH_ROWS + 1,
+                             workbook.read('xl/worksheets/sheet1.xml').count(b'<row '))
+
+
+if __name__ == '__main__':
+    unittest.main()
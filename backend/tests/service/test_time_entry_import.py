@@ -0,0 +1,153 @@
+import csv
+import datetime
+import unittest
+from io import BytesIO
+from unittest import mock
+
+from bson import ObjectId
+
+from model.request_result import RequestResult
+from model.timesheet import Timesheet
+from model.timesheet_status import TimesheetStatus
+from service.time_entry_service import TimeEntryService
+from utils.time_entry_reader import TimeEntryReader
+
+
+class TestTimeEntryImport(unittest.TestCase):
+
+    def setUp(self):
+        self.timesheet = Timesheet("testHiwi", 6, 2024, ObjectId(), TimesheetStatus.NOT_SUBMITTED)
+        self.timesheet_service = mock.Mock()
+        self.timesheet_service.ensure_timesheet_exists.return_value = RequestResult(True, "Timesheet already exists",
+                                                                                    200)
+        self.timesheet_service.get_timesheets_by_months.side_effect = \
+            lambda keys: {("testHiwi", 6, 2024): self.timesheet} if ("testHiwi", 6, 2024) in keys else {}
+        self.user_service = mock.Mock()
+        self.user_service.get_contract_info.return_value = RequestResult(True, "", 200,
+                                                                         mock.Mock(vacation_minutes=600))
+        self.time_entry_service = TimeEntryService(self.timesheet_service, self.user_service)
+        self.time_entry_repository = mock.Mock()
+        self.time_entry_repository.get_time_entries_by_timesheet_ids.return_value = [
+            {"_id": ObjectId(), "timesheetId": str(self.timesheet.timesheet_id),
+             "startTime": datetime.datetime(2024, 6, 4, 8, 0), "endTime": datetime.datetime(2024, 6, 4, 12, 0),
+             "entryType": "Work Entry"}]
+        self.time_entry_repository.create_time_entries.side_effect = \
+            lambda time_entries: RequestResult(True, "", 201, [ObjectId() for _ in time_entries])
+        self.time_entry_service.time_entry_repository = self.time_entry_repository
+
+    @staticmethod
+    def _work_entry(day: int, start_hour: int = 8, end_hour: int = 12):
+        return {"startTime": f"2024-06-{day:02d}T{start_hour:02d}:00:00Z",
+                "endTime": f"2024-06-{day:02d}T{end_hour:02d}:00:00Z", "breakTime": 0, "activity": "Import",
+                "activityType": "Projektarbeit", "projectName": "ImportTest"}
+
+    @staticmethod
+    def _vacation_entry(day: int, start_hour: int = 8, end_hour: int = 12):
+        return {"startTime": f"2024-06-{day:02d}T{start_hour:02d}:00:00Z",
+                "endTime": f"2024-06-{day:02d}T{end_hour:02d}:00:00Z", "entryType": "Vacation Entry"}
+
+    def test_import_time_entries(self):
+        """
+        Test that valid rows are inserted with one write and the balances and totals are updated once.
+        """
+        rows = [self._work_entry(3), self._work_entry(4), self._work_entry(5, 12, 8), self._work_entry(1),
+                self._work_entry(6, 9, 12), self._vacation_entry(7)]
+        result = self.time_entry_service.import_time_entries(rows, "testHiwi")
+        self.assertTrue(result.is_successful)
+        self.assertEqual("3 of 6 time entries imported", result.message)
+        self.assertEqual([True, False, False, False, True, True],
+                         [row_result["isSuccessful"] for row_result in result.data])
+        self.assertEqual(list(range(1, 7)), [row_result["row"] for row_result in result.data])
+        self.assertEqual("A time entry already exists for this day", result.data[1]["message"])
+        self.assertEqual("Start time must be earlier than end time.", result.data[2]["message"])
+        self.assertIn("_id", result.data[0]["data"])
+        self.timesheet_service.ensure_timesheet_exists.assert_called_once_with("testHiwi", 6, 2024)
+        self.time_entry_repository.get_time_entries_by_timesheet_ids.assert_called_once()
+        self.time_entry_repository.create_time_entries.assert_called_once()
+        self.assertEqual(3, len(self.time_entry_repository.create_time_entries.call_args.args[0]))
+        self.user_service.add_overtime_minutes.assert_called_once_with("testHiwi", 660)
+        self.user_service.remove_vacation_minutes.assert_called_once_with("testHiwi", 240)
+        self.timesheet_service.apply_time_entry_delta.assert_called_once_with(str(self.timesheet.timesheet_id),
+                                                                              660, 240)
+        self.timesheet_service.calculate_overtime.assert_called_once_with(str(self.timesheet.timesheet_id))
+
+    def test_import_time_entries_duplicate_rows(self):
+        """
+        Test that only the first of several rows of the same day is imported.
+        """
+        result = self.time_entry_service.import_time_entries([self._work_entry(3), self._work_entry(3, 13, 15)],
+                                                             "testHiwi")
+        self.assertEqual("1 of 2 time entries imported", result.message)
+        self.assertEqual(409, result.data[1]["statusCode"])
+
+    def test_import_time_entries_vacation_balance(self):
+        """
+        Test that the vacation entries of an import draw from the same vacation balance.
+        """
+        rows = [self._vacation_entry(10, 8, 14), self._vacation_entry(11, 8, 14)]
+        result = self.time_entry_service.import_time_entries(rows, "testHiwi")
+        self.assertTrue(result.data[0]["isSuccessful"])
+        self.assertEqual("Vacation time exceeds the remaining vacation time.", result.data[1]["message"])
+        self.user_service.remove_vacation_minutes.assert_called_once_with("testHiwi", 360)
+
+    def test_import_time_entries_submitted_timesheet(self):
+        """
+        Test that no entries are added to a submitted timesheet and nothing is updated.
+        """
+        self.timesheet.status = TimesheetStatus.WAITING_FOR_APPROVAL
+        result = self.time_entry_service.import_time_entries([self._work_entry(3)], "testHiwi")
+        self.assertEqual("Cannot add time entry to a submitted timesheet", result.data[0]["message"])
+        self.user_service.add_overtime_minutes.assert_not_called()
+        self.timesheet_service.calculate_overtime.assert_not_called()
+
+    def test_import_time_entries_future_month(self):
+        """
+        Test that the rows of a month whose timesheet cannot be created fail with the reason.
+        """
+        self.timesheet_service.ensure_timesheet_exists.return_value = RequestResult(
+            False, "Timesheet month and year cannot be in the future", 422)
+        result = self.time_entry_service.import_time_entries([self._work_entry(3), {"startTime": "invalid"}],
+                                                             "testHiwi")
+        self.assertEqual(422, result.data[0]["statusCode"])
+        self.assertEqual("Invalid datetime format in startTime.", result.data[1]["message"])
+
+    def test_import_time_entries_limit(self):
+        """
+        Test that imports with too many rows are rejected before anything is written.
+        """
+        rows = [self._work_entry(3)] * (TimeEntryService.MAX_IMPORT_ROWS + 1)
+        result = self.time_entry_service.import_time_entries(rows, "testHiwi")
+        self.assertEqual(413, result.status_code)
+        self.time_entry_repository.create_time_entries.assert_not_called()
+
+    def test_read_csv(self):
+        """
+        Test that CSV rows are read with numeric break times and without empty cells.
+        """
+        csv_data = ('\ufeffstartTime,endTime,breakTime,activity,entryType\r\n'
+                    '2024-06-03T08:00:00,2024-06-03T12:00:00,30,"Import, with comma",\r\n'
+                    '2024-06-04T08:00:00,2024-06-04T12:00:00,,,Vacation Entry\r\n')
+        rows = list(TimeEntryReader.read_csv(BytesIO(csv_data.encode('utf-8'))))
+        self.assertEqual([{"startTime": "2024-06-03T08:00:00", "endTime": "2024-06-03T12:00:00", "breakTime": 30,
+                           "activity": "Import, with comma"},
+                          {"startTime": "2024-06-04T08:00:00", "endTime": "2024-06-04T12:00:00",
+                           "entryType": "Vacation Entry"}], rows)
+
+    def test_read_invalid_csv(self):
+        """
+        Test that a CSV file that cannot be decoded or parsed rejects the import with the number of the row.
+        """
+        csv_data = (b'startTime,endTime\r\n2024-06-03T08:00:00,2024-06-03T12:00:00\r\n'
+                    b'2024-06-04T08:00:00,2024-06-04T12:00:\xff\r\n')
+        result = self.time_entry_service.import_time_entries(TimeEntryReader.read_csv(BytesIO(csv_data)), "testHiwi")
+        self.assertEqual(400, result.status_code)
+        self.assertEqual("Row 2 of the CSV file is not UTF-8 encoded", result.message)
+        csv_data = b'startTime,activity\r\n2024-06-03T08:00:00,' + b'a' * (csv.field_size_limit() + 1) + b'\r\n'
+        result = self.time_entry_service.import_time_entries(TimeEntryReader.read_csv(BytesIO(csv_data)), "testHiwi")
+        self.assertEqual(400, result.status_code)
+        self.assertTrue(result.message.startswith("Row 1 of the CSV file is invalid"))
+        self.time_entry_repository.create_time_entries.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from unittest import mock
+
+from bson import ObjectId
+
+from model.request_result import RequestResult
+from service.timesheet_service import TimesheetService
+
+
+class TestTimesheetReconcile(unittest.TestCase):
+    """
+    Tests the reconciliation of the stored totals without a database.
+    """
+
+    def setUp(self):
+        self.timesheet_service = TimesheetService(mock.Mock(), mock.Mock())
+        self.timesheet_service.timesheet_repository = mock.Mock()
+        self.timesheet_service.time_entry_repository = mock.Mock()
+        self.timesheet_service.time_entry_repository.get_time_entries_by_timesheet_id.return_value = []
+        self.timesheets_data = [{"_id": ObjectId(), "totalTime": 60, "vacationMinutes": 0} for _ in range(3)]
+        self.timesheet_service.timesheet_repository.get_timesheets.return_value = self.timesheets_data
+
+    def test_only_unchanged_totals_overwritten(self):
+        """
+        Test that the totals are overwritten only if they still have the values that were read.
+        """
+        self.timesheet_service.timesheet_repository.set_totals.return_value = RequestResult(True, "", 200)
+        result = self.timesheet_service.reconcile_total_and_vacation_time()
+        self.assertTrue(result.is_successful)
+        for timesheet_data, call in zip(self.timesheets_data,
+                                        self.timesheet_service.timesheet_repository.set_totals.call_args_list):
+            self.assertEqual((timesheet_data["_id"], 0, 0, 60, 0), call.args)
+            self.assertTrue(call.kwargs["check_expected"])
+
+    def test_failure_does_not_stop_sweep(self):
+        """
+        Test that a timesheet that was changed concurrently or could not be updated does not stop the sweep.
+        """
+        self.timesheet_service.timesheet_repository.set_totals.side_effect = [
+            RequestResult(False, "", 409), RequestResult(False, "", 500), RequestResult(True, "", 200)]
+        result = self.timesheet_service.reconcile_total_and_vacation_time()
+        self.assertEqual(3, self.timesheet_service.timesheet_repository.set_totals.call_count)
+        self.assertFalse(result.is_successful)
+        self.assertEqual(500, result.status_code)
+        self.assertEqual([str(self.timesheets_data[2]["_id"])], result.data)
+        self.assertIn(str(self.timesheets_data[1]["_id"]), result.message)
+        self.assertNotIn(str(self.timesheets_data[0]["_id"]), result.message)
+
+
+if __name__ == '__main__':
+    unittest.main()
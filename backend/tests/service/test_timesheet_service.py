@@ -200,6 +200,36 @@ class TestTimesheetService(unittest.TestCase):
         self.assertFalse(result_invalid_timesheet_id.is_successful)
         self.assertEqual(404, result_invalid_timesheet_id.status_code)
 
+    def test_apply_time_entry_delta(self):
+        """
+        Test the apply_time_entry_delta method of the TimesheetService class.
+        """
+        result = self.timesheet_service.apply_time_entry_delta(self.test_june_timesheet_data['_id'], 60, 30)
+        self.assertEqual("Total time updated", result.message)
+        self.assertTrue(result.is_successful)
+        june_timesheet_data = self.timesheet_repository.get_timesheet_by_id(self.test_june_timesheet_data['_id'])
+        self.assertEqual(1140, june_timesheet_data['totalTime'])
+        self.assertEqual(30, june_timesheet_data['vacationMinutes'])
+        result_invalid_timesheet_id = self.timesheet_service.apply_time_entry_delta("666666666666666666666666", 60)
+        self.assertEqual("Timesheet not found", result_invalid_timesheet_id.message)
+        self.assertEqual(404, result_invalid_timesheet_id.status_code)
+
+    def test_reconcile_total_and_vacation_time(self):
+        """
+        Test the reconcile_total_and_vacation_time method of the TimesheetService class.
+        """
+        june_timesheet_id = self.test_june_timesheet_data['_id']
+        result = self.timesheet_service.reconcile_total_and_vacation_time(june_timesheet_id)
+        self.assertTrue(result.is_successful)
+        self.assertEqual([], result.data)
+        self.db.timesheets.update_one({'_id': june_timesheet_id}, {'$set': {'totalTime': 5, 'vacationMinutes': 5}})
+        result = self.timesheet_service.reconcile_total_and_vacation_time(june_timesheet_id)
+        self.assertTrue(result.is_successful)
+        self.assertEqual([str(june_timesheet_id)], result.data)
+        june_timesheet_data = self.timesheet_repository.get_timesheet_by_id(june_timesheet_id)
+        self.assertEqual(1080, june_timesheet_data['totalTime'])
+        self.assertEqual(0, june_timesheet_data['vacationMinutes'])
+
     def test_sign_timesheet_invalid_id(self):
         """
         Test the sign_timesheet method of the TimesheetService class with an invalid timesheet ID.
@@ -259,6 +289,26 @@ class TestTimesheetService(unittest.TestCase):
                 result = self.timesheet_service.approve_timesheet(str(self.test_june_timesheet_data['_id']))
                 self.assertFalse(result.is_successful)
 
+    def test_approve_timesheets(self):
+        """
+        Test the approve_timesheets method of the TimesheetService class with eligible and ineligible timesheets.
+        """
+        with self.app.app_context():
+            token = self.auth_service.create_token('testSupervisorTimesheetService', 'Supervisor')
+            with self.app.test_request_context(headers={'Authorization': f'Bearer {token}'}):
+                self.db.timesheets.update_one({'_id': self.test_june_timesheet_data['_id']},
+                                              {'$set': {'status': 'Waiting for Approval'}})
+                june_id = str(self.test_june_timesheet_data['_id'])
+                may_id = str(self.test_may_timesheet_data['_id'])
+                result = self.timesheet_service.approve_timesheets([june_id, may_id, 'invalidId', {}, june_id])
+                self.assertTrue(result.is_successful)
+                self.assertEqual(200, result.data[june_id]['statusCode'])
+                self.assertEqual(409, result.data[may_id]['statusCode'])
+                self.assertEqual(400, result.data['invalidId']['statusCode'])
+                self.assertEqual(400, result.data['{}']['statusCode'])
+                timesheet = self.db.timesheets.find_one({'_id': self.test_june_timesheet_data['_id']})
+                self.assertEqual('Complete', timesheet['status'])
+
     def test_request_change(self):
         """
         Test the request_timesheet method of the TimesheetService class.
@@ -293,6 +343,29 @@ class TestTimesheetService(unittest.TestCase):
         self.assertEqual(-3720.0, result.data)
         self.assertEqual(200, result.status_code)
 
+    def test_calculate_overtime_updates_following_months(self):
+        """
+        Test that calculate_overtime carries the balance over to the following months in one pass.
+        """
+        self.db.timesheets.update_one({'_id': self.test_may_timesheet_data['_id']}, {'$set': {'overtime': 100}})
+        july_timesheet_data = {'username': 'testHiwiTimesheetService',
+                               'month': 7,
+                               'year': 2024,
+                               'status': 'Not Submitted',
+                               'totalTime': 4800.0,
+                               'overtime': 0.0,
+                               'lastSignatureChange': datetime.datetime(2024, 6, 24, 21, 22, 35, 855000),
+                               'vacationMinutes': 0.0}
+        self.db.timesheets.insert_one(july_timesheet_data)
+        result = self.timesheet_service.calculate_overtime(str(self.test_june_timesheet_data['_id']))
+        self.assertTrue(result.is_successful)
+        self.assertEqual(-3620.0, result.data)
+        self.assertEqual(-3620.0, self.timesheet_service.get_previous_overtime('testHiwiTimesheetService', 7, 2024))
+        july_timesheet = self.timesheet_repository.get_timesheet_by_id(july_timesheet_data['_id'])
+        self.assertEqual(-3620.0, july_timesheet['overtime'])
+        may_timesheet = self.timesheet_repository.get_timesheet_by_id(self.test_may_timesheet_data['_id'])
+        self.assertEqual(100, may_timesheet['overtime'])
+
     def test_calculate_overtime_invalid_id(self):
         """
         Test the calculate_overtime method of the TimesheetService class with an invalid timesheet ID.
@@ -0,0 +1,68 @@
+import os
+import unittest
+from unittest import mock
+
+import db
+from db import initialize_db, get_client, get_client_options, get_pool_stats
+from model.repository.time_entry_repository import TimeEntryRepository
+from model.repository.timesheet_repository import TimesheetRepository
+from model.repository.user_repository import UserRepository
+
+
+class TestDb(unittest.TestCase):
+
+    def test_initialize_db_returns_shared_database(self):
+        """
+        Test that repeated calls of initialize_db share one client and database handle.
+        """
+        self.assertIs(initialize_db(), initialize_db())
+        self.assertIs(initialize_db().client, get_client())
+
+    def test_repositories_share_client(self):
+        """
+        Test that all repositories use the process-wide client.
+        """
+        shared_client = get_client()
+        self.assertIs(UserRepository.get_instance().db.client, shared_client)
+        self.assertIs(TimesheetRepository.get_instance().db.client, shared_client)
+        self.assertIs(TimeEntryRepository.get_instance().db.client, shared_client)
+
+    def test_client_is_recreated_in_forked_process(self):
+        """
+        Test that a new client is created if the process id changed, e.g. in a forked worker.
+        """
+        parent_client = get_client()
+        with mock.patch('db.os.getpid', return_value=db._client_pid + 1):
+            child_client = get_client()
+            self.assertIsNot(parent_client, child_client)
+            self.assertIs(initialize_db().client, child_client)
+        child_client.close()
+        db.client = None
+        initialize_db()
+
+    def test_get_client_options_from_environment(self):
+        """
+        Test that the pool settings are read from the environment.
+        """
+        environment = {'DB_MAX_POOL_SIZE': '10', 'DB_MIN_POOL_SIZE': '2', 'DB_MAX_IDLE_TIME_MS': '1000',
+                       'DB_SERVER_SELECTION_TIMEOUT_MS': '2000'}
+        with mock.patch.dict(os.environ, environment):
+            options = get_client_options()
+        self.assertEqual({'maxPoolSize': 10, 'minPoolSize': 2, 'maxIdleTimeMS': 1000,
+                          'serverSelectionTimeoutMS': 2000}, options)
+
+    def test_get_pool_stats(self):
+        """
+        Test that the pool statistics contain the configuration and the connection counters.
+        """
+        initialize_db().command('ping')
+        stats = get_pool_stats()
+        self.assertTrue(stats['clientInitialized'])
+        self.assertEqual(os.getpid(), stats['pid'])
+        self.assertGreaterEqual(stats['connectionsCreated'], 1)
+        self.assertEqual(stats['connectionsCreated'] - stats['connectionsClosed'], stats['openConnections'])
+        self.assertIn('maxPoolSize', stats)
+
+
+if __name__ == '__main__':
+    unittest.main()
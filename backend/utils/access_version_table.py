@@ -0,0 +1,63 @@
+import threading
+
+from model.user.role import UserRole
+
+
+class AccessVersionTable:
+    """
+    In-memory table of the access state of users whose account changed while the worker process is running.
+
+    Every access token carries the role of the user and the access version at the time it was issued. As long as
+    the version of the token is the current version of the user, the role claim of the signed token can be trusted
+    and no database read is required to authorize a request. Whenever a user is created, updated or deleted, the
+    version is incremented and the current role is recorded, so tokens issued before the change are authorized with
+    the recorded state instead and a deletion revokes them immediately.
+
+    The table does not need to be persisted: the JWT secret is generated on startup, so tokens issued by an earlier
+    process are rejected anyway. The table is local to a worker process.
+    """
+
+    _lock = threading.Lock()
+    _versions = {}
+    _roles = {}
+
+    @staticmethod
+    def get_version(username: str) -> int:
+        """
+        Returns the current access version of a user.
+
+        :param username: The username of the user.
+        :return: The access version, 0 if the user did not change since startup.
+        """
+        return AccessVersionTable._versions.get(username, 0)
+
+    @staticmethod
+    def record_change(username: str, role: UserRole = None):
+        """
+        Records a change of a user account and invalidates the claims of all tokens issued before.
+
+        :param username: The username of the changed user.
+        :param role: The current role of the user, or None if the user was deleted.
+        """
+        with AccessVersionTable._lock:
+            AccessVersionTable._versions[username] = AccessVersionTable._versions.get(username, 0) + 1
+            AccessVersionTable._roles[username] = role
+
+    @staticmethod
+    def resolve_role(username: str, role_claim: str, version_claim: int):
+        """
+        Determines the current role of a user from the claims of the access token.
+
+        :param username: The username of the token identity.
+        :param role_claim: The role stored in the token.
+        :param version_claim: The access version stored in the token.
+        :return: A tuple (known, role). If known is False, the table cannot decide and the role has to be read
+                 from the database. Otherwise, role is the current role, or None if the user was deleted.
+        """
+        with AccessVersionTable._lock:
+            current_version = AccessVersionTable._versions.get(username, 0)
+            if version_claim == current_version and role_claim is not None:
+                return True, UserRole.get_role_by_value(role_claim)
+            if username in AccessVersionTable._roles:
+                return True, AccessVersionTable._roles[username]
+        return False, None
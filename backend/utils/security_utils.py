@@ -1,10 +1,14 @@
+import os
+import stat
+
 import bcrypt
 
 
 class SecurityUtils:
     """
     Provides static methods for common security operations such as password
-    hashing and password verification using bcrypt.
+    hashing and password verification using bcrypt, and for storing files only the
+    application can read.
     """
 
     @staticmethod
@@ -35,3 +39,39 @@ class SecurityUtils:
         :rtype: bool
         """
         return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+    @staticmethod
+    def ensure_private_directory(path: str) -> str:
+        """
+        Creates a directory only the user running the application can access, or checks an existing one.
+
+        An existing directory is only used if it is no symbolic link and owned by the user running the application,
+        as a directory created by another user, e.g. in the shared temporary directory, could be read or replaced
+        by that user. Its permissions are then restricted to the owner.
+
+        :param str path: The path of the directory.
+        :return: The path of the directory.
+        :rtype: str
+        :raises PermissionError: If the path is a symbolic link, no directory or owned by another user.
+        """
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        directory_stat = os.lstat(path)
+        if not stat.S_ISDIR(directory_stat.st_mode):
+            raise PermissionError(f"{path} is not a directory")
+        if hasattr(os, 'getuid') and directory_stat.st_uid != os.getuid():
+            raise PermissionError(f"{path} is owned by another user")
+        if stat.S_IMODE(directory_stat.st_mode) != 0o700:
+            os.chmod(path, 0o700)
+        return path
+
+    @staticmethod
+    def open_private_file(path: str):
+        """
+        Creates a new file only the user running the application can read and opens it for writing.
+
+        :param str path: The path of the file. The file must not exist yet.
+        :return: The file opened for writing in binary mode.
+        :raises FileExistsError: If the file already exists.
+        """
+        return os.fdopen(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o600),
+                         'wb')
@@ -0,0 +1,158 @@
+import csv
+import io
+import re
+from xml.sax.saxutils import escape
+from zipfile import ZipFile, ZIP_DEFLATED
+
+from utils.zip_stream import ZipStream
+
+
+class TableStream:
+    """
+    Writes tables as a sequence of byte chunks, so a response can start sending the table while later rows are
+    still being read and only a batch of rows is held in memory at a time. Tables are written as CSV or as XLSX
+    workbooks with a single sheet.
+    """
+
+    # Number of rows collected before a chunk is handed out
+    BATCH_ROWS = 500
+
+    _CONTENT_TYPES = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>')
+    _RELATIONSHIPS = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>')
+    _WORKBOOK = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="{sheet_name}" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>')
+    _WORKBOOK_RELATIONSHIPS = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+        'Target="styles.xml"/>'
+        '</Relationships>')
+    _STYLES = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+        '</styleSheet>')
+    _SHEET_START = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>')
+    _SHEET_END = '</sheetData></worksheet>'
+    # Characters that are not allowed in XML documents
+    _INVALID_XML_CHARACTERS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+    @staticmethod
+    def stream_csv(header: list, rows):
+        """
+        Streams a table as UTF-8 encoded CSV file. The file starts with a byte order mark, so spreadsheet
+        applications detect the encoding.
+
+        :param header: The column names.
+        :param rows: An iterable of rows, each a list of values. It is consumed lazily, batch by batch.
+        :return: A generator yielding the CSV file in chunks.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        buffer.write('\ufeff')
+        writer.writerow(header)
+        # The header is sent right away, so the download starts before the first rows are read
+        yield TableStream._pop_text(buffer)
+        for row_number, row in enumerate(rows, 1):
+            writer.writerow([TableStream._to_csv_value(value) for value in row])
+            if row_number % TableStream.BATCH_ROWS == 0:
+                yield TableStream._pop_text(buffer)
+        yield TableStream._pop_text(buffer)
+
+    @staticmethod
+    def stream_xlsx(header: list, rows, sheet_name: str = "Export"):
+        """
+        Streams a table as XLSX workbook. The rows are written into the compressed sheet as they are read,
+        so the memory usage does not depend on the number of rows.
+
+        :param header: The column names.
+        :param rows: An iterable of rows, each a list of values. It is consumed lazily, batch by batch.
+        :param sheet_name: The name of the sheet.
+        :return: A generator yielding the XLSX workbook in chunks.
+        """
+        buffer = ZipStream()
+        with ZipFile(buffer, 'w', compression=ZIP_DEFLATED) as zip_file:
+            zip_file.writestr('[Content_Types].xml', TableStream._CONTENT_TYPES)
+            zip_file.writestr('_rels/.rels', TableStream._RELATIONSHIPS)
+            zip_file.writestr('xl/workbook.xml', TableStream._WORKBOOK.format(
+                sheet_name=escape(sheet_name, {'"': '&quot;'})))
+            zip_file.writestr('xl/_rels/workbook.xml.rels', TableStream._WORKBOOK_RELATIONSHIPS)
+            zip_file.writestr('xl/styles.xml', TableStream._STYLES)
+            with zip_file.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+                sheet.write(TableStream._SHEET_START.encode('utf-8'))
+                sheet.write(TableStream._to_xlsx_row(1, header))
+                yield buffer.pop()
+                for row_number, row in enumerate(rows, 2):
+                    sheet.write(TableStream._to_xlsx_row(row_number, row))
+                    if row_number % TableStream.BATCH_ROWS == 0:
+                        yield buffer.pop()
+                sheet.write(TableStream._SHEET_END.encode('utf-8'))
+        yield buffer.pop()
+
+    @staticmethod
+    def _pop_text(buffer: io.StringIO) -> bytes:
+        """
+        Returns the text written since the last call as UTF-8 and clears the buffer.
+        """
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return text.encode('utf-8')
+
+    @staticmethod
+    def _to_csv_value(value):
+        """
+        Converts a value for a CSV file. Text starting like a formula is prefixed with an apostrophe,
+        so spreadsheet applications do not evaluate user input.
+        """
+        if isinstance(value, str) and value.startswith(('=', '+', '-', '@', '\t', '\r')):
+            return f"'{value}"
+        return value
+
+    @staticmethod
+    def _to_xlsx_row(row_number: int, row: list) -> bytes:
+        """
+        Converts a row to the XML of a sheet. Numbers are written as numeric cells, all other values as text.
+        """
+        cells = []
+        for value in row:
+            if value is None:
+                cells.append('<c/>')
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                cells.append(f'<c><v>{value}</v></c>')
+            else:
+                text = escape(TableStream._INVALID_XML_CHARACTERS.sub('', str(value)))
+                cells.append(f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+        return f'<row r="{row_number}">{"".join(cells)}</row>'.encode('utf-8')
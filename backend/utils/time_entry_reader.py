@@ -0,0 +1,66 @@
+import csv
+
+
+class TimeEntryReader:
+    """
+    Reads time entries that were tracked in another tool from an uploaded CSV file. The file is decoded and parsed
+    line by line while it is read, so the rows are handed out one by one without holding the whole upload in memory.
+
+    The columns are named like the fields of the time entries, e.g. startTime, endTime, breakTime, activity,
+    projectName, activityType and entryType.
+    """
+
+    # Columns holding a number of minutes
+    INTEGER_FIELDS = ("breakTime",)
+
+    @staticmethod
+    def read_csv(stream):
+        """
+        Reads the rows of a CSV file. Empty cells are left out, so a vacation entry in a file that also contains
+        work entries does not get the fields of a work entry.
+
+        :param stream: A binary stream of the UTF-8 encoded CSV file, with or without byte order mark.
+        :return: A generator yielding a dictionary for every row. It raises a ValueError naming the row if the file
+                 is not UTF-8 encoded or no valid CSV file.
+        """
+        row_number = 1
+        try:
+            for row in csv.DictReader(TimeEntryReader._decode_lines(stream)):
+                yield TimeEntryReader._to_entry_data(row)
+                row_number += 1
+        except UnicodeDecodeError:
+            raise ValueError(f"Row {row_number} of the CSV file is not UTF-8 encoded") from None
+        except csv.Error as e:
+            raise ValueError(f"Row {row_number} of the CSV file is invalid: {e}") from None
+
+    @staticmethod
+    def _decode_lines(stream):
+        """
+        Decodes the lines of a binary stream one by one, so a decoding error is raised when the row containing it
+        is read. The line endings are kept for the CSV reader, and a byte order mark is removed.
+        """
+        encoding = 'utf-8-sig'
+        for line in stream:
+            yield line.decode(encoding)
+            encoding = 'utf-8'
+
+    @staticmethod
+    def _to_entry_data(row: dict) -> dict:
+        """
+        Converts a CSV row to time entry data, stripping the cells and converting the numeric fields.
+        Cells that are no valid number are kept as text and rejected by the validation.
+        """
+        entry_data = {}
+        for field, value in row.items():
+            if field is None or value is None:
+                continue
+            value = value.strip()
+            if not value:
+                continue
+            if field in TimeEntryReader.INTEGER_FIELDS:
+                try:
+                    value = int(value)
+                except ValueError:
+                    pass
+            entry_data[field.strip()] = value
+        return entry_data
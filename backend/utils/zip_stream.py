@@ -0,0 +1,57 @@
+from datetime import datetime
+from zipfile import ZipFile, ZipInfo
+
+
+class ZipStream:
+    """
+    Writes a zip archive as a sequence of byte chunks instead of a complete file. Every entry is handed out
+    as soon as it has been added, so a response can start sending the archive while later entries are still
+    being generated and only one entry is held in memory at a time.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty buffer. The zip file writes into it as into an unseekable file.
+        """
+        self._chunks = []
+
+    def write(self, data: bytes) -> int:
+        """
+        Collects data written by the zip file.
+
+        :param data: The written data.
+        :return: The number of bytes written.
+        """
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def pop(self) -> bytes:
+        """
+        Returns the data written since the last call and clears the buffer.
+
+        :return: The written data.
+        """
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+    @staticmethod
+    def stream(documents):
+        """
+        Streams a zip archive of the given documents.
+
+        :param documents: An iterable of streams with a name attribute, e.g. named BytesIO objects.
+                          It is consumed lazily, entry by entry.
+        :return: A generator yielding the zip archive in chunks.
+        """
+        buffer = ZipStream()
+        # All entries share one timestamp, so the archive only depends on the documents and their order
+        date_time = datetime.now().timetuple()[:6]
+        with ZipFile(buffer, 'w') as zip_file:
+            for document in documents:
+                zip_file.writestr(ZipInfo(document.name, date_time=date_time), document.getvalue())
+                yield buffer.pop()
+        yield buffer.pop()